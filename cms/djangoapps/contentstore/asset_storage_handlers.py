@@ -33,9 +33,11 @@ from xmodule.exceptions import NotFoundError  # lint-amnesty, pylint: disable=wr
 from xmodule.modulestore.django import modulestore  # lint-amnesty, pylint: disable=wrong-import-order
 from xmodule.modulestore.exceptions import ItemNotFoundError  # lint-amnesty, pylint: disable=wrong-import-order
 
+from .asset_usage import get_asset_usage_map
 from .exceptions import AssetNotFoundException, AssetSizeTooLargeException
+from .tasks import schedule_asset_thumbnails
 from .utils import reverse_course_url, get_files_uploads_url, get_response_format, request_response_format_is_json
-from .toggles import use_new_files_uploads_page
+from .toggles import use_async_asset_thumbnails, use_new_files_uploads_page
 
 
 REQUEST_DEFAULTS = {
@@ -109,61 +111,11 @@ def _get_asset_usage_path(course_key, assets):
     """
     Get a list of units with ancestors that use given asset.
     """
-    store = modulestore()
-    usage_locations = {str(asset['asset_key']): [] for asset in assets}
-    verticals = store.get_items(
-        course_key,
-        qualifiers={
-            'category': 'vertical'
-        },
-    )
-    blocks = []
-
-    for vertical in verticals:
-        blocks.extend(vertical.get_children())
-
-    for block in blocks:
-        for asset in assets:
-            asset_key = asset['asset_key']
-            asset_key_string = str(asset_key)
-            static_path = StaticContent.get_static_path_from_location(asset_key)
-            is_video_block = getattr(block, 'category', '') == 'video'
-            try:
-                if is_video_block:
-                    handout = getattr(block, 'handout', '')
-                    if handout and asset_key_string in handout:
-                        usage_dict = {'display_location': '', 'url': ''}
-                        xblock_display_name = getattr(block, 'display_name', '')
-                        xblock_location = str(block.location)
-                        unit = block.get_parent()
-                        unit_location = str(block.parent)
-                        unit_display_name = getattr(unit, 'display_name', '')
-                        subsection = unit.get_parent()
-                        subsection_display_name = getattr(subsection, 'display_name', '')
-                        current_locations = usage_locations[asset_key_string]
-                        usage_dict['display_location'] = (f'{subsection_display_name} - '
-                                                          f'{unit_display_name} / {xblock_display_name}')
-                        usage_dict['url'] = f'/container/{unit_location}#{xblock_location}'
-                        usage_locations[asset_key_string] = [*current_locations, usage_dict]
-                else:
-                    data = getattr(block, 'data', '')
-                    if static_path in data or asset_key_string in data:
-                        usage_dict = {'display_location': '', 'url': ''}
-                        xblock_display_name = getattr(block, 'display_name', '')
-                        xblock_location = str(block.location)
-                        unit = block.get_parent()
-                        unit_location = str(block.parent)
-                        unit_display_name = getattr(unit, 'display_name', '')
-                        subsection = unit.get_parent()
-                        subsection_display_name = getattr(subsection, 'display_name', '')
-                        current_locations = usage_locations[asset_key_string]
-                        usage_dict['display_location'] = (f'{subsection_display_name} - '
-                                                          f'{unit_display_name} / {xblock_display_name}')
-                        usage_dict['url'] = f'/container/{unit_location}#{xblock_location}'
-                        usage_locations[asset_key_string] = [*current_locations, usage_dict]
-            except AttributeError:
-                continue
-    return usage_locations
+    usage_map = get_asset_usage_map(course_key)
+    return {
+        str(asset['asset_key']): usage_map.get(str(asset['asset_key']), [])
+        for asset in assets
+    }
 
 
 def _asset_index(request, course_key):
@@ -228,14 +180,14 @@ def _assets_json(request, course_key):
 
     assets, total_count = _get_assets_for_page(course_key, query_options)
 
-    assets_usage_locations_map = _get_asset_usage_path(course_key, assets)
-
     if request_options['requested_page'] > 0 and first_asset_to_display_index >= total_count and total_count > 0:  # lint-amnesty, pylint: disable=chained-comparison
         _update_options_to_requery_final_page(query_options, total_count)
         current_page = query_options['current_page']
         first_asset_to_display_index = _get_first_asset_index(current_page, requested_page_size)
         assets, total_count = _get_assets_for_page(course_key, query_options)
 
+    assets_usage_locations_map = _get_asset_usage_path(course_key, assets)
+
     last_asset_to_display_index = first_asset_to_display_index + len(assets)
     assets_in_json_format = _get_assets_in_json_format(assets, course_key, assets_usage_locations_map)
 
@@ -494,6 +446,16 @@ def update_course_run_asset(course_key, upload_file):
 
     content, temporary_file_path = _get_file_content_and_path(file_metadata, course_key)
 
+    if use_async_asset_thumbnails(course_key) and _is_image(content):
+        # Don't decode the image during the request: save it now, and let a
+        # background task generate its thumbnail along with those of the other
+        # images being uploaded.
+        contentstore().save(content)
+        contentstore().set_attr(content.location, 'thumbnail_pending', True)
+        del_cached_content(content.location)
+        schedule_asset_thumbnails(course_key)
+        return content
+
     (thumbnail_content, thumbnail_location) = contentstore().generate_thumbnail(content,
                                                                                 tempfile_path=temporary_file_path)
 
@@ -620,6 +582,11 @@ def _get_file_content_and_path(file_metadata, course_key):
     return content, temporary_file_path
 
 
+def _is_image(content):
+    """returns whether a thumbnail can be generated for the content"""
+    return content.content_type is not None and content.content_type.split('/')[0] == 'image'
+
+
 def _check_thumbnail_uploaded(thumbnail_content):
     """returns whether thumbnail is None"""
     return thumbnail_content is not None
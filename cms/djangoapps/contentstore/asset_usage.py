@@ -0,0 +1,167 @@
+"""
+Where the static assets of a course are used.
+
+Finding the blocks which use an asset means reading the content of every
+component of the course, which is far too slow to do for each page of the
+Studio Files page. Instead the references to assets are extracted from the
+course content once per version of the course and cached, as a map from each
+referenced asset to the places it is used.
+"""
+import re
+
+from django.core.cache import cache
+from opaque_keys import InvalidKeyError
+
+from xmodule.modulestore.django import modulestore
+
+# A new version of the course content gets a new map, so old ones only need to
+# live as long as someone may still be looking at them.
+ASSET_USAGE_CACHE_TIMEOUT = 60 * 60 * 24
+
+# "/static/<name>" links, which are rewritten to the course's assets at render time.
+STATIC_REFERENCE_RE = re.compile(r'/static/([^\s"\'?#<>\\]+)')
+# Links using the key of the asset itself.
+ASSET_KEY_REFERENCE_RE = re.compile(r'asset-v1:[^\s"\'?#<>\\/]+')
+
+
+def _cache_key(course_key, version):
+    return f'contentstore.asset_usage.{course_key}.{version}'
+
+
+def get_asset_usage_map(course_key):
+    """
+    Return a dict mapping the string key of each asset used in the course to
+    the list of places where it is used.
+
+    Each place is a dict with the `display_location` ("subsection - unit / component")
+    and the Studio `url` of the component using the asset. Assets which aren't
+    used are absent from the map.
+    """
+    store = modulestore()
+    course = store.get_course(course_key, depth=0)
+    version = getattr(course, 'course_version', None)
+    if version is not None:
+        usage_map = cache.get(_cache_key(course_key, version))
+        if usage_map is not None:
+            return usage_map
+
+    usage_map = _build_asset_usage_map(store, course_key)
+    if version is not None:
+        cache.set(_cache_key(course_key, version), usage_map, ASSET_USAGE_CACHE_TIMEOUT)
+    return usage_map
+
+
+def _build_asset_usage_map(store, course_key):
+    """
+    Read the components of the course and collect the assets each one refers to.
+    """
+    try:
+        field_values = store.get_block_field_values(course_key, ['display_name', 'children', 'data', 'handout'])
+    except NotImplementedError:
+        return _build_asset_usage_map_from_blocks(store, course_key)
+
+    parents = {}
+    for usage_key, values in field_values.items():
+        for child_key in values.get('children', []):
+            parents.setdefault(child_key, usage_key)
+
+    def display_name(usage_key):
+        return field_values.get(usage_key, {}).get('display_name', '')
+
+    usage_map = {}
+    for unit_key, unit_values in field_values.items():
+        if unit_key.block_type != 'vertical':
+            continue
+        for block_key in unit_values.get('children', []):
+            values = field_values.get(block_key)
+            if values is None:
+                continue
+            asset_key_strings = _get_referenced_asset_keys(
+                course_key, block_key.block_type, values.get('data', ''), values.get('handout', ''),
+            )
+            if not asset_key_strings:
+                continue
+            usage_dict = _get_usage_dict(
+                display_name(parents.get(unit_key)), display_name(unit_key), unit_key,
+                values.get('display_name', ''), block_key,
+            )
+            for asset_key_string in asset_key_strings:
+                usage_map.setdefault(asset_key_string, []).append(usage_dict)
+    return usage_map
+
+
+def _build_asset_usage_map_from_blocks(store, course_key):
+    """
+    Like _build_asset_usage_map, for modulestores which can only read fields from the blocks.
+    """
+    usage_map = {}
+    verticals = store.get_items(
+        course_key,
+        qualifiers={
+            'category': 'vertical'
+        },
+    )
+    for vertical in verticals:
+        for block in vertical.get_children():
+            try:
+                asset_key_strings = _get_referenced_asset_keys(
+                    course_key, getattr(block, 'category', ''), getattr(block, 'data', ''),
+                    getattr(block, 'handout', ''),
+                )
+                if not asset_key_strings:
+                    continue
+                unit = block.get_parent()
+                subsection = unit.get_parent()
+                usage_dict = _get_usage_dict(
+                    getattr(subsection, 'display_name', ''), getattr(unit, 'display_name', ''), block.parent,
+                    getattr(block, 'display_name', ''), block.location,
+                )
+            except AttributeError:
+                continue
+            for asset_key_string in asset_key_strings:
+                usage_map.setdefault(asset_key_string, []).append(usage_dict)
+    return usage_map
+
+
+def _get_referenced_asset_keys(course_key, block_type, data, handout):
+    """
+    Return the string keys of the assets a component refers to, in order of first reference.
+    """
+    if block_type == 'video':
+        # Only the handout of a video is an asset, and it's always linked by its key.
+        handout = handout or ''
+        return list(dict.fromkeys(
+            _strip_closing_paren(asset_key_string) for asset_key_string in ASSET_KEY_REFERENCE_RE.findall(handout)
+        ))
+
+    if not isinstance(data, str):
+        return []
+    asset_key_strings = {}
+    for name in STATIC_REFERENCE_RE.findall(data):
+        try:
+            asset_key_strings[str(course_key.make_asset_key('asset', _strip_closing_paren(name)))] = None
+        except InvalidKeyError:
+            continue
+    for asset_key_string in ASSET_KEY_REFERENCE_RE.findall(data):
+        asset_key_strings[_strip_closing_paren(asset_key_string)] = None
+    return list(asset_key_strings)
+
+
+def _strip_closing_paren(reference):
+    """
+    Drop the parenthesis closing e.g. a CSS url() from a reference, keeping those
+    which are part of the asset name.
+    """
+    if reference.endswith(')') and '(' not in reference:
+        return reference[:-1]
+    return reference
+
+
+def _get_usage_dict(subsection_display_name, unit_display_name, unit_location, xblock_display_name, xblock_location):
+    """
+    Describe where a component is, for listing it as a place where an asset is used.
+    """
+    return {
+        'display_location': f'{subsection_display_name} - {unit_display_name} / {xblock_display_name}',
+        'url': f'/container/{unit_location}#{xblock_location}',
+    }
@@ -3,9 +3,11 @@
 import logging
 import re
 from abc import ABCMeta, abstractmethod
+from collections import namedtuple
 from datetime import timedelta
 
 from django.conf import settings
+from django.core.cache import cache
 from django.urls import resolve
 from django.utils.translation import gettext as _
 from django.utils.translation import gettext_lazy
@@ -13,11 +15,13 @@ from eventtracking import tracker
 from search.search_engine_base import SearchEngine
 
 from cms.djangoapps.contentstore.course_group_config import GroupConfiguration
+from cms.djangoapps.contentstore.publish_changes import get_publish_change_set
 from common.djangoapps.course_modes.models import CourseMode
 from openedx.core.lib.courses import course_image_url, course_organization_image_url
 from xmodule.annotator_mixin import html_to_text  # lint-amnesty, pylint: disable=wrong-import-order
 from xmodule.library_tools import normalize_key_for_search  # lint-amnesty, pylint: disable=wrong-import-order
 from xmodule.modulestore import ModuleStoreEnum  # lint-amnesty, pylint: disable=wrong-import-order
+from xmodule.modulestore.inheritance import InheritanceMixin  # lint-amnesty, pylint: disable=wrong-import-order
 
 # REINDEX_AGE is the default amount of time that we look back for changes
 # that might have happened. If we are provided with a time at which the
@@ -60,6 +64,17 @@ class SearchIndexingError(Exception):
         self.error_list = error_list
 
 
+# The items to update in an index, rather than reindexing a whole structure:
+# updated - locations of the items added or changed, which are reindexed
+# subtrees - locations of the items which are reindexed along with all of their descendants
+# removed - locations of the items which are removed from the index
+IndexChanges = namedtuple('IndexChanges', ['updated', 'subtrees', 'removed'])
+
+# The fields whose change is indexed in the descendants of an item as well: the inherited
+# fields, and the display name and children, which make up the location path of the descendants.
+SUBTREE_INDEX_FIELDS = frozenset(InheritanceMixin.fields.keys()) | {'display_name', 'children'}
+
+
 class SearchIndexerBase(metaclass=ABCMeta):
     """
     Base class to perform indexing for courseware or library search from different modulestores
@@ -114,7 +129,19 @@ class SearchIndexerBase(metaclass=ABCMeta):
         searcher.remove(result_ids)
 
     @classmethod
-    def index(cls, modulestore, structure_key, triggered_at=None, reindex_age=REINDEX_AGE, timeout=INDEXING_REQUEST_TIMEOUT):  # lint-amnesty, pylint: disable=line-too-long, too-many-statements
+    def remove_items(cls, modulestore, searcher, removed_items):
+        """
+        remove the given items from the search index, unless they are (back) in the published structure
+        """
+        result_ids = [
+            str(cls._id_modifier(location)) for location in removed_items
+            if not modulestore.has_item(location)
+        ]
+        if result_ids:
+            searcher.remove(result_ids)
+
+    @classmethod
+    def index(cls, modulestore, structure_key, triggered_at=None, reindex_age=REINDEX_AGE, timeout=INDEXING_REQUEST_TIMEOUT, changes=None):  # lint-amnesty, pylint: disable=line-too-long, too-many-statements
         """
         Process course for indexing
 
@@ -130,6 +157,10 @@ class SearchIndexerBase(metaclass=ABCMeta):
             which items may need to be removed from the index
             If None, then a full reindex takes place
 
+        changes (IndexChanges) - the items known to have changed; when provided, only
+            those items (and their ancestors, to reach them) are walked, only they are
+            reindexed and only the removed items are taken out of the index
+
         Returns:
         Number of items that have been added to the index
         """
@@ -157,13 +188,17 @@ class SearchIndexerBase(metaclass=ABCMeta):
         # instead of per item index API call.
         items_index = []
 
+        # changed_paths is the set of the changed items and all of their ancestors,
+        # when only the given changes are being indexed.
+        changed_paths = set()
+
         def get_item_location(item):
             """
             Gets the version agnostic item location
             """
             return item.location.version_agnostic().replace(branch=None)
 
-        def prepare_item_index(item, skip_index=False, groups_usage_info=None):
+        def prepare_item_index(item, skip_index=False, groups_usage_info=None, index_subtree=False):
             """
             Add this item to the items_index and indexed_items list
 
@@ -175,9 +210,21 @@ class SearchIndexerBase(metaclass=ABCMeta):
                 This should really only be passed from the recursive child calls when
                 this method has determined that it is safe to do so
 
+            index_subtree - when indexing `changes`, reindex this item and all of its
+                descendants, whether or not they changed themselves
+
             Returns:
             item_content_groups - content groups assigned to indexed item
             """
+            skip_item_index = skip_index
+            if changes is not None:
+                item_location = get_item_location(item)
+                index_subtree = index_subtree or item_location in changes.subtrees
+                if not index_subtree and item_location not in changes.updated:
+                    skip_item_index = True
+                    if not item.has_children:
+                        return
+
             item_index_dictionary = item.index_dictionary()
             # if it's not indexable and it does not have children, then ignore
             if not item_index_dictionary and not item.has_children:
@@ -213,18 +260,22 @@ class SearchIndexerBase(metaclass=ABCMeta):
                     (triggered_at is not None and (triggered_at - item.subtree_edited_on) > reindex_age)
                 children_groups_usage = []
                 for child_item in item.get_children():
+                    if changes is not None and not index_subtree and get_item_location(child_item) not in changed_paths:
+                        # Nothing below this child changed.
+                        continue
                     if modulestore.has_published_version(child_item):
                         children_groups_usage.append(
                             prepare_item_index(
                                 child_item,
                                 skip_index=skip_child_index,
-                                groups_usage_info=groups_usage_info
+                                groups_usage_info=groups_usage_info,
+                                index_subtree=index_subtree,
                             )
                         )
                 if None in children_groups_usage:
                     item_content_groups = None
 
-            if skip_index or not item_index_dictionary:
+            if skip_item_index or not item_index_dictionary:
                 return
 
             item_index = {}
@@ -253,12 +304,23 @@ class SearchIndexerBase(metaclass=ABCMeta):
                 # First perform any additional indexing from the structure object
                 cls.supplemental_index_information(modulestore, structure)
 
+                if changes is not None:
+                    # Only the changed items, and their ancestors to reach them, need walking
+                    for location in changes.updated | changes.subtrees:
+                        while location is not None and location not in changed_paths:
+                            changed_paths.add(location)
+                            location = modulestore.get_parent_location(location)
+
                 # Now index the content
                 for item in structure.get_children():
-                    prepare_item_index(item, groups_usage_info=groups_usage_info)
+                    if changes is None or get_item_location(item) in changed_paths:
+                        prepare_item_index(item, groups_usage_info=groups_usage_info)
                 if items_index:
                     searcher.index(items_index, request_timeout=timeout)
-                cls.remove_deleted_items(searcher, structure_key, indexed_items)
+                if changes is None:
+                    cls.remove_deleted_items(searcher, structure_key, indexed_items)
+                else:
+                    cls.remove_items(modulestore, searcher, changes.removed)
         except Exception as err:  # pylint: disable=broad-except
             # broad exception so that index operation does not prevent the rest of the application from working
             log.exception(
@@ -391,6 +453,56 @@ class CoursewareSearchIndexer(SearchIndexerBase):
             )
         return indexed_count
 
+    @classmethod
+    def _indexed_version_cache_key(cls, course_key):
+        return f'{cls.INDEX_NAME}.indexed_version.{course_key}'
+
+    @classmethod
+    def index_published_changes(cls, modulestore, course_key, published_version, triggered_at=None):
+        """
+        Update the index of a course for a publish, from what the published structure
+        changed since the version which was last indexed: added and changed blocks are
+        reindexed (with all their descendants, if a field in SUBTREE_INDEX_FIELDS
+        changed) and removed blocks are removed from the index.
+
+        A block moved to another parent isn't changed itself, but the children of its
+        new parent are, so it is reindexed with the subtree of its new parent.
+
+        Falls back to `index` when the last indexed version isn't known, the changes
+        from it can't be worked out, or they apply to the whole course.
+        """
+        indexed_version_key = cls._indexed_version_cache_key(course_key)
+        indexed_version = cache.get(indexed_version_key)
+        change_set = None
+        if indexed_version is not None:
+            change_set = get_publish_change_set(course_key, version=published_version, from_version=indexed_version)
+
+        if change_set is not None:
+            # The children of the course can only be reordered or added, which leaves the
+            # location path of the other chapters as it was.
+            course_location = modulestore.make_course_usage_key(change_set.course_key)
+            course_fields = change_set.changed_fields.get(course_location, frozenset()) - {'children'}
+            if not course_fields.isdisjoint(SUBTREE_INDEX_FIELDS):
+                change_set = None
+
+        if change_set is None:
+            indexed_count = cls.index(modulestore, course_key, triggered_at=triggered_at)
+        elif change_set.is_empty:
+            indexed_count = 0
+        else:
+            changes = IndexChanges(
+                updated=change_set.updated,
+                subtrees={
+                    location for location, field_names in change_set.changed_fields.items()
+                    if not field_names.isdisjoint(SUBTREE_INDEX_FIELDS)
+                },
+                removed=change_set.removed,
+            )
+            indexed_count = cls.index(modulestore, course_key, changes=changes)
+
+        cache.set(indexed_version_key, published_version, None)
+        return indexed_count
+
     @classmethod
     def fetch_group_usage(cls, modulestore, structure):
         groups_usage_dict = {}
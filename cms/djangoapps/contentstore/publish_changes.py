@@ -0,0 +1,121 @@
+"""
+The set of blocks changed by a course publish.
+
+A publish is followed by several independent tasks (outline generation, search
+indexing, ...). Rather than each of them working out on its own what the publish
+changed, the change-set is computed once per published version and cached, and
+every task looks up the same, immutable copy of it.
+"""
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Optional
+
+from django.core.cache import cache
+from opaque_keys.edx.keys import CourseKey, UsageKey
+
+from xmodule.modulestore import ModuleStoreEnum
+from xmodule.modulestore.django import modulestore
+from xmodule.modulestore.exceptions import ItemNotFoundError
+
+log = logging.getLogger(__name__)
+
+# Change-sets are only needed by the tasks which follow a publish, so they don't
+# need to stay around for long.
+CHANGE_SET_CACHE_TIMEOUT = 60 * 60 * 24
+
+
+@dataclass(frozen=True)
+class PublishChangeSet:
+    """
+    The blocks which differ between two versions of the published branch of a course.
+    """
+    course_key: CourseKey
+    version: str
+    from_version: str
+    added: FrozenSet[UsageKey]
+    changed: FrozenSet[UsageKey]
+    removed: FrozenSet[UsageKey]
+    # The names of the settings fields which changed on each changed block. Read-only.
+    changed_fields: Dict[UsageKey, FrozenSet[str]] = field(default_factory=dict, compare=False, hash=False)
+
+    @property
+    def is_empty(self):
+        """
+        Whether the two versions have the same content.
+        """
+        return not (self.added or self.changed or self.removed)
+
+    @property
+    def updated(self):
+        """
+        The blocks which were added or changed.
+        """
+        return self.added | self.changed
+
+
+def _cache_key(course_key, version, from_version):
+    return f'contentstore.publish_change_set.{course_key}.{version}.{from_version}'
+
+
+def get_publish_change_set(course_key, version=None, from_version=None) -> Optional[PublishChangeSet]:
+    """
+    Return the PublishChangeSet between two versions of the published branch of a course.
+
+    Arguments:
+        course_key: the course
+        version: the published version to look at; defaults to the current published head
+        from_version: the version to compare it against; defaults to the version
+            published just before `version`
+
+    Returns None if the changes can't be worked out, e.g. for the first publish
+    of a course or for a modulestore which doesn't keep versions. Callers must
+    then treat the whole course as changed.
+    """
+    course_key = CourseKey.from_string(str(course_key)).for_branch(None)
+    if version is not None:
+        cached = cache.get(_cache_key(course_key, version, from_version))
+        if cached is not None:
+            return cached
+
+    published_key = course_key.for_branch(ModuleStoreEnum.BranchName.published)
+    if version is not None:
+        published_key = published_key.for_version(version)
+    try:
+        changes = modulestore().get_structure_changes(published_key, from_version=from_version)
+    except ItemNotFoundError:
+        # Old-style Mongo courses have no versioned structures to compare.
+        return None
+    if changes is None:
+        return None
+
+    change_set = PublishChangeSet(
+        course_key=course_key,
+        version=str(changes['version']),
+        from_version=str(changes['from_version']),
+        added=frozenset(changes['added']),
+        changed=frozenset(changes['changed']),
+        removed=frozenset(changes['removed']),
+        changed_fields={
+            usage_key: frozenset(field_names) for usage_key, field_names in changes['changed_fields'].items()
+        },
+    )
+    cache.set(_cache_key(course_key, change_set.version, from_version), change_set, CHANGE_SET_CACHE_TIMEOUT)
+    log.info(
+        'Publish of %s (%s from %s): %d added, %d changed, %d removed blocks',
+        course_key, change_set.version, change_set.from_version,
+        len(change_set.added), len(change_set.changed), len(change_set.removed),
+    )
+    return change_set
+
+
+def get_published_version(course_key):
+    """
+    Return the version of the published branch of a course, as a string, or None
+    if the course isn't versioned.
+    """
+    store = modulestore()
+    with store.branch_setting(ModuleStoreEnum.Branch.published_only, course_key):
+        course = store.get_course(course_key, depth=0)
+    if course is None or course.course_version is None:
+        return None
+    return str(course.course_version)
@@ -37,6 +37,8 @@ from cms.djangoapps.contentstore.courseware_index import (
     CoursewareSearchIndexer,
     LibrarySearchIndexer,
 )
+from cms.djangoapps.contentstore.publish_changes import get_published_version
+from cms.djangoapps.contentstore.toggles import use_publish_pipeline
 from common.djangoapps.track.event_transaction_utils import get_event_transaction_id, get_event_transaction_type
 from common.djangoapps.util.block_utils import yield_dynamic_block_descendants
 from lms.djangoapps.grades.api import task_compute_all_grades_for_course
@@ -147,6 +149,7 @@ def listen_for_course_publish(sender, course_key, **kwargs):  # pylint: disable=
     """
     # import here, because signal is registered at startup, but items in tasks are not yet able to be loaded
     from cms.djangoapps.contentstore.tasks import (
+        run_publish_pipeline,
         update_outline_from_modulestore_task,
         update_search_index,
         update_special_exams_and_publish
@@ -167,13 +170,25 @@ def listen_for_course_publish(sender, course_key, **kwargs):  # pylint: disable=
     course_key_str = str(course_key)
     transaction.on_commit(lambda: update_special_exams_and_publish.delay(course_key_str))
 
-    if key_supports_outlines(course_key):
-        # Push the course outline to learning_sequences asynchronously.
-        update_outline_from_modulestore_task.delay(course_key_str)
-
-    # Kick off a courseware indexing action after the data is ready
-    if CoursewareSearchIndexer.indexing_is_enabled() and CourseAboutSearchIndexer.indexing_is_enabled():
-        transaction.on_commit(lambda: update_search_index.delay(course_key_str, datetime.now(UTC).isoformat()))
+    index_search = CoursewareSearchIndexer.indexing_is_enabled() and CourseAboutSearchIndexer.indexing_is_enabled()
+    if use_publish_pipeline(course_key):
+        # Compute the published changes once, after the data is ready, and run the
+        # outline and search index updates concurrently from them.
+        published_version = get_published_version(course_key)
+        transaction.on_commit(lambda: run_publish_pipeline.delay(
+            course_key_str,
+            datetime.now(UTC).isoformat(),
+            published_version=published_version,
+            index_search=index_search,
+        ))
+    else:
+        if key_supports_outlines(course_key):
+            # Push the course outline to learning_sequences asynchronously.
+            update_outline_from_modulestore_task.delay(course_key_str)
+
+        # Kick off a courseware indexing action after the data is ready
+        if index_search:
+            transaction.on_commit(lambda: update_search_index.delay(course_key_str, datetime.now(UTC).isoformat()))
 
     update_discussions_settings_from_course_task.apply_async(
         args=[course_key_str],
@@ -17,10 +17,11 @@ from urllib.parse import urlparse
 import aiohttp
 import olxcleaner
 from ccx_keys.locator import CCXLocator
-from celery import shared_task
+from celery import group, shared_task
 from celery.utils.log import get_task_logger
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.core.exceptions import SuspiciousOperation
 from django.core.files import File
 from django.test import RequestFactory
@@ -75,6 +76,7 @@ from common.djangoapps.util.monitoring import monitor_import_failure
 from openedx.core.djangoapps.content.learning_sequences.api import key_supports_outlines
 from openedx.core.djangoapps.content_libraries import api as v2contentlib_api
 from openedx.core.djangoapps.content_tagging.api import make_copied_tags_editable
+from openedx.core.djangoapps.contentserver.caching import del_cached_content
 from openedx.core.djangoapps.course_apps.toggles import exams_ida_enabled
 from openedx.core.djangoapps.discussions.config.waffle import ENABLE_NEW_STRUCTURE_DISCUSSIONS
 from openedx.core.djangoapps.discussions.models import DiscussionsConfiguration, Provider
@@ -85,7 +87,7 @@ from openedx.core.lib.extract_archive import safe_extractall
 from openedx.core.lib.xblock_utils import get_course_update_items
 from xmodule.contentstore.django import contentstore
 from xmodule.course_block import CourseFields
-from xmodule.exceptions import SerializationError
+from xmodule.exceptions import NotFoundError, SerializationError
 from xmodule.modulestore import COURSE_ROOT, LIBRARY_ROOT, ModuleStoreEnum
 from xmodule.modulestore.django import modulestore
 from xmodule.modulestore.exceptions import DuplicateCourseError, InvalidProctoringProvider, ItemNotFoundError
@@ -96,6 +98,7 @@ from xmodule.tabs import StaticTab
 from .models import ComponentLink, ContainerLink, LearningContextLinksStatus, LearningContextLinksStatusChoices
 from .outlines import update_outline_from_modulestore
 from .outlines_regenerate import CourseOutlineRegenerate
+from .publish_changes import get_publish_change_set
 from .toggles import bypass_olx_failure_enabled
 from .utils import course_import_olx_validation_is_enabled
 
@@ -104,6 +107,10 @@ User = get_user_model()
 LOGGER = get_task_logger(__name__)
 FILE_READ_CHUNK = 1024  # bytes
 FULL_COURSE_REINDEX_THRESHOLD = 1
+# Images uploaded to a course within this many seconds of each other get their thumbnails in the same batch.
+ASSET_THUMBNAIL_BATCH_DELAY = 5
+# How long to wait for a scheduled thumbnail batch before scheduling another one anyway.
+ASSET_THUMBNAIL_BATCH_TIMEOUT = 60 * 10
 ALL_ALLOWED_XBLOCKS = frozenset(
     [entry_point.name for entry_point in entry_points(group="xblock.v1")]
 )
@@ -253,8 +260,13 @@ def _parse_time(time_isoformat):
 
 @shared_task
 @set_code_owner_attribute
-def update_search_index(course_id, triggered_time_isoformat):
-    """ Updates course search index. """
+def update_search_index(course_id, triggered_time_isoformat, published_version=None):
+    """
+    Updates course search index.
+
+    If the published version of the course is given, only what changed since the
+    version last indexed is reindexed.
+    """
     try:
         course_key = CourseKey.from_string(course_id)
 
@@ -268,7 +280,14 @@ def update_search_index(course_id, triggered_time_isoformat):
             )
             return
 
-        CoursewareSearchIndexer.index(modulestore(), course_key, triggered_at=(_parse_time(triggered_time_isoformat)))
+        if published_version is not None:
+            CoursewareSearchIndexer.index_published_changes(
+                modulestore(), course_key, published_version, triggered_at=(_parse_time(triggered_time_isoformat))
+            )
+        else:
+            CoursewareSearchIndexer.index(
+                modulestore(), course_key, triggered_at=(_parse_time(triggered_time_isoformat))
+            )
 
     except SearchIndexingError as exc:
         error_list = exc.error_list
@@ -817,6 +836,94 @@ def update_outline_from_modulestore_task(course_key_str: str):
         raise  # Re-raise so that errors are noted in reporting.
 
 
+@shared_task
+@set_code_owner_attribute
+def run_publish_pipeline(course_key_str, triggered_time_isoformat, published_version=None, index_search=True):
+    """
+    Celery task that runs the work which follows a course publish.
+
+    The blocks changed by the publish are worked out once and cached (see
+    publish_changes.get_publish_change_set), then the downstream tasks, which
+    don't depend on one another, are started together rather than one after
+    the other. If the publish didn't change any published content they aren't
+    started at all.
+
+    The course overview, which the outline depends on, is refreshed synchronously
+    when the publish signal is sent, so it's up to date before this task runs.
+    """
+    course_key = CourseKey.from_string(course_key_str)
+    change_set = get_publish_change_set(course_key, version=published_version)
+    if change_set is not None and change_set.is_empty:
+        LOGGER.info(
+            "Publish of course %s (version %s) changed no published content, skipping the publish pipeline",
+            course_key_str,
+            published_version,
+        )
+        return
+
+    consumers = []
+    if key_supports_outlines(course_key):
+        consumers.append(update_outline_from_modulestore_task.si(course_key_str))
+    if index_search:
+        consumers.append(update_search_index.si(
+            course_key_str,
+            triggered_time_isoformat,
+            published_version=change_set.version if change_set is not None else None,
+        ))
+    if consumers:
+        group(consumers).apply_async()
+
+
+def _asset_thumbnail_batch_cache_key(course_key):
+    return f'contentstore.asset_thumbnail_batch.{course_key}'
+
+
+def schedule_asset_thumbnails(course_key):
+    """
+    Make sure a generate_asset_thumbnails task is scheduled for the course.
+
+    The assets needing a thumbnail must already have been saved with their
+    `thumbnail_pending` attribute set. At most one batch is scheduled at a time
+    per course; uploads made before it starts are handled by it.
+    """
+    if cache.add(_asset_thumbnail_batch_cache_key(course_key), True, ASSET_THUMBNAIL_BATCH_TIMEOUT):
+        generate_asset_thumbnails.apply_async((str(course_key),), countdown=ASSET_THUMBNAIL_BATCH_DELAY)
+
+
+@shared_task
+@set_code_owner_attribute
+def generate_asset_thumbnails(course_key_string):
+    """
+    Generate the thumbnails of all of the assets of a course which are waiting for one.
+    """
+    course_key = CourseKey.from_string(course_key_string)
+    # Assets marked from now on may be missed by the query below, so they need a new batch.
+    cache.delete(_asset_thumbnail_batch_cache_key(course_key))
+
+    store = contentstore()
+    assets, __ = store.get_all_content_for_course(course_key, filter_params={'thumbnail_pending': True})
+    LOGGER.info('Generating thumbnails for %d assets of course %s', len(assets), course_key_string)
+    for asset in assets:
+        asset_key = asset['asset_key']
+        content = store.find(asset_key, throw_on_not_found=False)
+        if content is None:
+            continue
+
+        thumbnail_content, thumbnail_location = store.generate_thumbnail(content)
+        # delete cached thumbnail even if one couldn't be created this time (else the old thumbnail will continue to show)
+        del_cached_content(thumbnail_location)
+        if thumbnail_content is not None:
+            try:
+                store.set_attr(asset_key, 'thumbnail_location', thumbnail_location.to_deprecated_list_repr())
+            except NotFoundError:
+                continue
+            del_cached_content(asset_key)
+        # Only clear the mark once the thumbnail is saved, so that an asset isn't left without
+        # one if this task fails, and only for the upload the thumbnail was generated from: an
+        # upload replacing the asset meanwhile keeps its mark for the batch it scheduled.
+        store.unset_attr(asset_key, 'thumbnail_pending', uploaded_at=content.last_modified_at)
+
+
 def validate_course_olx(courselike_key, course_dir, status):
     """
     Validates course olx and records the errors as an artifact.
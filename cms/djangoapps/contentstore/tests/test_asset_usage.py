@@ -0,0 +1,67 @@
+"""
+Tests for the map of where the assets of a course are used.
+"""
+from unittest import mock
+
+from xmodule.modulestore import ModuleStoreEnum  # lint-amnesty, pylint: disable=wrong-import-order
+from xmodule.modulestore.tests.django_utils import ModuleStoreTestCase  # lint-amnesty, pylint: disable=wrong-import-order
+from xmodule.modulestore.tests.factories import CourseFactory, BlockFactory  # lint-amnesty, pylint: disable=wrong-import-order
+
+from ..asset_usage import _build_asset_usage_map, get_asset_usage_map
+
+
+class AssetUsageMapTestCase(ModuleStoreTestCase):
+    """
+    Tests for get_asset_usage_map.
+    """
+    ENABLED_CACHES = ['default']
+
+    def setUp(self):
+        super().setUp()
+        self.course = CourseFactory.create(default_store=ModuleStoreEnum.Type.split)
+        self.chapter = BlockFactory.create(parent=self.course, category='chapter')
+        self.sequential = BlockFactory.create(parent=self.chapter, category='sequential', display_name='Subsection')
+        self.vertical = BlockFactory.create(parent=self.sequential, category='vertical', display_name='Unit')
+        self.image_key = self.course.id.make_asset_key('asset', 'image.png')
+        self.handout_key = self.course.id.make_asset_key('asset', 'handout.pdf')
+        self.html = BlockFactory.create(
+            parent=self.vertical, category='html', display_name='Text',
+            data=(
+                '<img src="/static/image.png"/><img src="/static/image.png?raw"/>'
+                f'<a href="/{self.handout_key}">Handout</a>'
+                '<div style="background: url(/static/background.jpg)"></div>'
+            ),
+        )
+        self.video = BlockFactory.create(
+            parent=self.vertical, category='video', display_name='Video', handout=f'/{self.handout_key}',
+        )
+
+    def _usage(self, block):
+        return {
+            'display_location': f'Subsection - Unit / {block.display_name}',
+            'url': f'/container/{self.vertical.location}#{block.location}',
+        }
+
+    def test_usage_map(self):
+        usage_map = get_asset_usage_map(self.course.id)
+        assert usage_map[str(self.image_key)] == [self._usage(self.html)]
+        assert usage_map[str(self.handout_key)] == [self._usage(self.html), self._usage(self.video)]
+        assert usage_map[str(self.course.id.make_asset_key('asset', 'background.jpg'))] == [self._usage(self.html)]
+        assert str(self.course.id.make_asset_key('asset', 'unused.png')) not in usage_map
+
+    def test_usage_map_from_blocks(self):
+        usage_map = _build_asset_usage_map(self.store, self.course.id)
+        with mock.patch.object(self.store, 'get_block_field_values', side_effect=NotImplementedError):
+            assert _build_asset_usage_map(self.store, self.course.id) == usage_map
+
+    def test_cached_per_version(self):
+        usage_map = get_asset_usage_map(self.course.id)
+        with mock.patch.object(self.store, 'get_block_field_values') as mock_get_field_values:
+            assert get_asset_usage_map(self.course.id) == usage_map
+        mock_get_field_values.assert_not_called()
+
+        self.html.data = '<p>No more assets</p>'
+        self.store.update_item(self.html, self.user.id)
+        usage_map = get_asset_usage_map(self.course.id)
+        assert str(self.image_key) not in usage_map
+        assert usage_map[str(self.handout_key)] == [self._usage(self.video)]
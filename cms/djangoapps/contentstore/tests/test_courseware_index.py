@@ -20,6 +20,7 @@ from cms.djangoapps.contentstore.courseware_index import (
     LibrarySearchIndexer,
     SearchIndexingError
 )
+from cms.djangoapps.contentstore.publish_changes import get_published_version
 from cms.djangoapps.contentstore.signals.handlers import listen_for_course_publish, listen_for_library_update
 from cms.djangoapps.contentstore.tasks import update_search_index
 from cms.djangoapps.contentstore.tests.utils import CourseTestCase
@@ -457,6 +458,99 @@ class TestCoursewareSearchIndexer(MixedWithOptionsTestCase):
         self.assertEqual(result["course_name"], "Search Index Test Course")
         self.assertEqual(result["location"], ["Week 1", CoursewareSearchIndexer.UNNAMED_MODULE_NAME, "Subsection 2"])
 
+    def index_published_changes(self, store):
+        """ index course using the changes of its current published version """
+        return CoursewareSearchIndexer.index_published_changes(
+            store,
+            self.course.id,
+            get_published_version(self.course.id),
+            triggered_at=datetime.now(UTC),
+        )
+
+    def _test_published_changes_index(self, store):
+        """ Make sure that only what changed since the last indexed version is reindexed """
+        self.publish_item(store, self.vertical.location)
+        # Nothing was indexed yet, so everything recently changed is
+        indexed_count = self.index_published_changes(store)
+        self.assertEqual(indexed_count, 4)
+
+        self.html_unit.display_name = "Changed Html Content"
+        self.update_item(store, self.html_unit)
+        self.publish_item(store, self.vertical.location)
+        indexed_count = self.index_published_changes(store)
+        self.assertEqual(indexed_count, 1)
+        response = self.search(query_string="Changed Html Content")
+        self.assertEqual(response["total"], 1)
+
+        # Nothing changed since the last index
+        indexed_count = self.index_published_changes(store)
+        self.assertEqual(indexed_count, 0)
+
+        # A deleted item is removed from the index once published
+        self.delete_item(store, self.html_unit.location)
+        self.publish_item(store, self.vertical.location)
+        self.index_published_changes(store)
+        response = self.search()
+        self.assertEqual(response["total"], 3)
+
+    def _test_published_changes_inherited_field(self, store):
+        """ Make sure that changing an inherited field reindexes the descendants which inherit it """
+        self.publish_item(store, self.vertical.location)
+        self.index_published_changes(store)
+
+        later_date = datetime(2015, 5, 1, tzinfo=UTC)
+        self.vertical.start = later_date
+        self.update_item(store, self.vertical)
+        self.publish_item(store, self.vertical.location)
+        indexed_count = self.index_published_changes(store)
+        self.assertEqual(indexed_count, 2)
+
+        response = self.search()
+        date_map = {result["data"]["id"]: result["data"]["start_date"] for result in response["results"]}
+        self.assertEqual(date_map[str(self.vertical.location)], later_date)
+        self.assertEqual(date_map[str(self.html_unit.location)], later_date)
+
+    def _test_published_changes_display_name(self, store):
+        """ Make sure that renaming an item reindexes the location path of its descendants """
+        self.publish_item(store, self.vertical.location)
+        self.index_published_changes(store)
+
+        self.sequential.display_name = "Renamed Lesson"
+        self.update_item(store, self.sequential)
+        self.publish_item(store, self.sequential.location)
+        indexed_count = self.index_published_changes(store)
+        self.assertEqual(indexed_count, 3)
+
+        response = self.search(query_string="Html Content")
+        self.assertEqual(response["results"][0]["data"]["location"], ["Week 1", "Renamed Lesson", "Subsection 1"])
+
+    def _test_published_changes_moved_item(self, store):
+        """ Make sure that moving an item to another parent reindexes its location path """
+        sequential2 = BlockFactory.create(
+            parent_location=self.chapter.location,
+            category='sequential',
+            display_name="Lesson 2",
+            modulestore=store,
+            publish_item=True,
+        )
+        self.publish_item(store, self.vertical.location)
+        self.index_published_changes(store)
+
+        with store.branch_setting(ModuleStoreEnum.Branch.draft_preferred):
+            self.sequential = store.get_item(self.sequential.location)
+            sequential2 = store.get_item(sequential2.location)
+        self.sequential.children = [
+            child for child in self.sequential.children if child.block_id != self.vertical.location.block_id
+        ]
+        self.update_item(store, self.sequential)
+        sequential2.children = sequential2.children + [self.vertical.location]
+        self.update_item(store, sequential2)
+        self.publish_item(store, self.chapter.location)
+        self.index_published_changes(store)
+
+        response = self.search(query_string="Html Content")
+        self.assertEqual(response["results"][0]["data"]["location"], ["Week 1", "Lesson 2", "Subsection 1"])
+
     @patch('django.conf.settings.SEARCH_ENGINE', 'search.tests.utils.ErroringIndexEngine')
     def _test_exception(self, store):
         """ Test that exception within indexing yields a SearchIndexingError """
@@ -482,6 +576,18 @@ class TestCoursewareSearchIndexer(MixedWithOptionsTestCase):
     def test_time_based_index(self):
         self._test_time_based_index(self.store)
 
+    def test_published_changes_index(self):
+        self._test_published_changes_index(self.store)
+
+    def test_published_changes_inherited_field(self):
+        self._test_published_changes_inherited_field(self.store)
+
+    def test_published_changes_display_name(self):
+        self._test_published_changes_display_name(self.store)
+
+    def test_published_changes_moved_item(self):
+        self._test_published_changes_moved_item(self.store)
+
     def test_exception(self):
         self._test_exception(self.store)
 
@@ -0,0 +1,145 @@
+"""
+Tests for the change-sets computed after a course publish, and the publish
+pipeline which uses them.
+"""
+from datetime import datetime, timezone
+from unittest import mock
+
+from xmodule.modulestore import ModuleStoreEnum  # lint-amnesty, pylint: disable=wrong-import-order
+from xmodule.modulestore.tests.django_utils import ModuleStoreTestCase  # lint-amnesty, pylint: disable=wrong-import-order
+from xmodule.modulestore.tests.factories import CourseFactory, BlockFactory  # lint-amnesty, pylint: disable=wrong-import-order
+
+from ..publish_changes import PublishChangeSet, get_publish_change_set, get_published_version
+from ..tasks import run_publish_pipeline
+
+
+def _key(block):
+    return block.location.version_agnostic().for_branch(None)
+
+
+class PublishChangeSetTestCase(ModuleStoreTestCase):
+    """
+    Tests for get_publish_change_set.
+    """
+    ENABLED_SIGNALS = []
+    ENABLED_CACHES = ['default']
+
+    def setUp(self):
+        super().setUp()
+        self.course = CourseFactory.create(default_store=ModuleStoreEnum.Type.split)
+        self.chapter = BlockFactory.create(parent=self.course, category='chapter')
+        self.sequential = BlockFactory.create(parent=self.chapter, category='sequential')
+        self.vertical = BlockFactory.create(parent=self.sequential, category='vertical')
+        self.html = BlockFactory.create(parent=self.vertical, category='html', display_name='Original')
+        self.store.publish(self.vertical.location, self.user.id)
+
+    def test_changed_block(self):
+        self.html.display_name = 'Changed'
+        self.store.update_item(self.html, self.user.id)
+        self.store.publish(self.vertical.location, self.user.id)
+
+        change_set = get_publish_change_set(self.course.id)
+        assert change_set.version == get_published_version(self.course.id)
+        assert change_set.changed == {_key(self.html)}
+        assert not change_set.added
+        assert not change_set.removed
+        assert change_set.updated == {_key(self.html)}
+
+    def test_added_and_removed_blocks(self):
+        new_html = BlockFactory.create(parent=self.vertical, category='html')
+        self.store.publish(self.vertical.location, self.user.id)
+        change_set = get_publish_change_set(self.course.id)
+        assert change_set.added == {_key(new_html)}
+        # The vertical's children changed.
+        assert change_set.changed == {_key(self.vertical)}
+
+        self.store.delete_item(new_html.location, self.user.id, revision=ModuleStoreEnum.RevisionOption.all)
+        change_set = get_publish_change_set(self.course.id)
+        assert change_set.removed == {_key(new_html)}
+        assert not change_set.added
+
+    def test_cached_per_version(self):
+        self.html.display_name = 'Changed'
+        self.store.update_item(self.html, self.user.id)
+        self.store.publish(self.vertical.location, self.user.id)
+        version = get_published_version(self.course.id)
+        change_set = get_publish_change_set(self.course.id, version=version)
+
+        with mock.patch.object(self.store, 'get_structure_changes') as mock_get_changes:
+            assert get_publish_change_set(self.course.id, version=version) == change_set
+        mock_get_changes.assert_not_called()
+
+    def test_pinned_version(self):
+        """
+        A change-set for a version which is no longer the head still describes that version.
+        """
+        self.html.display_name = 'Changed'
+        self.store.update_item(self.html, self.user.id)
+        self.store.publish(self.vertical.location, self.user.id)
+        version = get_published_version(self.course.id)
+
+        new_html = BlockFactory.create(parent=self.vertical, category='html')
+        self.store.publish(self.vertical.location, self.user.id)
+
+        change_set = get_publish_change_set(self.course.id, version=version)
+        assert change_set.version == version
+        assert change_set.changed == {_key(self.html)}
+        assert _key(new_html) not in change_set.added
+
+
+@mock.patch('cms.djangoapps.contentstore.tasks.group')
+class RunPublishPipelineTestCase(ModuleStoreTestCase):
+    """
+    Tests for the run_publish_pipeline task.
+    """
+    ENABLED_SIGNALS = []
+
+    def setUp(self):
+        super().setUp()
+        self.course = CourseFactory.create(default_store=ModuleStoreEnum.Type.split)
+        self.triggered_at = datetime.now(timezone.utc).isoformat()
+
+    def _change_set(self, **changes):
+        return PublishChangeSet(
+            course_key=self.course.id,
+            version='2',
+            from_version='1',
+            added=frozenset(changes.get('added', ())),
+            changed=frozenset(changes.get('changed', ())),
+            removed=frozenset(changes.get('removed', ())),
+        )
+
+    def test_runs_consumers_together(self, mock_group):
+        change_set = self._change_set(changed=[self.course.location])
+        with mock.patch('cms.djangoapps.contentstore.tasks.get_publish_change_set', return_value=change_set):
+            run_publish_pipeline(str(self.course.id), self.triggered_at, published_version='2')
+
+        mock_group.assert_called_once()
+        consumers = mock_group.call_args[0][0]
+        assert [consumer.task for consumer in consumers] == [
+            'cms.djangoapps.contentstore.tasks.update_outline_from_modulestore_task',
+            'cms.djangoapps.contentstore.tasks.update_search_index',
+        ]
+        mock_group.return_value.apply_async.assert_called_once_with()
+
+    def test_without_search_indexing(self, mock_group):
+        change_set = self._change_set(changed=[self.course.location])
+        with mock.patch('cms.djangoapps.contentstore.tasks.get_publish_change_set', return_value=change_set):
+            run_publish_pipeline(str(self.course.id), self.triggered_at, published_version='2', index_search=False)
+
+        consumers = mock_group.call_args[0][0]
+        assert [consumer.task for consumer in consumers] == [
+            'cms.djangoapps.contentstore.tasks.update_outline_from_modulestore_task',
+        ]
+
+    def test_unchanged_publish_is_skipped(self, mock_group):
+        with mock.patch('cms.djangoapps.contentstore.tasks.get_publish_change_set', return_value=self._change_set()):
+            run_publish_pipeline(str(self.course.id), self.triggered_at, published_version='2')
+
+        mock_group.assert_not_called()
+
+    def test_unknown_changes_run_consumers(self, mock_group):
+        with mock.patch('cms.djangoapps.contentstore.tasks.get_publish_change_set', return_value=None):
+            run_publish_pipeline(str(self.course.id), self.triggered_at)
+
+        mock_group.assert_called_once()
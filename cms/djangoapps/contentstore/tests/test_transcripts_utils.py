@@ -642,6 +642,19 @@ class TestTranscript(unittest.TestCase):
         result = transcripts_utils.Transcript.convert(latin1_sjson_bytes, 'sjson', 'srt')
         assert result == expected_result
 
+    @override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+    def test_convert_cached(self):
+        """
+        Tests that a transcript is converted once into each format.
+        """
+        with patch.object(
+            transcripts_utils.Transcript, '_convert', wraps=transcripts_utils.Transcript._convert
+        ) as mock_convert:
+            for __ in range(2):
+                assert transcripts_utils.Transcript.convert(self.srt_transcript, 'srt', 'txt') == self.txt_transcript
+                transcripts_utils.Transcript.convert(self.srt_transcript, 'srt', 'sjson')
+        assert mock_convert.call_count == 2
+
 
 class TestSubsFilename(unittest.TestCase):
     """
@@ -682,3 +682,50 @@ def enable_course_optimizer_check_prev_run_links(course_key):
     Returns a boolean if previous run course optimizer feature is enabled for the given course.
     """
     return ENABLE_COURSE_OPTIMIZER_CHECK_PREV_RUN_LINKS.is_enabled(course_key)
+
+
+# .. toggle_name: contentstore.enable_publish_pipeline
+# .. toggle_implementation: CourseWaffleFlag
+# .. toggle_default: False
+# .. toggle_description: When enabled, the work which follows a course publish (outline generation and search
+#   indexing) is dispatched once the publish is committed, as a single pipeline task. The pipeline computes the set
+#   of blocks changed by the publish once, caches it for the downstream tasks, and runs those tasks concurrently.
+#   Publishes which don't change any published content skip the downstream tasks entirely.
+# .. toggle_use_cases: temporary
+# .. toggle_creation_date: 2026-10-19
+# .. toggle_target_removal_date: None
+ENABLE_PUBLISH_PIPELINE = CourseWaffleFlag(
+    f'{CONTENTSTORE_NAMESPACE}.enable_publish_pipeline',
+    __name__,
+    CONTENTSTORE_LOG_PREFIX,
+)
+
+
+def use_publish_pipeline(course_key):
+    """
+    Returns a boolean if the publish pipeline is enabled for the given course.
+    """
+    return ENABLE_PUBLISH_PIPELINE.is_enabled(course_key)
+
+
+# .. toggle_name: contentstore.async_asset_thumbnails
+# .. toggle_implementation: CourseWaffleFlag
+# .. toggle_default: False
+# .. toggle_description: When enabled, the thumbnails of images uploaded to the Studio Files page are generated by a
+#   celery task instead of during the upload request. Uploads are marked as waiting for a thumbnail, and the task
+#   handles all of the images uploaded to a course within a few seconds of each other in one batch.
+# .. toggle_use_cases: temporary
+# .. toggle_creation_date: 2026-10-19
+# .. toggle_target_removal_date: None
+ASYNC_ASSET_THUMBNAILS = CourseWaffleFlag(
+    f'{CONTENTSTORE_NAMESPACE}.async_asset_thumbnails',
+    __name__,
+    CONTENTSTORE_LOG_PREFIX,
+)
+
+
+def use_async_asset_thumbnails(course_key):
+    """
+    Returns a boolean if asset thumbnails should be generated in the background for the given course.
+    """
+    return ASYNC_ASSET_THUMBNAILS.is_enabled(course_key)
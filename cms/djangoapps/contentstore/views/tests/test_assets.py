@@ -18,7 +18,7 @@ from opaque_keys.edx.locator import CourseLocator
 from PIL import Image
 from pytz import UTC
 
-from cms.djangoapps.contentstore import toggles
+from cms.djangoapps.contentstore import tasks, toggles
 from cms.djangoapps.contentstore.tests.utils import CourseTestCase
 from cms.djangoapps.contentstore.utils import reverse_course_url
 from cms.djangoapps.contentstore.views import assets
@@ -370,6 +370,22 @@ class UploadTestCase(AssetsTestCase):
         resp = self.upload_asset("test_image", asset_type="image")
         self.assertEqual(resp.status_code, 200)
 
+    @override_waffle_flag(toggles.ASYNC_ASSET_THUMBNAILS, True)
+    def test_upload_image_async_thumbnail(self):
+        with mock.patch('cms.djangoapps.contentstore.tasks.generate_asset_thumbnails.apply_async') as mock_task:
+            resp = self.upload_asset("test_image", asset_type="image")
+        self.assertEqual(resp.status_code, 200)
+        self.assertIsNone(json.loads(resp.content.decode('utf-8'))['asset']['thumbnail'])
+        mock_task.assert_called_once_with((str(self.course.id),), countdown=tasks.ASSET_THUMBNAIL_BATCH_DELAY)
+
+        asset_key = StaticContent.compute_location(self.course.id, 'test_image.jpg')
+        self.assertTrue(contentstore().get_attr(asset_key, 'thumbnail_pending'))
+        tasks.generate_asset_thumbnails(str(self.course.id))
+        self.assertNotIn('thumbnail_pending', contentstore().get_attrs(asset_key))
+        content = contentstore().find(asset_key)
+        self.assertEqual(content.thumbnail_location.block_id, 'test_image.jpg')
+        self.assertIsNotNone(contentstore().find(content.thumbnail_location, throw_on_not_found=False))
+
     @data(
         (int(MAX_FILE_SIZE / 2.0), "small.file.test", 200),
         (MAX_FILE_SIZE, "justequals.file.test", 200),
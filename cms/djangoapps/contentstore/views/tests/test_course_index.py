@@ -12,7 +12,8 @@ import lxml
 import pytz
 from django.conf import settings
 from django.core.exceptions import PermissionDenied
-from django.test.utils import override_settings
+from django.db import connection
+from django.test.utils import CaptureQueriesContext, override_settings
 from django.utils.translation import gettext as _
 from edx_toggles.toggles.testutils import override_waffle_flag
 from opaque_keys.edx.locator import CourseLocator
@@ -566,6 +567,37 @@ class TestCourseOutline(CourseTestCase):
         # Finally, validate the entire response for consistency
         self.assert_correct_json_response(json_response, is_concise)
 
+    def _outline_json_query_count(self):
+        """
+        Returns the number of SQL queries made to get the JSON course outline.
+        """
+        outline_url = reverse_course_url('course_handler', self.course.id)
+        with CaptureQueriesContext(connection) as queries:
+            resp = self.client.get(outline_url, HTTP_ACCEPT='application/json')
+        self.assertEqual(resp.status_code, 200)
+        return len(queries)
+
+    @mock.patch.dict(settings.FEATURES, {'ENABLE_SPECIAL_EXAMS': True})
+    def test_json_response_query_budget(self):
+        """
+        The number of queries made to build the course outline doesn't grow with the
+        number of sections and subsections, even with gating and special exams enabled.
+        """
+        self.course.enable_subsection_gating = True
+        self.store.update_item(self.course, self.user.id)
+        # Warm up the caches which don't depend on the course content
+        self._outline_json_query_count()
+        query_count = self._outline_json_query_count()
+
+        for index in range(3):
+            chapter = BlockFactory.create(
+                parent_location=self.course.location, category='chapter', display_name=f"Week {index + 2}"
+            )
+            BlockFactory.create(
+                parent_location=chapter.location, category='sequential', display_name=f"Lesson {index + 2}"
+            )
+        self.assertEqual(self._outline_json_query_count(), query_count)
+
     def assert_correct_json_response(self, json_response, is_concise=False):
         """
         Asserts that the JSON response is syntactically consistent
@@ -15,6 +15,7 @@ from django.conf import settings
 from django.contrib.auth.decorators import login_required
 from django.core.exceptions import PermissionDenied
 from django.core.files.base import ContentFile
+from django.db import transaction
 from django.http import Http404, HttpResponse
 from django.utils.translation import gettext as _
 from edxval.api import create_external_video, create_or_update_video_transcript
@@ -45,6 +46,7 @@ from xmodule.video_block.transcripts_utils import (  # lint-amnesty, pylint: dis
     get_transcript_links_from_youtube,
 )
 from openedx.core.djangoapps.content_libraries import api as lib_api
+from openedx.core.djangoapps.video_config.tasks import warm_transcript_conversions
 from openedx.core.djangoapps.xblock import api as xblock_api
 from openedx.core.djangoapps.xblock.data import CheckPerm
 
@@ -165,6 +167,7 @@ def save_video_transcript(edx_video_id, input_format, transcript_content, langua
             },
             file_data=ContentFile(sjson_subs),
         )
+        transaction.on_commit(lambda: warm_transcript_conversions.delay(edx_video_id, language_code))
 
         result = True
     except (TranscriptsGenerationException, UnicodeDecodeError):
@@ -280,6 +283,7 @@ def upload_transcripts(request):
                 },
                 file_data=ContentFile(sjson_subs),
             )
+            transaction.on_commit(lambda: warm_transcript_conversions.delay(edx_video_id, 'en'))
 
             video.transcripts['en'] = f"{edx_video_id}-en.srt"
             video.save_with_metadata(request.user)
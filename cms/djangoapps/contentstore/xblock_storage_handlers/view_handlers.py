@@ -24,6 +24,7 @@ from openedx.core.djangoapps.content_libraries.api import ContainerMetadata, Con
 from openedx.core.djangoapps.content_tagging.api import get_object_tag_counts
 from edx_proctoring.api import (
     does_backend_support_onboarding,
+    get_all_exams_for_course,
     get_exam_by_content_id,
     get_exam_configuration_dashboard_url,
 )
@@ -979,7 +980,7 @@ def get_block_info(
         return xblock_info
 
 
-def _get_gating_info(course, xblock):
+def _get_gating_info(course, xblock, course_outline=False):
     """
     Returns a dict containing gating information for the given xblock which
     can be added to xblock info responses.
@@ -987,6 +988,8 @@ def _get_gating_info(course, xblock):
     Arguments:
         course (CourseBlock): The course
         xblock (XBlock): The xblock
+        course_outline (bool): Whether the xblock is part of the course outline, in which
+            case the gating of all the subsections of the course is looked up at once
 
     Returns:
         dict: Gating information
@@ -997,17 +1000,29 @@ def _get_gating_info(course, xblock):
             # Cache gating prerequisites on course block so that we are not
             # hitting the database for every xblock in the course
             course.gating_prerequisites = gating_api.get_prerequisites(course.id)
-        info["is_prereq"] = gating_api.is_prerequisite(course.id, xblock.location)
+        if course_outline:
+            if not hasattr(course, "gating_required_content"):
+                # Likewise for which subsections are prerequisites or gated
+                course.gating_prerequisite_keys = gating_api.get_prerequisite_content_keys(course.id)
+                course.gating_required_content = gating_api.get_required_content_by_block(course.id)
+            info["is_prereq"] = str(xblock.location) in course.gating_prerequisite_keys
+            (
+                prereq,
+                prereq_min_score,
+                prereq_min_completion,
+            ) = course.gating_required_content.get(str(xblock.location), (None, None, None))
+        else:
+            info["is_prereq"] = gating_api.is_prerequisite(course.id, xblock.location)
+            (
+                prereq,
+                prereq_min_score,
+                prereq_min_completion,
+            ) = gating_api.get_required_content(course.id, xblock.location)
         info["prereqs"] = [
             p
             for p in course.gating_prerequisites
             if str(xblock.location) not in p["namespace"]
         ]
-        (
-            prereq,
-            prereq_min_score,
-            prereq_min_completion,
-        ) = gating_api.get_required_content(course.id, xblock.location)
         info["prereq"] = prereq
         info["prereq_min_score"] = prereq_min_score
         info["prereq_min_completion"] = prereq_min_completion
@@ -1301,7 +1316,7 @@ def create_xblock_info(  # lint-amnesty, pylint: disable=too-many-statements
                     {
                         "is_proctored_exam": xblock.is_proctored_exam,
                         "was_exam_ever_linked_with_external": _was_xblock_ever_exam_linked_with_external(
-                            course, xblock
+                            course, xblock, course_outline
                         ),
                         "online_proctoring_rules": rules_url,
                         "is_practice_exam": xblock.is_practice_exam,
@@ -1316,7 +1331,7 @@ def create_xblock_info(  # lint-amnesty, pylint: disable=too-many-statements
                 )
 
         # Update with gating info
-        xblock_info.update(_get_gating_info(course, xblock))
+        xblock_info.update(_get_gating_info(course, xblock, course_outline))
         # Also add upstream info
         upstream_info = UpstreamLink.try_get_for_block(xblock, log_error=False).to_json()
         xblock_info["upstream_info"] = upstream_info
@@ -1383,7 +1398,7 @@ def create_xblock_info(  # lint-amnesty, pylint: disable=too-many-statements
 
             xblock_info[
                 "has_partition_group_components"
-            ] = has_children_visible_to_specific_partition_groups(xblock)
+            ] = has_children_visible_to_specific_partition_groups(xblock, course=course)
         xblock_info["user_partition_info"] = get_visibility_partition_info(
             xblock, course=course
         )
@@ -1424,7 +1439,7 @@ def _get_course_block_tags(course_key) -> dict:
     return get_object_tag_counts(catch_all_key_pattern, count_implicit=True)
 
 
-def _was_xblock_ever_exam_linked_with_external(course, xblock):
+def _was_xblock_ever_exam_linked_with_external(course, xblock, course_outline=False):
     """
     Determine whether this XBlock is or was ever configured as an external proctored exam.
 
@@ -1438,9 +1453,22 @@ def _was_xblock_ever_exam_linked_with_external(course, xblock):
     Arguments:
         course (CourseBlock)
         xblock (XBlock)
+        course_outline (bool): Whether the xblock is part of the course outline, in which
+            case the exams of the whole course are looked up at once
 
     Returns: bool
     """
+    if course_outline:
+        if not hasattr(course, "externally_linked_exam_content_ids"):
+            # Cache the exam records on the course block so that we are not
+            # hitting the database for every subsection in the course
+            course.externally_linked_exam_content_ids = {
+                exam["content_id"]
+                for exam in get_all_exams_for_course(str(course.id))
+                if exam.get("external_id")
+            }
+        return str(xblock.location) in course.externally_linked_exam_content_ids
+
     try:
         exam = get_exam_by_content_id(course.id, xblock.location)
         return bool("external_id" in exam and exam["external_id"])
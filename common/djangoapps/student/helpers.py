@@ -454,7 +454,7 @@ class AccountValidationError(Exception):
         self.error_code = error_code
 
 
-def cert_info(user, enrollment):
+def cert_info(user, enrollment, cert_status=None):
     """
     Get the certificate info needed to render the dashboard section for the given
     student and course.
@@ -462,15 +462,16 @@ def cert_info(user, enrollment):
     Arguments:
         user (User): A user.
         enrollment (CourseEnrollment): A course enrollment.
+        cert_status (dict): Optional, already fetched certificate status for the
+            user in this course (see certificate_statuses_for_student). It is
+            looked up if not provided.
 
     Returns:
         See _cert_info
     """
-    return _cert_info(
-        user,
-        enrollment,
-        certificate_status_for_student(user, enrollment.course_overview.id),
-    )
+    if cert_status is None:
+        cert_status = certificate_status_for_student(user, enrollment.course_overview.id)
+    return _cert_info(user, enrollment, cert_status)
 
 
 def _cert_info(user, enrollment, cert_status):
@@ -4,7 +4,6 @@ adding users, removing users, and listing members
 """
 
 
-from collections import defaultdict
 import logging
 from abc import ABCMeta, abstractmethod
 from contextlib import contextmanager
@@ -12,7 +11,7 @@ from contextlib import contextmanager
 from django.contrib.auth.models import User  # lint-amnesty, pylint: disable=imported-auth-user
 from opaque_keys.edx.django.models import CourseKeyField
 
-from openedx.core.lib.cache_utils import get_cache
+from openedx.core.lib.cache_utils import VersionedCache, get_cache
 from common.djangoapps.student.models import CourseAccessRole
 
 log = logging.getLogger(__name__)
@@ -26,6 +25,13 @@ ACCESS_ROLES_INHERITANCE = {}
 # The key used to store roles for a user in the cache that do not belong to a course or do not have a course id.
 ROLE_CACHE_UNGROUPED_ROLES__KEY = 'ungrouped'
 
+# Only a safety net for roles changed without going through the model (e.g. with QuerySet.update).
+ROLE_CACHE_TIMEOUT = 60 * 60
+# The columns of the CourseAccessRoles of each user, under the user's current version. Users
+# are not cached with their roles, as they change without the version being bumped.
+ROLE_CACHE_FIELDS = [field.attname for field in CourseAccessRole._meta.concrete_fields]
+ROLE_ROWS_CACHE = VersionedCache('student.roles.rows', ROLE_CACHE_TIMEOUT)
+
 
 def register_access_role(cls):
     """
@@ -70,6 +76,46 @@ def get_role_cache_key_for_course(course_key=None):
     return str(course_key) if course_key else ROLE_CACHE_UNGROUPED_ROLES__KEY
 
 
+def invalidate_role_cache(user_id):
+    """
+    Make the roles of the user be read again from the database, in all processes.
+
+    Called whenever a role of the user changes.
+    """
+    ROLE_ROWS_CACHE.invalidate(user_id)
+
+
+def get_roles_by_course_id_for_users(users):
+    """
+    Return a dict mapping the id of each of users to their CourseAccessRoles grouped by
+    course id, as kept by RoleCache. The user of each role is the one passed in `users`.
+
+    The roles are read from the shared cache with one multi-get of the users' versions
+    and one of their roles. Only the roles of the users missing from the cache are read
+    from the database, with a single query.
+    """
+    def load_role_rows(user_ids):
+        rows_by_user = {user_id: [] for user_id in user_ids}
+        user_id_index = ROLE_CACHE_FIELDS.index('user_id')
+        for row in CourseAccessRole.objects.filter(user_id__in=user_ids).values_list(*ROLE_CACHE_FIELDS):
+            rows_by_user[row[user_id_index]].append(row)
+        return rows_by_user
+
+    roles_by_user = {user.id: {} for user in users if user.id is None}
+    users_by_id = {user.id: user for user in users if user.id is not None}
+    if not users_by_id:
+        return roles_by_user
+
+    db = CourseAccessRole.objects.db
+    for user_id, rows in ROLE_ROWS_CACHE.get_many(users_by_id.keys(), load_role_rows).items():
+        roles_by_course_id = roles_by_user[user_id] = {}
+        for row in rows:
+            role = CourseAccessRole.from_db(db, ROLE_CACHE_FIELDS, row)
+            role.user = users_by_id[user_id]
+            roles_by_course_id.setdefault(get_role_cache_key_for_course(role.course_id), set()).add(role)
+    return roles_by_user
+
+
 class BulkRoleCache:  # lint-amnesty, pylint: disable=missing-class-docstring
     """
     This class provides a caching mechanism for roles grouped by users and courses,
@@ -94,21 +140,18 @@ class BulkRoleCache:  # lint-amnesty, pylint: disable=missing-class-docstring
     CACHE_KEY = 'roles_by_user'
 
     @classmethod
-    def prefetch(cls, users):  # lint-amnesty, pylint: disable=missing-function-docstring
-        roles_by_user = defaultdict(lambda: defaultdict(set))
-        get_cache(cls.CACHE_NAMESPACE)[cls.CACHE_KEY] = roles_by_user
-
-        for role in CourseAccessRole.objects.filter(user__in=users).select_related('user'):
-            user_id = role.user.id
-            course_id = get_role_cache_key_for_course(role.course_id)
-
-            # Add role to the set in roles_by_user[user_id][course_id]
-            user_roles_set_for_course = roles_by_user[user_id][course_id]
-            user_roles_set_for_course.add(role)
+    def prefetch(cls, users):
+        """
+        Load the roles of users (a list or a QuerySet) for the rest of the request. Users
+        prefetched earlier in the request are kept.
 
-        users_without_roles = [u for u in users if u.id not in roles_by_user]
-        for user in users_without_roles:
-            roles_by_user[user.id] = {}
+        Prefetching can't be done by RoleCache on its own: a User loaded from a QuerySet keeps
+        no reference to the QuerySet or to the other users loaded with it, and giving it one
+        would take a custom QuerySet on the User model of django.contrib.auth, used by every
+        query for users. Code checking the roles of many users must call this first.
+        """
+        roles_by_user = get_cache(cls.CACHE_NAMESPACE).setdefault(cls.CACHE_KEY, {})
+        roles_by_user.update(get_roles_by_course_id_for_users(list(users)))
 
     @classmethod
     def get_user_roles(cls, user):
@@ -133,13 +176,7 @@ class RoleCache:
         try:
             self._roles_by_course_id = BulkRoleCache.get_user_roles(user)
         except KeyError:
-            self._roles_by_course_id = {}
-            roles = CourseAccessRole.objects.filter(user=user).all()
-            for role in roles:
-                course_id = get_role_cache_key_for_course(role.course_id)
-                if not self._roles_by_course_id.get(course_id):
-                    self._roles_by_course_id[course_id] = set()
-                self._roles_by_course_id[course_id].add(role)
+            self._roles_by_course_id = get_roles_by_course_id_for_users([user])[user.id]
         self._roles = set()
         for roles_for_course in self._roles_by_course_id.values():
             self._roles.update(roles_for_course)
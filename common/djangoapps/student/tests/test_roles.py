@@ -4,11 +4,14 @@ Tests of student.roles
 
 
 import ddt
+from django.contrib.auth.models import User  # lint-amnesty, pylint: disable=imported-auth-user
 from django.test import TestCase
+from edx_django_utils.cache import RequestCache
 from opaque_keys.edx.keys import CourseKey
 from opaque_keys.edx.locator import LibraryLocator
 
 from common.djangoapps.student.roles import (
+    BulkRoleCache,
     CourseAccessRole,
     CourseBetaTesterRole,
     CourseInstructorRole,
@@ -29,6 +32,7 @@ from common.djangoapps.student.roles import (
 )
 from common.djangoapps.student.role_helpers import get_course_roles, has_staff_roles
 from common.djangoapps.student.tests.factories import AnonymousUserFactory, InstructorFactory, StaffFactory, UserFactory
+from openedx.core.djangolib.testing.utils import CacheIsolationTestCase
 
 
 class RolesTestCase(TestCase):
@@ -309,3 +313,57 @@ class RoleCacheTestCase(TestCase):  # lint-amnesty, pylint: disable=missing-clas
         assert roles_dict.get('library-v1:edX+quizzes').pop().course_id.course == 'quizzes'
         assert roles_dict.get('course-v1:edX+toy+2012_Summer').pop().course_id.course == 'toy'
         assert roles_dict.get('course-v1:edX+toy2+2013_Fall').pop().course_id.course == 'toy2'
+
+
+class SharedRoleCacheTestCase(CacheIsolationTestCase):
+    """
+    Tests of the roles kept in the shared cache.
+    """
+    ENABLED_CACHES = ['default']
+
+    COURSE_KEY = CourseKey.from_string('course-v1:edX+toy+2012_Fall')
+
+    def setUp(self):
+        super().setUp()
+        self.users = [UserFactory() for __ in range(3)]
+        CourseStaffRole(self.COURSE_KEY).add_users(self.users[0])
+        RequestCache.clear_all_namespaces()
+
+    def test_prefetch_from_shared_cache(self):
+        # One query for the users, one for their roles.
+        with self.assertNumQueries(2):
+            BulkRoleCache.prefetch(User.objects.filter(id__in=[user.id for user in self.users]))
+        RequestCache.clear_all_namespaces()
+
+        users = list(User.objects.filter(id__in=[user.id for user in self.users]).order_by('id'))
+        with self.assertNumQueries(0):
+            BulkRoleCache.prefetch(users)
+            assert [CourseStaffRole(self.COURSE_KEY).has_user(user) for user in users] == [True, False, False]
+
+    def test_prefetched_roles_have_their_user(self):
+        BulkRoleCache.prefetch(self.users)
+        with self.assertNumQueries(0):
+            role, = RoleCache(self.users[0]).all_roles_set
+            assert role.user is self.users[0]
+
+    def test_users_not_kept_in_shared_cache(self):
+        BulkRoleCache.prefetch(self.users)
+        RequestCache.clear_all_namespaces()
+        User.objects.filter(id=self.users[0].id).update(email='changed@example.com')
+
+        user = User.objects.get(id=self.users[0].id)
+        with self.assertNumQueries(0):
+            BulkRoleCache.prefetch([user])
+            role, = RoleCache(user).all_roles_set
+        assert role.user is user
+        assert role.user.email == 'changed@example.com'
+
+    def test_role_changes_invalidate(self):
+        assert RoleCache(self.users[1]).all_roles_set == set()
+        CourseStaffRole(self.COURSE_KEY).add_users(self.users[1])
+        assert RoleCache(self.users[1]).has_role('staff', self.COURSE_KEY, 'edX')
+        with self.assertNumQueries(0):
+            assert RoleCache(self.users[1]).has_role('staff', self.COURSE_KEY, 'edX')
+
+        CourseStaffRole(self.COURSE_KEY).remove_users(self.users[1])
+        assert not RoleCache(self.users[1]).has_role('staff', self.COURSE_KEY, 'edX')
@@ -12,11 +12,21 @@ from django.db import transaction
 from opaque_keys.edx.keys import CourseKey, UsageKey
 
 from lms.djangoapps.ccx.models import CcxFieldOverride, CustomCourseForEdX
-from lms.djangoapps.courseware.field_overrides import FieldOverrideProvider
-from openedx.core.lib.cache_utils import get_cache
+from lms.djangoapps.courseware.field_overrides import (
+    FieldOverrideProvider,
+    clear_overrides_maps,
+    override_location
+)
+from openedx.core.lib.cache_utils import VersionedCache, get_cache
+from xmodule.modulestore.django import modulestore
 
 log = logging.getLogger(__name__)
 
+# Only a safety net for overrides changed without going through this module.
+CCX_OVERLAY_TIMEOUT = 60 * 60 * 24
+# The overlay of each CCX, under the CCX's current version.
+CCX_OVERLAY_CACHE = VersionedCache('ccx.overlay', CCX_OVERLAY_TIMEOUT)
+
 
 class CustomCoursesForEdxOverrideProvider(FieldOverrideProvider):
     """
@@ -48,6 +58,23 @@ class CustomCoursesForEdxOverrideProvider(FieldOverrideProvider):
             return get_override_for_ccx(ccx, block, name, default)
         return default
 
+    def get_overrides_map(self, course_key):
+        """
+        Lists the overrides of the ccx of the course, if it is one.
+        """
+        ccx = get_current_ccx(course_key)
+        if not ccx:
+            return {}
+        overrides_map = {}
+        for location, block_overrides in get_ccx_overlay(ccx).items():
+            for name, value in block_overrides.items():
+                overrides_map.setdefault(name, {})[override_location(location)] = value
+        # As in get_override_for_ccx, the LMS must never link back to Studio. The
+        # setting is inherited, so overriding it on the course block covers all blocks.
+        course_usage_key = modulestore().make_course_usage_key(course_key.to_course_locator())
+        overrides_map.setdefault('course_edit_method', {})[override_location(course_usage_key)] = None
+        return overrides_map
+
     @classmethod
     def enabled_for(cls, block):  # lint-amnesty, pylint: disable=arguments-differ
         """
@@ -81,17 +108,24 @@ def get_override_for_ccx(ccx, block, name, default=None):
     Gets the value of the overridden field for the `ccx`.  `block` and `name`
     specify the block and the name of the field.  If the field is not
     overridden for the given ccx, returns `default`.
+
+    `name` may also be the name of a field followed by "_id" or "_instance",
+    to get the id or the instance of the `CcxFieldOverride` of the field.
     """
-    overrides = _get_overrides_for_ccx(ccx)
+    # Hardcode the course_edit_method to be None instead of 'Studio', so,
+    # the LMS never tries to link back to Studio. CCX courses
+    # can't be edited in Studio.
+    if name == 'course_edit_method':
+        return None
 
     clean_ccx_key = _clean_ccx_key(block.location)
 
-    block_overrides = overrides.get(clean_ccx_key, {})
+    if name.endswith(('_id', '_instance')) and name not in block.fields:
+        overrides = _get_overrides_for_ccx(ccx)
+    else:
+        overrides = get_ccx_overlay(ccx)
 
-    # Hardcode the course_edit_method to be None instead of 'Studio', so,
-    # the LMS never tries to link back to Studio. CCX courses
-    # can't be edited in Studio.
-    block_overrides['course_edit_method'] = None
+    block_overrides = overrides.get(clean_ccx_key, {})
 
     if name in block_overrides:
         try:
@@ -117,10 +151,45 @@ def _clean_ccx_key(block_location):
     return clean_key.version_agnostic().for_branch(None)
 
 
+def invalidate_ccx_overlay(ccx):
+    """
+    Make the overlay of the `ccx` be built again from its overrides, in all processes.
+    """
+    CCX_OVERLAY_CACHE.invalidate(ccx.id)
+    get_cache('ccx-overlay').pop(ccx.id, None)
+
+
+def get_ccx_overlay(ccx):
+    """
+    Returns the overrides of the `ccx`, as a dictionary mapping the location of
+    each overridden block to a dictionary of its overridden field values, in
+    their JSON form.
+
+    Unlike the overrides loaded by `_get_overrides_for_ccx`, the overlay holds
+    nothing but the values, so it is kept in the shared cache under the current
+    version of the CCX, and the overrides are only loaded and decoded once
+    after each change.
+    """
+    def build_overlay():
+        return {
+            location: {
+                name: value for name, value in block_overrides.items()
+                if name + "_instance" in block_overrides
+            }
+            for location, block_overrides in _get_overrides_for_ccx(ccx).items()
+        }
+
+    overlay_cache = get_cache('ccx-overlay')
+    if ccx.id not in overlay_cache:
+        overlay_cache[ccx.id] = CCX_OVERLAY_CACHE.get(ccx.id, build_overlay)
+    return overlay_cache[ccx.id]
+
+
 def _get_overrides_for_ccx(ccx):
     """
     Returns a dictionary mapping field name to overriden value for any
-    overrides set on this block for this CCX.
+    overrides set on this block for this CCX, along with the id and the
+    instance of the `CcxFieldOverride` of each field.
     """
     overrides_cache = get_cache('ccx-overrides')
 
@@ -176,6 +245,8 @@ def override_field_for_ccx(ccx, block, name, value):
 
     _get_overrides_for_ccx(ccx).setdefault(clean_ccx_key, {})[name] = value_json
     _get_overrides_for_ccx(ccx).setdefault(clean_ccx_key, {})[name + "_instance"] = override
+    invalidate_ccx_overlay(ccx)
+    clear_overrides_maps()
 
 
 def clear_override_for_ccx(ccx, block, name):
@@ -209,6 +280,8 @@ def clear_ccx_field_info_from_ccx_map(ccx, block, name):
         ccx_override_map.pop(name + "_instance")
     except KeyError:
         pass
+    invalidate_ccx_overlay(ccx)
+    clear_overrides_maps()
 
 
 def bulk_delete_ccx_override_fields(ccx, ids):
@@ -219,3 +292,7 @@ def bulk_delete_ccx_override_fields(ccx, ids):
     ids = list(set(ids))
     if ids:
         CcxFieldOverride.objects.filter(ccx=ccx, id__in=ids).delete()
+        # The deleted overrides are still in the overrides loaded in this request.
+        get_cache('ccx-overrides').pop(ccx, None)
+        invalidate_ccx_overlay(ccx)
+        clear_overrides_maps()
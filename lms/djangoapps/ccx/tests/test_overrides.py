@@ -15,7 +15,13 @@ from xmodule.modulestore.tests.factories import CourseFactory, BlockFactory
 
 from common.djangoapps.student.tests.factories import AdminFactory
 from lms.djangoapps.ccx.models import CustomCourseForEdX
-from lms.djangoapps.ccx.overrides import override_field_for_ccx
+from lms.djangoapps.ccx.overrides import (
+    _clean_ccx_key,
+    clear_override_for_ccx,
+    get_ccx_overlay,
+    get_override_for_ccx,
+    override_field_for_ccx
+)
 from lms.djangoapps.ccx.tests.utils import flatten, iter_blocks
 from lms.djangoapps.courseware.field_overrides import OverrideFieldData
 from lms.djangoapps.courseware.tests.test_field_overrides import inject_field_overrides
@@ -167,3 +173,36 @@ class TestFieldOverrides(FieldOverrideTestMixin, SharedModuleStoreTestCase):
         override_field_for_ccx(self.ccx, chapter, 'due', ccx_due)
         vertical = chapter.get_children()[0].get_children()[0]
         assert vertical.due == ccx_due
+
+    def test_overlay_reused_across_requests(self):
+        """
+        Test that the overrides are read from the overlay in later requests,
+        without loading them again.
+        """
+        ccx_start = datetime.datetime(2014, 12, 25, 00, 00, tzinfo=pytz.UTC)
+        chapter = self.ccx_course.get_children()[0]
+        override_field_for_ccx(self.ccx, chapter, 'start', ccx_start)
+        RequestCache.clear_all_namespaces()
+
+        with self.assertNumQueries(0):
+            assert get_override_for_ccx(self.ccx, chapter, 'start') == ccx_start
+
+    def test_overlay_updated_on_override(self):
+        """
+        Test that the overlay of later requests has the overrides set or
+        cleared since it was built.
+        """
+        ccx_start = datetime.datetime(2014, 12, 25, 00, 00, tzinfo=pytz.UTC)
+        chapter = self.ccx_course.get_children()[0]
+        override_field_for_ccx(self.ccx, chapter, 'start', ccx_start)
+        RequestCache.clear_all_namespaces()
+        assert get_override_for_ccx(self.ccx, chapter, 'start') == ccx_start
+
+        override_field_for_ccx(self.ccx, chapter, 'due', ccx_start)
+        RequestCache.clear_all_namespaces()
+        assert get_override_for_ccx(self.ccx, chapter, 'due') == ccx_start
+
+        clear_override_for_ccx(self.ccx, chapter, 'start')
+        RequestCache.clear_all_namespaces()
+        assert get_override_for_ccx(self.ccx, chapter, 'start') is None
+        assert 'start' not in get_ccx_overlay(self.ccx).get(_clean_ccx_key(chapter.location), {})
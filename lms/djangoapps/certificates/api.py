@@ -40,6 +40,7 @@ from lms.djangoapps.certificates.models import (
 )
 from lms.djangoapps.certificates.utils import certificate_status as _certificate_status
 from lms.djangoapps.certificates.utils import certificate_status_for_student as _certificate_status_for_student
+from lms.djangoapps.certificates.utils import certificate_statuses_for_student as _certificate_statuses_for_student
 from lms.djangoapps.certificates.utils import get_certificate_url as _get_certificate_url
 from lms.djangoapps.certificates.utils import has_html_certificates_enabled as _has_html_certificates_enabled
 from lms.djangoapps.certificates.utils import should_certificate_be_visible as _should_certificate_be_visible
@@ -808,6 +809,11 @@ def certificate_status_for_student(student, course_id):
     return _certificate_status_for_student(student, course_id)
 
 
+def certificate_statuses_for_student(student, course_ids):
+    """Returns a dictionary of course_id -> certificate status for each of the given courses."""
+    return _certificate_statuses_for_student(student, course_ids)
+
+
 def auto_certificate_generation_enabled():
     return _AUTO_CERTIFICATE_GENERATION.is_enabled()
 
@@ -8,7 +8,15 @@ import ddt
 from django.test import TestCase
 from pytz import utc
 
-from lms.djangoapps.certificates.utils import has_html_certificates_enabled, should_certificate_be_visible
+from common.djangoapps.student.tests.factories import UserFactory
+from lms.djangoapps.certificates.data import CertificateStatuses
+from lms.djangoapps.certificates.models import GeneratedCertificate
+from lms.djangoapps.certificates.tests.factories import GeneratedCertificateFactory
+from lms.djangoapps.certificates.utils import (
+    certificate_statuses_for_student,
+    has_html_certificates_enabled,
+    should_certificate_be_visible
+)
 from openedx.core.djangoapps.content.course_overviews.tests.factories import CourseOverviewFactory
 from xmodule.data import CertificatesDisplayBehaviors  # lint-amnesty, pylint: disable=wrong-import-order
 
@@ -96,3 +104,22 @@ class CertificateUtilityTests(TestCase):
             certificate_available_date,
             self_paced
         ) == expected_value
+
+    def test_certificate_statuses_for_student(self):
+        """
+        Test that certificate statuses for several courses are looked up with a single query.
+        """
+        user = UserFactory()
+        other_course_overview = CourseOverviewFactory.create()
+        GeneratedCertificateFactory(
+            user=user,
+            course_id=self.course_overview.id,
+            status=CertificateStatuses.downloadable,
+            mode=GeneratedCertificate.MODES.verified,
+        )
+
+        with self.assertNumQueries(1):
+            statuses = certificate_statuses_for_student(user, [self.course_overview.id, other_course_overview.id])
+
+        assert statuses[self.course_overview.id]['status'] == CertificateStatuses.downloadable
+        assert statuses[other_course_overview.id]['status'] == CertificateStatuses.unavailable
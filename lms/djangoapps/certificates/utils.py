@@ -221,6 +221,23 @@ def certificate_status_for_student(student, course_id):
     return certificate_status(generated_certificate)
 
 
+def certificate_statuses_for_student(student, course_ids):
+    """
+    Bulk version of certificate_status_for_student.
+
+    Returns a dictionary of course_id -> certificate status dictionary for every
+    course in `course_ids`, using a single query for the certificates.
+    """
+    generated_certificates = {
+        cert.course_id: cert
+        for cert in GeneratedCertificate.objects.filter(user=student, course_id__in=course_ids)
+    }
+    return {
+        course_id: certificate_status(generated_certificates.get(course_id))
+        for course_id in course_ids
+    }
+
+
 def get_preferred_certificate_name(user):
     """
     If the verified name feature is enabled and the user has their preference set to use their
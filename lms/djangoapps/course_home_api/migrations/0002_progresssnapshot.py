@@ -0,0 +1,32 @@
+# Generated by Django 4.2.23 on 2026-10-19 18:13
+
+from django.db import migrations, models
+import django.utils.timezone
+import model_utils.fields
+import opaque_keys.edx.django.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('course_home_api', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProgressSnapshot',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', model_utils.fields.AutoCreatedField(default=django.utils.timezone.now, editable=False, verbose_name='created')),
+                ('modified', model_utils.fields.AutoLastModifiedField(default=django.utils.timezone.now, editable=False, verbose_name='modified')),
+                ('user_id', models.IntegerField()),
+                ('course_id', opaque_keys.edx.django.models.CourseKeyField(max_length=255)),
+                ('course_version', models.CharField(blank=True, max_length=255, verbose_name='Course content version identifier')),
+                ('valid_until', models.DateTimeField(verbose_name='Date after which the snapshot must be computed again')),
+                ('document', models.JSONField()),
+            ],
+            options={
+                'unique_together': {('course_id', 'user_id')},
+            },
+        ),
+    ]
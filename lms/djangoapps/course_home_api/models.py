@@ -4,6 +4,8 @@ Course home api models file
 
 from django.db import models
 from django.utils.translation import gettext_lazy as _
+from model_utils.models import TimeStampedModel
+from opaque_keys.edx.django.models import CourseKeyField
 
 from openedx.core.djangoapps.config_model_utils.models import StackedConfigurationModel
 
@@ -25,3 +27,27 @@ class DisableProgressPageStackedConfig(StackedConfigurationModel):
         return "DisableProgressPageStackedConfig(disabled={!r})".format(
             self.disabled
         )
+
+
+class ProgressSnapshot(TimeStampedModel):
+    """
+    The grades of a learner in a course, as shown on the progress tab.
+
+    A snapshot is deleted whenever the grades of the learner in the course change, and
+    is only used for the course version it was computed for, until its valid_until date.
+
+    .. no_pii:
+    """
+    class Meta:
+        unique_together = [
+            ('course_id', 'user_id'),
+        ]
+
+    user_id = models.IntegerField(blank=False)
+    course_id = CourseKeyField(blank=False, max_length=255)
+    course_version = models.CharField('Course content version identifier', blank=True, max_length=255)
+    valid_until = models.DateTimeField('Date after which the snapshot must be computed again')
+    document = models.JSONField()
+
+    def __str__(self):
+        return f"ProgressSnapshot(user_id={self.user_id}, course_id={self.course_id})"
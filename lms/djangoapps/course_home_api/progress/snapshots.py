@@ -0,0 +1,190 @@
+"""
+Snapshots of the grades learners see on the progress tab.
+
+Computing the grades of a learner reads their persisted grades and walks the block
+structure of the course, which makes the progress tab one of the most expensive pages
+of the courseware. The grades shown on it are stored in a ProgressSnapshot when they
+are computed, and read from it until they change: the snapshot of a learner is deleted
+by the grade signals, and it is only used for the course version it was computed for.
+
+The grades that are visible to a learner also depend on the time, through start and due
+dates, so a snapshot is only used until the next of those dates. Snapshots are never used
+for staff, whose grades don't hide anything.
+
+Most courses never store a snapshot, so the time the first snapshot of a course is saved
+is kept in the cache, and the grade signals of courses without it don't query the
+database. Snapshots saved before that time are not used, in case it was evicted while
+their grades changed.
+"""
+from collections import namedtuple
+from datetime import datetime, timedelta
+
+from django.core.cache import cache
+from django.utils.timezone import now
+from opaque_keys.edx.keys import UsageKey
+
+from lms.djangoapps.course_home_api.models import ProgressSnapshot
+from xmodule.graders import ShowCorrectness
+
+# The longest a snapshot is used. Dates can change without the grades changing, e.g. when the
+# due dates of a learner are extended, and a snapshot may be saved by a request which read the
+# grades just before they changed.
+PROGRESS_SNAPSHOT_MAX_AGE = timedelta(hours=1)
+
+# The time since which snapshots are saved in a course.
+PROGRESS_SNAPSHOTS_SINCE_KEY = 'course_home_api.progress_snapshots.since.{course_key}'
+
+CourseGradeSnapshot = namedtuple('CourseGradeSnapshot', ['letter_grade', 'percent', 'passed'])
+ScoreSnapshot = namedtuple('ScoreSnapshot', ['earned', 'possible'])
+OverrideSnapshot = namedtuple('OverrideSnapshot', ['system', 'override_reason'])
+
+
+class SubsectionGradeSnapshot:
+    """
+    The grade of a subsection in a snapshot, with the attributes of SubsectionGrade that
+    the progress tab uses.
+    """
+    def __init__(self, data):
+        self.location = UsageKey.from_string(data['location'])
+        self.display_name = data['display_name']
+        self.format = data['format']
+        self.graded = data['graded']
+        self.due = _parse_datetime(data['due'])
+        self.end = _parse_datetime(data['end'])
+        self.self_paced = data['self_paced']
+        self.hide_after_due = data['hide_after_due']
+        self.show_correctness = data['show_correctness']
+        self.graded_total = ScoreSnapshot(*data['graded_total'])
+        self.percent_graded = data['percent_graded']
+        self.problem_scores = {
+            block_key: ScoreSnapshot(earned, possible) for block_key, earned, possible in data['problem_scores']
+        }
+        self.override = OverrideSnapshot(*data['override']) if data['override'] else None
+
+    def show_grades(self, has_staff_access):
+        """
+        Returns whether subsection scores are currently available to users with or without staff access.
+        """
+        return ShowCorrectness.correctness_available(self.show_correctness, self.due, has_staff_access)
+
+    @staticmethod
+    def serialize(subsection_grade):
+        """
+        Returns the data of a SubsectionGrade stored in a snapshot.
+        """
+        override = subsection_grade.override
+        return {
+            'location': str(subsection_grade.location),
+            'display_name': subsection_grade.display_name,
+            'format': subsection_grade.format,
+            'graded': subsection_grade.graded,
+            'due': _serialize_datetime(subsection_grade.due),
+            'end': _serialize_datetime(subsection_grade.end),
+            'self_paced': subsection_grade.self_paced,
+            'hide_after_due': subsection_grade.hide_after_due,
+            'show_correctness': subsection_grade.show_correctness,
+            'graded_total': [subsection_grade.graded_total.earned, subsection_grade.graded_total.possible],
+            'percent_graded': subsection_grade.percent_graded,
+            # A list rather than an object, as the order of the keys of JSON objects isn't kept by all databases.
+            'problem_scores': [
+                [str(block_key), score.earned, score.possible]
+                for block_key, score in subsection_grade.problem_scores.items()
+            ],
+            'override': [override.system, override.override_reason] if override else None,
+        }
+
+
+def _serialize_datetime(value):
+    return value.isoformat() if value else None
+
+
+def _parse_datetime(value):
+    return datetime.fromisoformat(value) if value else None
+
+
+def get_progress_snapshot(user, course_key, course_version):
+    """
+    Returns the course grade and the section scores of the snapshot of the user in the
+    course, or None if there is no snapshot that can be used.
+
+    The section scores are in the form of `CourseGrade.chapter_grades`.
+    """
+    snapshots_since = cache.get(PROGRESS_SNAPSHOTS_SINCE_KEY.format(course_key=course_key))
+    if snapshots_since is None:
+        return None
+
+    snapshot = ProgressSnapshot.objects.filter(
+        user_id=user.id,
+        course_id=course_key,
+        course_version=course_version,
+        valid_until__gt=now(),
+        modified__gte=snapshots_since,
+    ).first()
+    if snapshot is None:
+        return None
+
+    document = snapshot.document
+    section_scores = [
+        {
+            'display_name': section['display_name'],
+            'sections': [SubsectionGradeSnapshot(subsection) for subsection in section['subsections']],
+        }
+        for section in document['section_scores']
+    ]
+    return CourseGradeSnapshot(**document['course_grade']), section_scores
+
+
+def save_progress_snapshot(user, course_key, course_version, course_grade, collected_block_structure):
+    """
+    Saves the snapshot of the user in the course, from their visible `course_grade`.
+
+    The snapshot is used until the next start or due date of the course, which may make
+    more grades visible.
+    """
+    current_time = now()
+    next_dates = [
+        date for date in (
+            collected_block_structure.get_xblock_field(block_key, 'start')
+            for block_key in collected_block_structure
+        )
+        if date and date > current_time
+    ]
+    section_scores = []
+    for chapter in course_grade.chapter_grades.values():
+        section_scores.append({
+            'display_name': chapter['display_name'],
+            'subsections': [SubsectionGradeSnapshot.serialize(subsection) for subsection in chapter['sections']],
+        })
+        next_dates.extend(
+            subsection.due for subsection in chapter['sections']
+            if subsection.due and subsection.due > current_time
+        )
+
+    valid_until = min(next_dates + [current_time + PROGRESS_SNAPSHOT_MAX_AGE])
+    cache.add(PROGRESS_SNAPSHOTS_SINCE_KEY.format(course_key=course_key), current_time, None)
+    ProgressSnapshot.objects.update_or_create(
+        user_id=user.id,
+        course_id=course_key,
+        defaults={
+            'course_version': course_version,
+            'valid_until': valid_until,
+            'document': {
+                'course_grade': {
+                    'letter_grade': course_grade.letter_grade,
+                    'percent': course_grade.percent,
+                    'passed': course_grade.passed,
+                },
+                'section_scores': section_scores,
+            },
+        },
+    )
+
+
+def delete_progress_snapshot(user_id, course_key):
+    """
+    Deletes the snapshot of the user in the course, so that their grades are computed
+    again the next time they are shown.
+    """
+    if cache.get(PROGRESS_SNAPSHOTS_SINCE_KEY.format(course_key=course_key)) is None:
+        return
+    ProgressSnapshot.objects.filter(user_id=user_id, course_id=course_key).delete()
@@ -10,6 +10,7 @@ import ddt
 from django.urls import reverse
 from django.utils.timezone import now
 from edx_toggles.toggles.testutils import override_waffle_flag
+from opaque_keys.edx.keys import CourseKey
 from pytz import UTC
 from xmodule.modulestore.tests.factories import BlockFactory
 
@@ -17,8 +18,15 @@ from common.djangoapps.course_modes.models import CourseMode
 from common.djangoapps.student.models import CourseEnrollment
 from common.djangoapps.student.tests.factories import UserFactory
 from lms.djangoapps.course_home_api.tests.utils import BaseCourseHomeTests
-from lms.djangoapps.course_home_api.models import DisableProgressPageStackedConfig
-from lms.djangoapps.course_home_api.toggles import COURSE_HOME_MICROFRONTEND_PROGRESS_TAB
+from lms.djangoapps.course_home_api.models import DisableProgressPageStackedConfig, ProgressSnapshot
+from lms.djangoapps.course_home_api.signals import (
+    delete_progress_snapshot_on_grade_change,
+    delete_progress_snapshot_on_score_change,
+)
+from lms.djangoapps.course_home_api.toggles import (
+    COURSE_HOME_MICROFRONTEND_PROGRESS_TAB,
+    COURSE_HOME_PROGRESS_SNAPSHOTS,
+)
 from lms.djangoapps.grades.api import CourseGradeFactory
 from lms.djangoapps.grades.constants import GradeOverrideFeatureEnum
 from lms.djangoapps.grades.models import (
@@ -314,3 +322,43 @@ class ProgressTabTestViews(BaseCourseHomeTests):
         assert response.status_code == 200
         assert response.data['course_grade']['percent'] == expected_percent
         assert response.data['course_grade']['is_passing'] == (expected_percent >= 0.5)
+
+    @override_waffle_flag(COURSE_HOME_PROGRESS_SNAPSHOTS, active=True)
+    def test_progress_snapshot(self):
+        CourseEnrollment.enroll(self.user, self.course.id)
+        with self.store.bulk_operations(self.course.id):
+            problem = self.add_subsection_with_problem(format='Homework', due=now() + timedelta(days=1))
+            self.add_subsection_with_problem(format='Homework')
+
+        response = self.client.get(self.url)
+        assert response.status_code == 200
+        snapshot = ProgressSnapshot.objects.get(user_id=self.user.id, course_id=self.course.id)
+        assert snapshot.valid_until <= now() + timedelta(days=1)
+
+        with patch.object(CourseGradeFactory, 'read') as mock_read:
+            snapshot_response = self.client.get(self.url)
+        mock_read.assert_not_called()
+        assert snapshot_response.data['course_grade'] == response.data['course_grade']
+        assert snapshot_response.data['section_scores'] == response.data['section_scores']
+
+        # Answering a problem deletes the snapshot, so the new grade is shown.
+        answer_problem(self.course, get_mock_request(self.user), problem)
+        assert not ProgressSnapshot.objects.filter(user_id=self.user.id, course_id=self.course.id).exists()
+        response = self.client.get(self.url)
+        assert response.data['course_grade']['percent'] > 0
+        assert response.data['section_scores'] != snapshot_response.data['section_scores']
+
+    def test_progress_snapshot_not_deleted_in_course_without_snapshots(self):
+        course_key = CourseKey.from_string('course-v1:edX+NoSnapshots+Run')
+        with self.assertNumQueries(0):
+            delete_progress_snapshot_on_score_change(sender=None, user_id=self.user.id, course_id=str(course_key))
+            delete_progress_snapshot_on_grade_change(sender=None, user=self.user, course_key=course_key)
+
+    @override_waffle_flag(COURSE_HOME_PROGRESS_SNAPSHOTS, active=True)
+    def test_progress_snapshot_not_used_for_staff(self):
+        self.switch_to_staff()
+        CourseEnrollment.enroll(self.user, self.course.id)
+
+        response = self.client.get(self.url)
+        assert response.status_code == 200
+        assert not ProgressSnapshot.objects.filter(user_id=self.user.id, course_id=self.course.id).exists()
@@ -15,7 +15,11 @@ from rest_framework.response import Response
 from xmodule.modulestore.django import modulestore
 from common.djangoapps.student.models import CourseEnrollment
 from lms.djangoapps.course_home_api.progress.serializers import ProgressTabSerializer
-from lms.djangoapps.course_home_api.toggles import course_home_mfe_progress_tab_is_active
+from lms.djangoapps.course_home_api.progress.snapshots import get_progress_snapshot, save_progress_snapshot
+from lms.djangoapps.course_home_api.toggles import (
+    course_home_mfe_progress_tab_is_active,
+    progress_snapshots_are_enabled,
+)
 from lms.djangoapps.courseware.access import has_access, has_ccx_coach_role
 from lms.djangoapps.course_blocks.api import get_course_blocks
 from lms.djangoapps.course_blocks.transformers import start_date
@@ -204,10 +208,32 @@ class ProgressTabView(RetrieveAPIView):
         # The block structure is used for both the course_grade and has_scheduled content fields
         # So it is called upfront and reused for optimization purposes
         collected_block_structure = get_block_structure_manager(course_key).get_collected()
-        course_grade = CourseGradeFactory().read(student, collected_block_structure=collected_block_structure)
 
-        # recalculate course grade from visible grades (stored grade was calculated over all grades, visible or not)
-        course_grade.update(visible_grades_only=True, has_staff_access=is_staff)
+        # Learners viewing their own progress get the snapshot of their grades, if one is still valid.
+        course_version = getattr(course, 'course_version', None)
+        use_progress_snapshot = bool(
+            course_version and
+            not is_staff and
+            student.id == request.user.id and
+            progress_snapshots_are_enabled(course_key)
+        )
+        progress_snapshot = None
+        if use_progress_snapshot:
+            progress_snapshot = get_progress_snapshot(student, course_key, str(course_version))
+        monitoring_utils.set_custom_attribute('progress_snapshot_used', progress_snapshot is not None)
+
+        if progress_snapshot:
+            course_grade, section_scores = progress_snapshot
+        else:
+            course_grade = CourseGradeFactory().read(student, collected_block_structure=collected_block_structure)
+
+            # recalculate course grade from visible grades (stored grade was calculated over all grades, visible or not)
+            course_grade.update(visible_grades_only=True, has_staff_access=is_staff)
+            section_scores = list(course_grade.chapter_grades.values())
+            if use_progress_snapshot:
+                save_progress_snapshot(
+                    student, course_key, str(course_version), course_grade, collected_block_structure,
+                )
 
         # Get has_scheduled_content data
         transformers = BlockStructureTransformers()
@@ -255,7 +281,7 @@ class ProgressTabView(RetrieveAPIView):
             'enrollment_mode': enrollment_mode,
             'grading_policy': grading_policy,
             'has_scheduled_content': has_scheduled_content,
-            'section_scores': list(course_grade.chapter_grades.values()),
+            'section_scores': section_scores,
             'studio_url': get_studio_url(course, 'settings/grading'),
             'username': username,
             'user_has_passing_grade': user_has_passing_grade,
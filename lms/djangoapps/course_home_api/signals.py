@@ -0,0 +1,28 @@
+"""
+Signal handlers of the course home API.
+"""
+from django.dispatch import receiver
+from opaque_keys.edx.keys import CourseKey
+
+from lms.djangoapps.course_home_api.progress.snapshots import delete_progress_snapshot
+from lms.djangoapps.grades.api import signals as grades_signals
+from openedx.core.djangoapps.signals.signals import COURSE_GRADE_CHANGED
+
+
+@receiver(grades_signals.PROBLEM_WEIGHTED_SCORE_CHANGED)
+def delete_progress_snapshot_on_score_change(sender, user_id, course_id, **kwargs):  # pylint: disable=unused-argument
+    """
+    Deletes the progress snapshot of the learner as soon as one of their scores changes,
+    as their grades may be shown before they are recalculated.
+    """
+    delete_progress_snapshot(user_id, CourseKey.from_string(str(course_id)))
+
+
+@receiver(COURSE_GRADE_CHANGED)
+def delete_progress_snapshot_on_grade_change(sender, user, course_key, **kwargs):  # pylint: disable=unused-argument
+    """
+    Deletes the progress snapshot of the learner when their course grade is recalculated,
+    e.g. after a subsection grade or grade override changes, or after their enrollment
+    track or cohort changes.
+    """
+    delete_progress_snapshot(user.id, course_key)
@@ -51,6 +51,22 @@ COURSE_HOME_SEND_COURSE_PROGRESS_ANALYTICS_FOR_STUDENT = CourseWaffleFlag(
 )
 
 
+# Waffle flag to enable the snapshots of the grades shown on the progress tab.
+#
+# .. toggle_name: course_home.progress_snapshots
+# .. toggle_implementation: CourseWaffleFlag
+# .. toggle_default: False
+# .. toggle_description: When enabled, the grades a learner sees on the progress tab are stored in a snapshot
+#   when they are computed, and read from it until a grade of the learner changes, the course is published,
+#   or a start or due date of the course passes. Staff viewing the progress tab always get computed grades.
+# .. toggle_use_cases: opt_in
+# .. toggle_creation_date: 2026-10-19
+# .. toggle_target_removal_date: None
+COURSE_HOME_PROGRESS_SNAPSHOTS = CourseWaffleFlag(
+    f'{WAFFLE_FLAG_NAMESPACE}.progress_snapshots', __name__
+)
+
+
 def course_home_mfe_progress_tab_is_active(course_key):
     # Avoiding a circular dependency
     from .models import DisableProgressPageStackedConfig
@@ -73,3 +89,10 @@ def send_course_progress_analytics_for_student_is_enabled(course_key):
     Returns True if the course completion analytics feature is enabled for a given course.
     """
     return COURSE_HOME_SEND_COURSE_PROGRESS_ANALYTICS_FOR_STUDENT.is_enabled(course_key)
+
+
+def progress_snapshots_are_enabled(course_key):
+    """
+    Returns True if the grades shown on the progress tab of the course are stored in snapshots.
+    """
+    return COURSE_HOME_PROGRESS_SNAPSHOTS.is_enabled(course_key)
@@ -187,6 +187,76 @@ def has_access(user, action, obj, course_key=None):
                     .format(type(obj)))
 
 
+def has_access_to_blocks(user, action, blocks, course_key):
+    """
+    Check whether a user has the access to do action on each of blocks, all of
+    which are in the course run course_key.
+
+    This is equivalent to calling has_access for each block, but works out the
+    user's course role, staff and instructor access and partition groups only
+    once for all of the blocks.
+
+    Returns a dict mapping the location of each block to an AccessResponse.
+    """
+    if not user:
+        user = AnonymousUser()
+
+    access_cache = _CourseAccessCache(user, course_key)
+    access_responses = {}
+    for block in blocks:
+        if isinstance(block, CourseBlock):
+            access_response = _has_access_course(user, action, block)
+        elif isinstance(block, ErrorBlock):
+            access_response = _has_access_error_block(user, action, block, course_key, access_cache)
+        elif isinstance(block, XBlock):
+            access_response = _has_access_to_block(user, action, block, course_key, access_cache)
+        else:
+            raise TypeError("Unknown object type in has_access_to_blocks(): '{}'".format(type(block)))
+        access_responses[block.location] = access_response
+    return access_responses
+
+
+class _CourseAccessCache:
+    """
+    The parts of the access of a user to the blocks of a course run which don't
+    depend on the block, each worked out the first time it's needed.
+    """
+    def __init__(self, user, course_key):
+        self.user = user
+        self.course_key = course_key
+        self._user_role = None
+        self._access_to_course = {}
+        self._user_groups = {}
+
+    def user_role(self):
+        """
+        Return the role of the user in the course, as get_user_role.
+        """
+        if self._user_role is None:
+            self._user_role = get_user_role(self.user, self.course_key)
+        return self._user_role
+
+    def has_access_to_course(self, access_level):
+        """
+        Return whether the user has access_level (staff or instructor) access to the course.
+        """
+        if access_level not in self._access_to_course:
+            self._access_to_course[access_level] = _has_access_to_course(self.user, access_level, self.course_key)
+        return self._access_to_course[access_level]
+
+    def user_group(self, partition):
+        """
+        Return the group of the user in partition.
+        """
+        if partition.id not in self._user_groups:
+            self._user_groups[partition.id] = partition.scheme.get_group_for_user(
+                self.course_key,
+                self.user,
+                partition,
+            )
+        return self._user_groups[partition.id]
+
+
 def has_staff_access_to_preview_mode(user, course_key):
     """
     Checks if given user can access course in preview mode.
@@ -444,7 +514,7 @@ def _has_access_course(user, action, courselike):
     return _dispatch(checkers, action, user, courselike)
 
 
-def _has_access_error_block(user, action, block, course_key):
+def _has_access_error_block(user, action, block, course_key, access_cache=None):
     """
     Only staff should see error blocks.
 
@@ -453,24 +523,25 @@ def _has_access_error_block(user, action, block, course_key):
     'staff' -- staff access to block.
     """
     def check_for_staff():
-        return _has_staff_access_to_block(user, block, course_key)
+        return _has_staff_access_to_block(user, block, course_key, access_cache)
 
     checkers = {
         'load': check_for_staff,
         'staff': check_for_staff,
-        'instructor': lambda: _has_instructor_access_to_block(user, block, course_key)
+        'instructor': lambda: _has_instructor_access_to_block(user, block, course_key, access_cache)
     }
 
     return _dispatch(checkers, action, user, block)
 
 
-def _has_group_access(block, user, course_key):
+def _has_group_access(block, user, course_key, access_cache=None):
     """
     This function returns a boolean indicating whether or not `user` has
     sufficient group memberships to "load" a block
     """
     # Allow staff and instructors roles group access, as they are not masquerading as a student.
-    if get_user_role(user, course_key) in ['staff', 'instructor']:
+    user_role = access_cache.user_role() if access_cache else get_user_role(user, course_key)
+    if user_role in ['staff', 'instructor']:
         return ACCESS_GRANTED
 
     # use merged_group_access which takes group access on the block's
@@ -531,11 +602,14 @@ def _has_group_access(block, user, course_key):
     missing_groups = []
     block_key = block.scope_ids.usage_id
     for partition, groups in partition_groups:
-        user_group = partition.scheme.get_group_for_user(
-            course_key,
-            user,
-            partition,
-        )
+        if access_cache:
+            user_group = access_cache.user_group(partition)
+        else:
+            user_group = partition.scheme.get_group_for_user(
+                course_key,
+                user,
+                partition,
+            )
         if user_group not in groups:
             missing_groups.append((
                 partition,
@@ -562,7 +636,7 @@ def _has_group_access(block, user, course_key):
     return ACCESS_GRANTED
 
 
-def _has_access_to_block(user, action, block, course_key=None):
+def _has_access_to_block(user, action, block, course_key=None, access_cache=None):
     """
     Check if user has access to this block.
 
@@ -585,12 +659,12 @@ def _has_access_to_block(user, action, block, course_key=None):
         # access to this content, then deny access. The problem with calling _has_staff_access_to_block
         # before this method is that _has_staff_access_to_block short-circuits and returns True
         # for staff users in preview mode.
-        group_access_response = _has_group_access(block, user, course_key)
+        group_access_response = _has_group_access(block, user, course_key, access_cache)
         if not group_access_response:
             return group_access_response
 
         # If the user has staff access, they can load the block and checks below are not needed.
-        staff_access_response = _has_staff_access_to_block(user, block, course_key)
+        staff_access_response = _has_staff_access_to_block(user, block, course_key, access_cache)
         if staff_access_response:
             return staff_access_response
 
@@ -610,8 +684,8 @@ def _has_access_to_block(user, action, block, course_key=None):
 
     checkers = {
         'load': can_load,
-        'staff': lambda: _has_staff_access_to_block(user, block, course_key),
-        'instructor': lambda: _has_instructor_access_to_block(user, block, course_key)
+        'staff': lambda: _has_staff_access_to_block(user, block, course_key, access_cache),
+        'instructor': lambda: _has_instructor_access_to_block(user, block, course_key, access_cache)
     }
 
     return _dispatch(checkers, action, user, block)
@@ -783,22 +857,26 @@ def administrative_accesses_to_course_for_user(user, course_key):
 
 
 @function_trace('_has_instructor_access_to_block')
-def _has_instructor_access_to_block(user, block, course_key):
+def _has_instructor_access_to_block(user, block, course_key, access_cache=None):
     """Helper method that checks whether the user has staff access to
     the course of the location.
 
     block: something that has a location attribute
     """
+    if access_cache:
+        return access_cache.has_access_to_course('instructor')
     return _has_instructor_access_to_location(user, block.location, course_key)
 
 
 @function_trace('_has_staff_access_to_block')
-def _has_staff_access_to_block(user, block, course_key):
+def _has_staff_access_to_block(user, block, course_key, access_cache=None):
     """Helper method that checks whether the user has staff access to
     the course of the location.
 
     block: something that has a location attribute
     """
+    if access_cache:
+        return access_cache.has_access_to_course('staff')
     return _has_staff_access_to_location(user, block.location, course_key)
 
 
@@ -112,6 +112,42 @@ log = logging.getLogger(__name__)
 # coupled enough that it's kind of tricky--you've been warned!
 
 
+# Request cache namespace of the runtime parts prepared for a user, shared by the runtimes of the blocks of a request.
+PREPARED_RUNTIMES_NAMESPACE = 'courseware.block_render.prepared_runtimes'
+
+
+class _LazyService:
+    """
+    A runtime service created by `factory` when it is first requested.
+    """
+    _NOT_CREATED = object()
+
+    def __init__(self, factory):
+        self._factory = factory
+        self._service = self._NOT_CREATED
+
+    def get(self):
+        """
+        Return the service, creating it if needed.
+        """
+        if self._service is self._NOT_CREATED:
+            self._service = self._factory()
+        return self._service
+
+
+class _LazyServices(dict):
+    """
+    The services of a runtime, where the services prepared for a user are created when first requested.
+    """
+    def __getitem__(self, name):
+        service = super().__getitem__(name)
+        return service.get() if isinstance(service, _LazyService) else service
+
+    def get(self, name, default=None):
+        service = super().get(name, default)
+        return service.get() if isinstance(service, _LazyService) else service
+
+
 class LmsModuleRenderError(Exception):
     """
     An exception class for exceptions thrown by block_render that don't fit well elsewhere
@@ -510,6 +546,9 @@ def prepare_runtime_for_user(
     and student_data, and those don't and are used to instantiate the service required in LMS, which
     are all the other arguments.
 
+    The wrappers and services of the runtime are prepared once per request for the user and these arguments, and
+    the services are only created when first requested.
+
     Arguments:
         see arguments for get_block()
         request_token (str): A token unique to the request use by xblock initialization
@@ -539,6 +578,61 @@ def prepare_runtime_for_user(
             will_recheck_access=will_recheck_access,
         )
 
+    # The wrappers and services depend only on the user and the arguments below, so the runtimes of all the blocks
+    # bound in a request share them. Requests make their track functions the same way, so it's not part of the key.
+    prepared_runtimes = RequestCache(PREPARED_RUNTIMES_NAMESPACE).data if request_token else {}
+    prepared_runtime_key = (
+        user.id, course_id, request_token, position, wrap_xblock_display, grade_bucket_type, static_asset_path,
+        user_location, disable_staff_debug_info, will_recheck_access,
+    )
+    if prepared_runtime_key not in prepared_runtimes:
+        prepared_runtimes[prepared_runtime_key] = _prepare_runtime_parts_for_user(
+            user=user,
+            course_id=course_id,
+            track_function=track_function,
+            request_token=request_token,
+            position=position,
+            wrap_xblock_display=wrap_xblock_display,
+            grade_bucket_type=grade_bucket_type,
+            static_asset_path=static_asset_path,
+            user_location=user_location,
+            disable_staff_debug_info=disable_staff_debug_info,
+            will_recheck_access=will_recheck_access,
+        )
+    block_wrappers, services = prepared_runtimes[prepared_runtime_key]
+
+    runtime.get_block_for_descriptor = inner_get_block
+
+    runtime.wrappers = list(block_wrappers)
+    # pylint: disable=protected-access
+    if not isinstance(runtime._services, _LazyServices):
+        # The runtime starts with the services dict of its modulestore, which must not get the services of a user.
+        runtime._services = _LazyServices(runtime._services)
+    runtime._services.update(services)
+    runtime.request_token = request_token
+    runtime.wrap_asides_override = lms_wrappers_aside
+    runtime.applicable_aside_types_override = lms_applicable_aside_types
+
+
+def _prepare_runtime_parts_for_user(
+    user: User | AnonymousUser,
+    course_id: CourseKey,
+    track_function: Callable[[str, dict], None],
+    request_token: str,
+    position: int | None,
+    wrap_xblock_display: bool,
+    grade_bucket_type: str | None,
+    static_asset_path: str,
+    user_location: str | None,
+    disable_staff_debug_info: bool,
+    will_recheck_access: bool,
+):
+    """
+    Return the block wrappers and the services of a runtime prepared for the user, the services being created
+    when they are first requested.
+
+    See prepare_runtime_for_user() for the arguments.
+    """
     # Build a list of wrapping functions that will be applied in order
     # to the Fragment content coming out of the xblocks that are about to be rendered.
     block_wrappers = []
@@ -585,10 +679,10 @@ def prepare_runtime_for_user(
 
     store = modulestore()
 
-    services = {
-        'fs': FSService(),
-        'mako': mako_service,
-        'user': DjangoXBlockUserService(
+    service_factories = {
+        'fs': FSService,
+        'mako': lambda: mako_service,
+        'user': lambda: DjangoXBlockUserService(
             user,
             user_is_beta_tester=CourseBetaTesterRole(course_id).has_user(user),
             user_is_staff=user_is_staff,
@@ -599,20 +693,20 @@ def prepare_runtime_for_user(
             deprecated_anonymous_user_id=anonymous_id_for_user(user, None),
             request_country_code=user_location,
         ),
-        'verification': XBlockVerificationService(),
-        'proctoring': ProctoringService(),
-        'milestones': milestones_helpers.get_service(),
-        'credit': CreditService(),
-        'bookmarks': BookmarksService(user=user),
-        'gating': GatingService(),
-        'grade_utils': GradesUtilService(course_id=course_id),
-        'user_state': UserStateService(),
-        'content_type_gating': ContentTypeGatingService(),
-        'cache': CacheService(cache),
-        'sandbox': SandboxService(contentstore=contentstore, course_id=course_id),
-        'replace_urls': replace_url_service,
+        'verification': XBlockVerificationService,
+        'proctoring': ProctoringService,
+        'milestones': milestones_helpers.get_service,
+        'credit': CreditService,
+        'bookmarks': lambda: BookmarksService(user=user),
+        'gating': GatingService,
+        'grade_utils': lambda: GradesUtilService(course_id=course_id),
+        'user_state': UserStateService,
+        'content_type_gating': ContentTypeGatingService,
+        'cache': lambda: CacheService(cache),
+        'sandbox': lambda: SandboxService(contentstore=contentstore, course_id=course_id),
+        'replace_urls': lambda: replace_url_service,
         # Rebind module service to deal with noauth modules getting attached to users.
-        'rebind_user': RebindUserService(
+        'rebind_user': lambda: RebindUserService(
             user,
             course_id,
             track_function=track_function,
@@ -624,26 +718,23 @@ def prepare_runtime_for_user(
             request_token=request_token,
             will_recheck_access=will_recheck_access,
         ),
-        'completion': CompletionService(user=user, context_key=course_id) if user and user.is_authenticated else None,
-        'i18n': XBlockI18nService,
-        'library_tools': LegacyLibraryToolsService(store, user_id=user.id if user else None),
-        'partitions': PartitionService(course_id=course_id, cache=DEFAULT_REQUEST_CACHE.data),
-        'settings': SettingsService(),
-        'user_tags': UserTagsService(user=user, course_id=course_id),
-        'teams': TeamsService(),
-        'teams_configuration': TeamsConfigurationService(),
-        'call_to_action': CallToActionService(),
-        'publish': EventPublishingService(user, course_id, track_function),
-        'enrollments': EnrollmentsService(),
+        'completion': lambda: (
+            CompletionService(user=user, context_key=course_id) if user and user.is_authenticated else None
+        ),
+        'i18n': lambda: XBlockI18nService,
+        'library_tools': lambda: LegacyLibraryToolsService(store, user_id=user.id if user else None),
+        'partitions': lambda: PartitionService(course_id=course_id, cache=DEFAULT_REQUEST_CACHE.data),
+        'settings': SettingsService,
+        'user_tags': lambda: UserTagsService(user=user, course_id=course_id),
+        'teams': TeamsService,
+        'teams_configuration': TeamsConfigurationService,
+        'call_to_action': CallToActionService,
+        'publish': lambda: EventPublishingService(user, course_id, track_function),
+        'enrollments': EnrollmentsService,
     }
 
-    runtime.get_block_for_descriptor = inner_get_block
-
-    runtime.wrappers = block_wrappers
-    runtime._services.update(services)  # lint-amnesty, pylint: disable=protected-access
-    runtime.request_token = request_token
-    runtime.wrap_asides_override = lms_wrappers_aside
-    runtime.applicable_aside_types_override = lms_applicable_aside_types
+    services = {name: _LazyService(factory) for name, factory in service_factories.items()}
+    return block_wrappers, services
 
 
 def load_single_xblock(request, user_id, course_id, usage_key_string, course=None, will_recheck_access=False):
@@ -21,15 +21,18 @@ from abc import ABCMeta, abstractmethod
 from contextlib import contextmanager
 
 from django.conf import settings
+from ccx_keys.locator import CCXBlockUsageLocator
 from edx_django_utils.cache import DEFAULT_REQUEST_CACHE
 from xblock.field_data import FieldData
 
+from openedx.core.lib.xblock_utils import is_xblock_aside
 from xmodule.modulestore.inheritance import InheritanceMixin
 
 NOTSET = object()
 ENABLED_OVERRIDE_PROVIDERS_KEY = 'lms.djangoapps.courseware.field_overrides.enabled_providers.{course_id}'
 ENABLED_MODULESTORE_OVERRIDE_PROVIDERS_KEY = 'lms.djangoapps.courseware.modulestore_field_overrides.\
     enabled_providers.{course_id}'
+OVERRIDES_MAPS_KEY = 'lms.djangoapps.courseware.field_overrides.overrides_maps'
 
 
 def resolve_dotted(name):
@@ -51,6 +54,29 @@ def resolve_dotted(name):
     return target
 
 
+def override_location(usage_key):
+    """
+    Returns the key under which overrides of the block `usage_key` are listed
+    in the maps returned by `FieldOverrideProvider.get_overrides_map`: the key
+    of the block itself (not of an aside of it) in the original course of a
+    CCX, without version or branch.
+    """
+    if is_xblock_aside(usage_key):
+        usage_key = usage_key.usage_key
+    if isinstance(usage_key, CCXBlockUsageLocator):
+        usage_key = usage_key.to_block_locator()
+    return usage_key.version_agnostic().for_branch(None)
+
+
+def clear_overrides_maps():
+    """
+    Forgets the overrides maps loaded in this request, so that overrides
+    which were just set or cleared are seen by all blocks, including those
+    which already read their fields.
+    """
+    DEFAULT_REQUEST_CACHE.data.pop(OVERRIDES_MAPS_KEY, None)
+
+
 def _lineage(block):
     """
     Returns an iterator over all ancestors of the given block, starting with
@@ -118,6 +144,20 @@ class FieldOverrideProvider(metaclass=ABCMeta):
         """
         raise NotImplementedError
 
+    def get_overrides_map(self, course_key):
+        """
+        Returns all of the overrides this provider has for its user in the
+        course `course_key`, as a dict mapping each field name to a dict
+        mapping the `override_location` of each overridden block to the JSON
+        value of the override.
+
+        This is called at most once per request for a user and course, and a
+        provider with an empty map is then skipped when fields are read.
+        Providers which can't list their overrides up front return None, the
+        default, and `get` is called for every field read instead.
+        """
+        return None
+
     @abstractmethod
     def enabled_for(self, course):  # pragma no cover
         """
@@ -200,6 +240,56 @@ class OverrideFieldData(FieldData):
     def __init__(self, user, fallback, providers):  # pylint: disable=super-init-not-called
         self.fallback = fallback
         self.providers = tuple(provider(user, fallback) for provider in providers)
+        self._user_id = getattr(user, 'id', None)
+        self._override_sources = {}
+
+    def _get_override_sources(self, block):
+        """
+        Returns where to look for the overrides of `block`, in provider order:
+        the providers which must be asked for each field, and, in place of
+        those which can list their overrides up front, maps of the overrides
+        merged from consecutive providers. Providers without any override for
+        the user in the course of `block` are left out.
+        """
+        try:
+            course_key = block.scope_ids.usage_id.context_key
+        except AttributeError:
+            return self.providers
+        overrides_maps = DEFAULT_REQUEST_CACHE.data.setdefault(OVERRIDES_MAPS_KEY, {})
+        # The sources are kept along with the overrides maps they were built from, which are
+        # replaced by clear_overrides_maps and at each request.
+        built_from, sources = self._override_sources.get(course_key, (None, None))
+        if built_from is not overrides_maps:
+            cache_key = (self._user_id, course_key, tuple(type(provider) for provider in self.providers))
+            steps = overrides_maps.get(cache_key)
+            if steps is None:
+                # Each step is either the index of a provider to ask, or a merged overrides map.
+                steps = []
+                for index, provider in enumerate(self.providers):
+                    overrides_map = provider.get_overrides_map(course_key)
+                    if overrides_map is None:
+                        steps.append(index)
+                    elif overrides_map:
+                        if not steps or not isinstance(steps[-1], dict):
+                            steps.append({})
+                        for name, overrides in overrides_map.items():
+                            merged_overrides = steps[-1].setdefault(name, {})
+                            for location, value in overrides.items():
+                                # Earlier providers win.
+                                merged_overrides.setdefault(location, value)
+                overrides_maps[cache_key] = steps
+            sources = tuple(step if isinstance(step, dict) else self.providers[step] for step in steps)
+            self._override_sources[course_key] = (overrides_maps, sources)
+        return sources
+
+    def _may_override(self, block, name):
+        """
+        Returns False if no provider can have an override for the field
+        identified by `name` in `block` or its ancestors.
+        """
+        return any(
+            not isinstance(source, dict) or name in source for source in self._get_override_sources(block)
+        )
 
     def get_override(self, block, name):
         """
@@ -207,10 +297,24 @@ class OverrideFieldData(FieldData):
         Returns the overridden value or `NOTSET` if no override is found.
         """
         if not overrides_disabled():
-            for provider in self.providers:
-                value = provider.get(block, name, NOTSET)
-                if value is not NOTSET:
-                    return value
+            location = None
+            for source in self._get_override_sources(block):
+                if isinstance(source, dict):
+                    overrides = source.get(name)
+                    if overrides is None:
+                        continue
+                    if location is None:
+                        location = override_location(block.scope_ids.usage_id)
+                    value = overrides.get(location, NOTSET)
+                    if value is not NOTSET:
+                        try:
+                            return block.fields[name].from_json(value)
+                        except KeyError:
+                            return value
+                else:
+                    value = source.get(block, name, NOTSET)
+                    if value is not NOTSET:
+                        return value
         return NOTSET
 
     def get(self, block, name):
@@ -235,7 +339,7 @@ class OverrideFieldData(FieldData):
             # then we want to return False here, so the field_data uses the
             # override and not the original value for this block.
             inheritable = list(InheritanceMixin.fields.keys())  # pylint: disable=no-member
-            if name in inheritable:
+            if name in inheritable and self._may_override(block, name):
                 for ancestor in _lineage(block):
                     if self.get_override(ancestor, name) is not NOTSET:
                         return False
@@ -250,7 +354,7 @@ class OverrideFieldData(FieldData):
         # also handle inheritance.
         if self.providers and not overrides_disabled():
             inheritable = list(InheritanceMixin.fields.keys())  # pylint: disable=no-member
-            if name in inheritable:
+            if name in inheritable and self._may_override(block, name):
                 for ancestor in _lineage(block):
                     value = self.get_override(ancestor, name)
                     if value is not NOTSET:
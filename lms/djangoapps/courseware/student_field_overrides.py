@@ -9,7 +9,7 @@ import json
 from lms.djangoapps.courseware.models import StudentFieldOverride
 from openedx.core.lib.xblock_utils import is_xblock_aside
 
-from .field_overrides import FieldOverrideProvider
+from .field_overrides import FieldOverrideProvider, clear_overrides_maps, override_location
 
 
 class IndividualStudentOverrideProvider(FieldOverrideProvider):
@@ -21,6 +21,20 @@ class IndividualStudentOverrideProvider(FieldOverrideProvider):
     def get(self, block, name, default):
         return get_override_for_user(self.user, block, name, default)
 
+    def get_overrides_map(self, course_key):
+        """
+        Loads all of the overrides of the user in the course with one query.
+        """
+        overrides_map = {}
+        if getattr(self.user, 'id', None) is None:
+            return overrides_map
+        query = StudentFieldOverride.objects.filter(course_id=course_key, student_id=self.user.id)
+        for override in query:
+            overrides_map.setdefault(override.field, {})[override_location(override.location)] = json.loads(
+                override.value
+            )
+        return overrides_map
+
     @classmethod
     def enabled_for(cls, course):  # pylint: disable=arguments-differ
         """This simple override provider is always enabled"""
@@ -83,6 +97,7 @@ def override_field_for_user(user, block, name, value):
     field = block.fields[name]
     override.value = json.dumps(field.to_json(value))
     override.save()
+    clear_overrides_maps()
 
 
 def clear_override_for_user(user, block, name):
@@ -100,3 +115,4 @@ def clear_override_for_user(user, block, name):
             field=name).delete()
     except StudentFieldOverride.DoesNotExist:
         pass
+    clear_overrides_maps()
@@ -345,6 +345,29 @@ class AccessTestCase(LoginEnrollmentTestCase, ModuleStoreTestCase, MilestonesTes
         # Cannot load the chapter since user is in a different group.
         assert not bool(access.has_access(self.global_staff, 'load', chapter, course_key=self.course.id))
 
+    @patch.dict('django.conf.settings.FEATURES', {'DISABLE_START_DATES': False})
+    def test_has_access_to_blocks(self):
+        """
+        Test that the access to many blocks at once is the access to each of them, with the
+        user's role worked out once.
+        """
+        chapter = BlockFactory.create(category='chapter', parent=self.course)
+        blocks = [
+            chapter,
+            BlockFactory.create(category='sequential', parent=chapter, visible_to_staff_only=True),
+            BlockFactory.create(category='sequential', parent=chapter, start=self.DATES[self.TOMORROW]),
+            self.course,
+        ]
+        for user in [self.anonymous_user, self.student, self.beta_user, self.course_staff]:
+            for action in ['load', 'staff']:
+                with patch('lms.djangoapps.courseware.access.get_user_role', wraps=access.get_user_role) as user_role:
+                    access_responses = access.has_access_to_blocks(user, action, blocks, self.course.id)
+                assert user_role.call_count <= 1
+                assert list(access_responses) == [block.location for block in blocks]
+                for block in blocks:
+                    expected = access.has_access(user, action, block, self.course.id)
+                    assert bool(access_responses[block.location]) == bool(expected)
+
     def test_has_access_to_course(self):
         assert not access._has_access_to_course(None, 'staff', self.course.id)
 
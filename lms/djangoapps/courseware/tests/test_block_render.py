@@ -2785,6 +2785,41 @@ class LmsModuleSystemShimTest(SharedModuleStoreTestCase):
             ATTR_KEY_DEPRECATED_ANONYMOUS_USER_ID
         ) == anonymous_id_for_user(self.user, None)
 
+    def test_runtime_prepared_once_per_request(self):
+        """
+        Verifies that the runtimes prepared for the same user in a request share their wrappers and services.
+        """
+        render.prepare_runtime_for_user(
+            self.user,
+            self.student_data,
+            self.problem_block.runtime,
+            self.course.id,
+            self.track_function,
+            self.request_token,
+            course=self.course,
+        )
+        assert self.problem_block.runtime.wrappers == self.block.runtime.wrappers
+        assert self.problem_block.runtime.service(self.problem_block, 'user') is self.block.runtime.service(
+            self.block, 'user'
+        )
+
+    @patch('lms.djangoapps.courseware.block_render.BookmarksService')
+    def test_services_created_when_requested(self, mock_bookmarks_service):
+        render.prepare_runtime_for_user(
+            self.user,
+            self.student_data,
+            self.problem_block.runtime,
+            self.course.id,
+            self.track_function,
+            Mock(),
+            course=self.course,
+        )
+        mock_bookmarks_service.assert_not_called()
+
+        services = self.problem_block.runtime._services  # pylint: disable=protected-access
+        assert services.get('bookmarks') is services['bookmarks'] is mock_bookmarks_service.return_value
+        mock_bookmarks_service.assert_called_once_with(user=self.user)
+
     def test_user_service_with_anonymous_user(self):
         render.prepare_runtime_for_user(
             AnonymousUser(),
@@ -2,8 +2,11 @@
 Tests for `field_overrides` module.
 """
 import unittest
+from unittest.mock import Mock
+
 import pytest
 from django.test.utils import override_settings
+from edx_django_utils.cache import DEFAULT_REQUEST_CACHE
 from xblock.field_data import DictFieldData
 
 from xmodule.modulestore.tests.django_utils import SharedModuleStoreTestCase
@@ -13,7 +16,9 @@ from ..field_overrides import (
     FieldOverrideProvider,
     OverrideFieldData,
     OverrideModulestoreFieldData,
+    clear_overrides_maps,
     disable_overrides,
+    override_location,
     resolve_dotted
 )
 from ..testutils import FieldOverrideTestMixin
@@ -43,6 +48,25 @@ class TestOverrideProvider(FieldOverrideProvider):
         return True
 
 
+class TestOverridesMapProvider(FieldOverrideProvider):
+    """
+    A `FieldOverrideProvider` for testing which lists its overrides up front.
+    """
+    overrides_map = {}
+    map_loads = 0
+
+    def get(self, block, name, default):
+        raise AssertionError("Providers with an overrides map aren't asked for each field.")
+
+    def get_overrides_map(self, course_key):
+        TestOverridesMapProvider.map_loads += 1
+        return self.overrides_map
+
+    @classmethod
+    def enabled_for(cls, course):  # pylint: disable=arguments-differ
+        return True
+
+
 class OverrideFieldBase(SharedModuleStoreTestCase):
     """
     Base class for field data override tests.  Using override_settings and
@@ -129,6 +153,66 @@ class OverrideFieldDataTests(OverrideFieldBase):
         assert isinstance(data, DictFieldData)
 
 
+@override_settings(FIELD_OVERRIDE_PROVIDERS=(
+    'lms.djangoapps.courseware.tests.test_field_overrides.TestOverridesMapProvider',))
+class OverridesMapTests(OverrideFieldBase):
+    """
+    Tests for `OverrideFieldData` with providers which list their overrides up front.
+    """
+
+    def setUp(self):
+        super().setUp()
+        OverrideFieldData.provider_classes = None
+        DEFAULT_REQUEST_CACHE.clear()
+        TestOverridesMapProvider.map_loads = 0
+        self.block = Mock(scope_ids=Mock(usage_id=self.course.location), fields={})
+
+    def tearDown(self):
+        super().tearDown()
+        OverrideFieldData.provider_classes = None
+        TestOverridesMapProvider.overrides_map = {}
+
+    def make_one(self):
+        """
+        Factory method.
+        """
+        return OverrideFieldData.wrap(TESTUSER, self.course, DictFieldData({
+            'foo': 'bar',
+            'bees': 'knees',
+        }))
+
+    def test_get(self):
+        TestOverridesMapProvider.overrides_map = {'foo': {override_location(self.course.location): 'fu'}}
+        data = self.make_one()
+        assert data.get(self.block, 'foo') == 'fu'
+        assert data.get(self.block, 'bees') == 'knees'
+        assert data.has(self.block, 'foo')
+        with disable_overrides():
+            assert data.get(self.block, 'foo') == 'bar'
+
+        # The overrides are loaded once per request.
+        assert self.make_one().get(self.block, 'foo') == 'fu'
+        assert TestOverridesMapProvider.map_loads == 1
+        clear_overrides_maps()
+        assert self.make_one().get(self.block, 'foo') == 'fu'
+        assert TestOverridesMapProvider.map_loads == 2
+
+    def test_override_set_after_first_read(self):
+        data = self.make_one()
+        assert data.get(self.block, 'foo') == 'bar'
+
+        # As done when an override is set, e.g. by override_field_for_user.
+        TestOverridesMapProvider.overrides_map = {'foo': {override_location(self.course.location): 'fu'}}
+        clear_overrides_maps()
+        assert data.get(self.block, 'foo') == 'fu'
+
+    def test_no_overrides(self):
+        data = self.make_one()
+        assert data.get(self.block, 'foo') == 'bar'
+        assert not data.has(self.block, 'oh')
+        assert not data._get_override_sources(self.block)  # pylint: disable=protected-access
+
+
 @override_settings(
     MODULESTORE_FIELD_OVERRIDE_PROVIDERS=['lms.djangoapps.courseware.tests.test_field_overrides.TestOverrideProvider']
 )
@@ -1256,6 +1256,36 @@ class TestGetHtmlMethod(BaseTestVideoXBlock):
         assert sorted(['https://webm.com/dw.webm', 'https://mp4.com/dm.mp4', 'https://hls.com/hls.m3u8']) ==\
                sorted(get_context_dict_from_string(context)['metadata']['sources'])
 
+    @patch('xmodule.video_block.video_block.edxval_api.get_video_info')
+    @patch('xmodule.video_block.video_block.edxval_api.get_urls_for_profiles')
+    @patch('xmodule.video_block.video_block.edxval_api.get_video_info_for_course_and_profiles')
+    def test_get_html_with_course_val_data(self, get_course_val_data, get_urls_for_profiles, get_video_info):
+        """
+        Verify that the VAL data of the videos of the course is fetched once, and that the
+        videos found in it are not looked up individually.
+        """
+        get_course_val_data.return_value = {
+            '12345-67890': {
+                'duration': 100.0,
+                'profiles': {
+                    'desktop_mp4': {'url': 'https://mp4.com/dm.mp4', 'file_size': 2222},
+                    'youtube': {'url': 'https://yt.com/?v=v0TFmdO4ZP0', 'file_size': 0},
+                },
+            },
+        }
+        video_xml = '<video display_name="Video" download_video="true" edx_video_id="12345-67890">[]</video>'
+        self.initialize_block(data=video_xml)
+
+        for __ in range(2):
+            context = self.block.student_view(None).content
+
+        get_course_val_data.assert_called_once()
+        get_urls_for_profiles.assert_not_called()
+        get_video_info.assert_not_called()
+        assert "'download_video_link': 'https://mp4.com/dm.mp4'" in context
+        assert '"streams": "1.00:https://yt.com/?v=v0TFmdO4ZP0"' in context
+        assert get_context_dict_from_string(context)['metadata']['duration'] == 100.0
+
     def test_get_html_hls_no_video_id(self):
         """
         Verify that `download_video_link` is set to None for HLS videos if no video id
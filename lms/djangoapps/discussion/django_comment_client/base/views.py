@@ -44,24 +44,28 @@ from lms.djangoapps.discussion.django_comment_client.utils import (
     get_ability,
     get_annotated_content_info,
     get_cached_discussion_id_map,
+    get_descendants_deleted_with,
     get_group_id_for_comments_service,
     get_user_group_ids,
     is_comment_too_deep,
     prepare_content,
     sanitize_body
 )
+from lms.djangoapps.discussion.toggles import ENABLE_MATERIALIZED_USER_STATS
 from openedx.core.djangoapps.django_comment_common.signals import (
     comment_created,
     comment_deleted,
     comment_edited,
     comment_endorsed,
     comment_flagged,
+    comment_unflagged,
     comment_voted,
     thread_created,
     thread_deleted,
     thread_edited,
     thread_flagged,
     thread_followed,
+    thread_unflagged,
     thread_unfollowed,
     thread_voted
 )
@@ -726,8 +730,9 @@ def delete_thread(request, course_id, thread_id):
     course_key = CourseKey.from_string(course_id)
     course = get_course_with_access(request.user, 'load', course_key)
     thread = cc.Thread.find(thread_id)
+    descendants = get_descendants_deleted_with(thread, course_key)
     thread.delete(course_id=course_id)
-    thread_deleted.send(sender=None, user=request.user, post=thread)
+    thread_deleted.send(sender=None, user=request.user, post=thread, descendants=descendants)
 
     track_thread_deleted_event(request, course, thread)
     return JsonResponse(prepare_content(thread.to_dict(), course_key))
@@ -825,8 +830,9 @@ def delete_comment(request, course_id, comment_id):
     course_key = CourseKey.from_string(course_id)
     course = get_course_with_access(request.user, 'load', course_key)
     comment = cc.Comment.find(comment_id)
+    descendants = get_descendants_deleted_with(comment, course_key)
     comment.delete(course_id=course_id)
-    comment_deleted.send(sender=None, user=request.user, post=comment)
+    comment_deleted.send(sender=None, user=request.user, post=comment, descendants=descendants)
     track_comment_deleted_event(request, course, comment)
     return JsonResponse(prepare_content(comment.to_dict(), course_key))
 
@@ -932,8 +938,11 @@ def un_flag_abuse_for_thread(request, course_id, thread_id):
         has_permission(request.user, 'openclose_thread', course_key) or
         has_access(request.user, 'staff', course)
     )
+    # Only fetched when the stats need it, as the thread isn't retrieved otherwise.
+    was_flagged = ENABLE_MATERIALIZED_USER_STATS.is_enabled(course_key) and bool(thread.abuse_flaggers)
     thread.unFlagAbuse(user, thread, remove_all, course_id)
     track_discussion_unreported_event(request, course, thread)
+    thread_unflagged.send(sender=None, user=request.user, post=thread, was_flagged=was_flagged)
     return JsonResponse(prepare_content(thread.to_dict(), course_key))
 
 
@@ -971,8 +980,11 @@ def un_flag_abuse_for_comment(request, course_id, comment_id):
         has_access(request.user, 'staff', course)
     )
     comment = cc.Comment.find(comment_id)
+    # Only fetched when the stats need it, as the comment isn't retrieved otherwise.
+    was_flagged = ENABLE_MATERIALIZED_USER_STATS.is_enabled(course_key) and bool(comment.abuse_flaggers)
     comment.unFlagAbuse(user, comment, remove_all, course_id)
     track_discussion_unreported_event(request, course, comment)
+    comment_unflagged.send(sender=None, user=request.user, post=comment, was_flagged=was_flagged)
     return JsonResponse(prepare_content(comment.to_dict(), course_key))
 
 
@@ -9,11 +9,14 @@ from unittest.mock import Mock, patch
 
 import ddt
 import pytest
-from django.test import RequestFactory, TestCase
+import requests
+from django.test import RequestFactory, TestCase, override_settings
 from django.urls import reverse
 from edx_django_utils.cache import RequestCache
+from edx_toggles.toggles.testutils import override_waffle_flag
 from opaque_keys.edx.keys import CourseKey
 from pytz import UTC
+from urllib3.exceptions import ConnectTimeoutError, MaxRetryError, NewConnectionError, ReadTimeoutError
 
 import lms.djangoapps.discussion.django_comment_client.utils as utils
 from common.djangoapps.course_modes.models import CourseMode
@@ -26,6 +29,7 @@ from lms.djangoapps.discussion.django_comment_client.constants import TYPE_ENTRY
 from lms.djangoapps.discussion.django_comment_client.tests.factories import RoleFactory
 from lms.djangoapps.discussion.django_comment_client.tests.unicode import UnicodeTestMixin
 from lms.djangoapps.discussion.django_comment_client.tests.utils import config_course_discussions, topic_name_to_id
+from lms.djangoapps.discussion.toggles import ENABLE_MATERIALIZED_USER_STATS
 from lms.djangoapps.teams.tests.factories import CourseTeamFactory
 from openedx.core.djangoapps.course_groups import cohorts
 from openedx.core.djangoapps.course_groups.cohorts import set_course_cohorted
@@ -39,6 +43,7 @@ from openedx.core.djangoapps.discussions.utils import (
 )
 from openedx.core.djangoapps.django_comment_common.comment_client.utils import (
     CommentClientMaintenanceError,
+    get_pooled_session,
     perform_request,
 )
 from openedx.core.djangoapps.django_comment_common.models import (
@@ -1650,6 +1655,7 @@ class GroupModeratorPermissionsTestCase(ModuleStoreTestCase):
                                                                                     'can_report': True}
 
 
+@ddt.ddt
 class ClientConfigurationTestCase(TestCase):
     """Simple test cases to ensure enabling/disabling the use of the comment service works as intended."""
 
@@ -1678,6 +1684,74 @@ class ClientConfigurationTestCase(TestCase):
         result = perform_request('GET', 'http://www.google.com')
         assert result == {}
 
+    @override_settings(COMMENTS_SERVICE_POOL_SIZE=5)
+    @patch('requests.Session.request')
+    def test_pooled_session(self, mock_session_request):
+        """Ensures that requests reuse the shared keep-alive session when pooling is enabled."""
+        config = ForumsConfig.current()
+        config.enabled = True
+        config.save()
+
+        response = Mock()
+        response.status_code = 200
+        response.json = lambda: {'id': 'thread'}
+        mock_session_request.return_value = response
+
+        assert perform_request('get', 'http://www.google.com') == {'id': 'thread'}
+        assert perform_request('get', 'http://www.google.com') == {'id': 'thread'}
+        assert mock_session_request.call_count == 2
+        assert get_pooled_session(5, 0) is get_pooled_session(5, 0)
+
+    @ddt.data(
+        (ReadTimeoutError(None, 'http://www.google.com', 'Read timed out.'), requests.exceptions.ReadTimeout),
+        (ConnectTimeoutError(), requests.exceptions.ConnectTimeout),
+        (NewConnectionError(None, 'Connection refused'), requests.exceptions.ConnectionError),
+    )
+    @ddt.unpack
+    @override_settings(COMMENTS_SERVICE_POOL_SIZE=5, COMMENTS_SERVICE_MAX_RETRIES=2)
+    @patch('requests.Session.request')
+    def test_pooled_session_retries_exhausted(self, reason, expected_exception, mock_session_request):
+        """Ensures that timeouts are still raised as timeouts once the retries of the pooled session are exhausted."""
+        config = ForumsConfig.current()
+        config.enabled = True
+        config.save()
+
+        mock_session_request.side_effect = requests.exceptions.ConnectionError(
+            MaxRetryError(None, 'http://www.google.com', reason=reason)
+        )
+
+        with pytest.raises(expected_exception) as exc_info:
+            perform_request('get', 'http://www.google.com')
+        assert isinstance(exc_info.value, requests.exceptions.Timeout) == issubclass(
+            expected_exception, requests.exceptions.Timeout
+        )
+
+    @override_settings(COMMENTS_SERVICE_COALESCE_GETS=True)
+    @patch('requests.request')
+    def test_coalesced_gets(self, mock_request):
+        """Ensures that identical GETs in one request are sent once, until something is written."""
+        self.addCleanup(RequestCache.clear_all_namespaces)
+        config = ForumsConfig.current()
+        config.enabled = True
+        config.save()
+
+        response = Mock()
+        response.status_code = 200
+        response.json = lambda: {'id': 'thread'}
+        mock_request.return_value = response
+
+        first_result = perform_request('get', 'http://www.google.com', {'page': 1})
+        first_result['id'] = 'modified by caller'
+        assert perform_request('get', 'http://www.google.com', {'page': 1}) == {'id': 'thread'}
+        assert mock_request.call_count == 1
+
+        perform_request('get', 'http://www.google.com', {'page': 2})
+        assert mock_request.call_count == 2
+
+        perform_request('post', 'http://www.google.com', {'body': 'new'})
+        perform_request('get', 'http://www.google.com', {'page': 1})
+        assert mock_request.call_count == 4
+
 
 def set_discussion_division_settings(
     course_key, enable_cohorts=False, always_divide_inline_discussions=False,
@@ -1813,3 +1887,47 @@ class TestConvertHtmlToMarkdown(unittest.TestCase):
         # pylint: disable=line-too-long
         expected_output = '[Example](https://example.com)\n\nParagraph text\n\n ![](https://example.com/Full-form-of-URL-1-1024x824.jpg "")'
         self.assertEqual(utils.convert_html_to_markdown(input_text), expected_output)
+
+
+@override_waffle_flag(ENABLE_MATERIALIZED_USER_STATS, active=True)
+class DescendantsDeletedWithTestCase(TestCase):
+    """
+    Tests for get_descendants_deleted_with
+    """
+    def setUp(self):
+        super().setUp()
+        self.course_key = CourseKey.from_string('course-v1:edX+DemoX+Demo_Course')
+        self.reply = {'id': 'reply', 'user_id': '2', 'parent_id': 'response'}
+        self.response = {'id': 'response', 'user_id': '1', 'parent_id': None, 'children': [self.reply]}
+        self.other_response = {'id': 'other-response', 'user_id': '3', 'parent_id': None, 'children': []}
+
+        def retrieve(thread, **kwargs):  # pylint: disable=unused-argument
+            thread.attributes.update({
+                'endorsed_responses': [self.response],
+                'non_endorsed_responses': [self.other_response],
+            })
+            return thread
+
+        patcher = patch.object(utils.cc.Thread, 'retrieve', autospec=True, side_effect=retrieve)
+        self.mock_retrieve = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_thread(self):
+        thread = utils.cc.Thread(id='thread')
+        assert utils.get_descendants_deleted_with(thread, self.course_key) == [
+            self.response, self.reply, self.other_response,
+        ]
+
+    def test_response(self):
+        response = utils.cc.Comment(id='response', thread_id='thread', parent_id=None)
+        assert utils.get_descendants_deleted_with(response, self.course_key) == [self.reply]
+
+    def test_reply(self):
+        reply = utils.cc.Comment(id='reply', thread_id='thread', parent_id='response')
+        assert utils.get_descendants_deleted_with(reply, self.course_key) == []
+
+    @override_waffle_flag(ENABLE_MATERIALIZED_USER_STATS, active=False)
+    def test_disabled(self):
+        thread = utils.cc.Thread(id='thread')
+        assert utils.get_descendants_deleted_with(thread, self.course_key) == []
+        assert not self.mock_retrieve.called
@@ -28,6 +28,7 @@ from lms.djangoapps.discussion.django_comment_client.permissions import (
     has_permission
 )
 from lms.djangoapps.discussion.django_comment_client.settings import MAX_COMMENT_DEPTH
+from lms.djangoapps.discussion.toggles import ENABLE_MATERIALIZED_USER_STATS
 from openedx.core.djangoapps.course_groups.cohorts import get_cohort_id
 from openedx.core.djangoapps.discussions.utils import (
     get_accessible_discussion_xblocks,
@@ -1031,6 +1032,42 @@ def is_content_authored_by(content, user):
         return False
 
 
+def get_descendants_deleted_with(cc_content, course_key):
+    """
+    Returns the forum data of the responses and replies that are deleted along with
+    `cc_content`, a thread or comment that is about to be deleted.
+
+    They are only needed to update the materialized discussion user stats of the course,
+    so the thread is only fetched again when those are enabled.
+    """
+    if not ENABLE_MATERIALIZED_USER_STATS.is_enabled(course_key):
+        return []
+    is_thread = cc_content.type == 'thread'
+    thread = cc.Thread(id=cc_content.id if is_thread else cc_content.thread_id).retrieve(
+        with_responses=True,
+        recursive=True,
+        mark_as_read=False,
+        course_id=str(course_key),
+    )
+    responses = (
+        (thread.attributes.get('children') or []) +
+        (thread.attributes.get('endorsed_responses') or []) +
+        (thread.attributes.get('non_endorsed_responses') or [])
+    )
+
+    def _flatten(comments):
+        for comment in comments:
+            yield comment
+            yield from _flatten(comment.get('children') or [])
+
+    if is_thread:
+        return list(_flatten(responses))
+    for comment in _flatten(responses):
+        if comment['id'] == cc_content.id:
+            return list(_flatten(comment.get('children') or []))
+    return []
+
+
 def sanitize_body(body):
     """
     Return a sanitized version of the body with dangerous Markdown removed.
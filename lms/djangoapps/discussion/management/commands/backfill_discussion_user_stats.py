@@ -0,0 +1,64 @@
+"""
+Management command to rebuild the materialized discussion user stats of a course from the forum.
+"""
+import logging
+
+from dateutil.parser import parse as parse_date
+from django.contrib.auth.models import User  # lint-amnesty, pylint: disable=imported-auth-user
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from opaque_keys.edx.keys import CourseKey
+
+import openedx.core.djangoapps.django_comment_common.comment_client.course as cc
+from openedx.core.djangoapps.django_comment_common.models import CourseDiscussionUserStats
+
+log = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Invoke with:
+
+        python manage.py lms backfill_discussion_user_stats <course_id> [--batch-size 500]
+
+    Run this after enabling discussions.enable_materialized_user_stats for a course,
+    and again whenever the stats need to be reconciled with the forum (for example
+    for inactive flags, which the incremental updates do not track).
+    """
+    help = 'Rebuild the materialized discussion user stats for a particular course from the forum.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('course_id', help="ID of the Course to rebuild user stats for")
+        parser.add_argument('--batch-size', type=int, default=500, help="Number of users fetched per forum request")
+
+    def handle(self, *args, **options):
+        course_key = CourseKey.from_string(options['course_id'])
+        batch_size = options['batch_size']
+        rows = []
+        page = num_pages = 1
+        while page <= num_pages:
+            response = cc.get_course_user_stats(
+                course_key, {'sort_key': 'activity', 'page': page, 'per_page': batch_size},
+            )
+            num_pages = response['num_pages']
+            user_ids = dict(
+                User.objects.filter(
+                    username__in=[stats['username'] for stats in response['user_stats']]
+                ).values_list('username', 'id')
+            )
+            for stats in response['user_stats']:
+                if stats['username'] not in user_ids:
+                    continue
+                last_activity_at = stats.get('last_activity_at')
+                rows.append(CourseDiscussionUserStats(
+                    course_id=course_key,
+                    user_id=user_ids[stats['username']],
+                    last_activity_at=parse_date(last_activity_at) if last_activity_at else None,
+                    **{field: stats.get(field) or 0 for field in CourseDiscussionUserStats.COUNT_FIELDS},
+                ))
+            page += 1
+
+        with transaction.atomic():
+            CourseDiscussionUserStats.objects.filter(course_id=course_key).delete()
+            CourseDiscussionUserStats.objects.bulk_create(rows, batch_size=batch_size)
+        log.info(f"Rebuilt discussion user stats for {len(rows)} users in {course_key}")
@@ -36,7 +36,11 @@ from lms.djangoapps.course_api.blocks.api import get_blocks
 from lms.djangoapps.courseware.courses import get_course_with_access
 from lms.djangoapps.courseware.exceptions import CourseAccessRedirect
 from lms.djangoapps.discussion.rate_limit import is_content_creation_rate_limited
-from lms.djangoapps.discussion.toggles import ENABLE_DISCUSSIONS_MFE, ONLY_VERIFIED_USERS_CAN_POST
+from lms.djangoapps.discussion.toggles import (
+    ENABLE_DISCUSSIONS_MFE,
+    ENABLE_MATERIALIZED_USER_STATS,
+    ONLY_VERIFIED_USERS_CAN_POST
+)
 from lms.djangoapps.discussion.views import is_privileged_user
 from openedx.core.djangoapps.discussions.models import (
     DiscussionsConfiguration,
@@ -69,6 +73,7 @@ from openedx.core.djangoapps.django_comment_common.signals import (
     comment_endorsed,
     comment_edited,
     comment_flagged,
+    comment_unflagged,
     comment_voted,
     thread_created,
     thread_deleted,
@@ -76,6 +81,7 @@ from openedx.core.djangoapps.django_comment_common.signals import (
     thread_flagged,
     thread_followed,
     thread_voted,
+    thread_unflagged,
     thread_unfollowed
 )
 from openedx.core.djangoapps.user_api.accounts.api import get_account_settings
@@ -97,6 +103,7 @@ from ..django_comment_client.base.views import (
     track_forum_search_event, track_thread_followed_event
 )
 from ..django_comment_client.utils import (
+    get_descendants_deleted_with,
     get_group_id_for_user,
     get_user_role_names,
     has_discussion_privileges,
@@ -119,6 +126,7 @@ from .serializers import (
     ThreadSerializer,
     TopicOrdering,
     UserStatsSerializer,
+    add_referenced_users_to_context,
     get_context
 )
 from .utils import (
@@ -126,6 +134,7 @@ from .utils import (
     add_stats_for_users_with_no_discussion_content,
     create_blocks_params,
     discussion_open_for_user,
+    get_materialized_course_user_stats,
     get_usernames_for_course,
     get_usernames_from_search_string,
     set_attribute,
@@ -877,6 +886,8 @@ def _serialize_discussion_entities(request, context, discussion_entities, reques
     results = []
     usernames = []
     include_profile_image = _include_profile_image(requested_fields)
+    # Look up the users referenced by all entities at once, rather than per entity
+    context = add_referenced_users_to_context(dict(context), discussion_entities)
     for entity in discussion_entities:
         if discussion_entity_type == DiscussionEntity.thread:
             serialized_entity = ThreadSerializer(entity, context=context).data
@@ -1400,8 +1411,11 @@ def _handle_abuse_flagged_field(form_value, user, cc_content, request):
                 comment_flagged.send(sender='flag_abuse_for_comment', user=user, post=cc_content)
     else:
         remove_all = bool(is_privileged_user(course_key, User.objects.get(id=user.id)))
+        was_flagged = bool(cc_content.attributes.get('abuse_flaggers'))
         cc_content.unFlagAbuse(user, cc_content, remove_all)
         track_discussion_unreported_event(request, course, cc_content)
+        signal = thread_unflagged if cc_content.type == 'thread' else comment_unflagged
+        signal.send(sender=None, user=user, post=cc_content, was_flagged=was_flagged)
 
 
 def _handle_voted_field(form_value, cc_content, api_content, request, context):
@@ -1822,8 +1836,9 @@ def delete_thread(request, thread_id):
     """
     cc_thread, context = _get_thread_and_context(request, thread_id)
     if can_delete(cc_thread, context):
+        descendants = get_descendants_deleted_with(cc_thread, context["course"].id)
         cc_thread.delete()
-        thread_deleted.send(sender=None, user=request.user, post=cc_thread)
+        thread_deleted.send(sender=None, user=request.user, post=cc_thread, descendants=descendants)
         track_thread_deleted_event(request, context["course"], cc_thread)
     else:
         raise PermissionDenied
@@ -1847,8 +1862,9 @@ def delete_comment(request, comment_id):
     """
     cc_comment, context = _get_comment_and_context(request, comment_id)
     if can_delete(cc_comment, context):
+        descendants = get_descendants_deleted_with(cc_comment, context["course"].id)
         cc_comment.delete()
-        comment_deleted.send(sender=None, user=request.user, post=cc_comment)
+        comment_deleted.send(sender=None, user=request.user, post=cc_comment, descendants=descendants)
         track_comment_deleted_event(request, context["course"], cc_comment)
     else:
         raise PermissionDenied
@@ -1913,7 +1929,10 @@ def get_course_discussion_user_stats(
 
         params['usernames'] = comma_separated_usernames
 
-    course_stats_response = get_course_user_stats(course_key, params)
+    if ENABLE_MATERIALIZED_USER_STATS.is_enabled(course_key):
+        course_stats_response = get_materialized_course_user_stats(course_key, params)
+    else:
+        course_stats_response = get_course_user_stats(course_key, params)
 
     if comma_separated_usernames:
         updated_course_stats = add_stats_for_users_with_no_discussion_content(
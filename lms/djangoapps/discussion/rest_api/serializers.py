@@ -11,7 +11,7 @@ from urllib.parse import urlencode, urlunparse
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ObjectDoesNotExist, ValidationError
-from django.db.models import TextChoices
+from django.db.models import Q, TextChoices
 from django.urls import reverse
 from django.utils.html import strip_tags
 from rest_framework import serializers
@@ -93,6 +93,52 @@ def get_context(course, request, thread=None):
     }
 
 
+def _iter_discussion_entities(discussion_entities):
+    """
+    Yields the given threads/comments along with all of their nested responses and comments.
+    """
+    for entity in discussion_entities:
+        yield entity
+        for key in ("children", "endorsed_responses", "non_endorsed_responses"):
+            yield from _iter_discussion_entities(entity.get(key) or [])
+
+
+def add_referenced_users_to_context(context, discussion_entities):
+    """
+    Resolves every user referenced by the given threads/comments (the last
+    editor, the user who closed a thread and comment endorsers) with a single
+    query, and adds the results to the serializer context.
+
+    Serializers use these lookups instead of querying for each entity, which
+    matters for pages with many responses.
+    """
+    usernames = set()
+    user_ids = set()
+    for entity in _iter_discussion_entities(discussion_entities):
+        edit_history = entity.get("edit_history")
+        if edit_history and edit_history[-1].get("editor_username"):
+            usernames.add(edit_history[-1]["editor_username"])
+        if entity.get("closed_by"):
+            usernames.add(entity["closed_by"])
+        endorsement = entity.get("endorsement")
+        if endorsement and endorsement.get("user_id"):
+            user_ids.add(int(endorsement["user_id"]))
+
+    usernames_to_user_ids = {}
+    user_ids_to_usernames = {}
+    if usernames or user_ids:
+        users = User.objects.filter(
+            Q(username__in=usernames) | Q(id__in=user_ids)
+        ).values_list("id", "username")
+        for user_id, username in users:
+            usernames_to_user_ids[username] = user_id
+            user_ids_to_usernames[user_id] = username
+
+    context["usernames_to_user_ids"] = usernames_to_user_ids
+    context["user_ids_to_usernames"] = user_ids_to_usernames
+    return context
+
+
 def validate_not_blank(value):
     """
     Validate that a value is not an empty string or whitespace.
@@ -259,6 +305,9 @@ class _ContentSerializer(serializers.Serializer):
         Returns role label of user from username
         Possible Role Labels: Staff, Moderator, Community TA or None
         """
+        usernames_to_user_ids = self.context.get("usernames_to_user_ids", {})
+        if username in usernames_to_user_ids:
+            return self._get_user_label(usernames_to_user_ids[username])
         try:
             user = User.objects.get(username=username)
             return self._get_user_label(user.id)
@@ -576,6 +625,9 @@ class CommentSerializer(_ContentSerializer):
                 self._is_anonymous(self.context["thread"]) and
                 not self._is_user_privileged(endorser_id)
             ):
+                user_ids_to_usernames = self.context.get("user_ids_to_usernames", {})
+                if endorser_id in user_ids_to_usernames:
+                    return user_ids_to_usernames[endorser_id]
                 return User.objects.get(id=endorser_id).username
         return None
 
@@ -2739,7 +2739,9 @@ class DeleteThreadTest(
     @mock.patch("eventtracking.tracker.emit")
     def test_basic(self, mock_emit):
         self.register_thread()
-        with self.assert_signal_sent(api, 'thread_deleted', sender=None, user=self.user, exclude_args=('post',)):
+        with self.assert_signal_sent(
+            api, 'thread_deleted', sender=None, user=self.user, descendants=[], exclude_args=('post',),
+        ):
             assert delete_thread(self.request, self.thread_id) is None
         assert urlparse(httpretty.last_request().path).path == f"/api/v1/threads/{self.thread_id}"  # lint-amnesty, pylint: disable=no-member
         assert httpretty.last_request().method == 'DELETE'
@@ -2917,7 +2919,9 @@ class DeleteCommentTest(
     @mock.patch("eventtracking.tracker.emit")
     def test_basic(self, mock_emit):
         self.register_comment_and_thread()
-        with self.assert_signal_sent(api, 'comment_deleted', sender=None, user=self.user, exclude_args=('post',)):
+        with self.assert_signal_sent(
+            api, 'comment_deleted', sender=None, user=self.user, descendants=[], exclude_args=('post',),
+        ):
             assert delete_comment(self.request, self.comment_id) is None
         assert urlparse(httpretty.last_request().path).path == f"/api/v1/comments/{self.comment_id}"  # lint-amnesty, pylint: disable=no-member
         assert httpretty.last_request().method == 'DELETE'
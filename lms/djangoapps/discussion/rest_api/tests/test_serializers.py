@@ -8,6 +8,7 @@ from urllib.parse import urlparse
 
 import ddt
 import httpretty
+from django.contrib.auth import get_user_model
 from django.test.client import RequestFactory
 from django.test.utils import override_settings
 from xmodule.modulestore import ModuleStoreEnum
@@ -21,6 +22,7 @@ from lms.djangoapps.discussion.django_comment_client.tests.utils import ForumsEn
 from lms.djangoapps.discussion.rest_api.serializers import (
     CommentSerializer,
     ThreadSerializer,
+    add_referenced_users_to_context,
     filter_spam_urls_from_html,
     get_context
 )
@@ -533,6 +535,33 @@ class CommentSerializerTest(SerializerTestMixin, SharedModuleStoreTestCase):
         serialized = self.serialize(self.make_cs_content(with_endorsement=True))
         assert serialized['endorsed_at'] == self.endorsed_at
 
+    def test_referenced_users_from_context(self):
+        """
+        Test that endorsers and editors of all comments are resolved with one
+        query, and that serialization then uses them without further lookups.
+        """
+        moderator = UserFactory.create()
+        self.create_role(FORUM_ROLE_MODERATOR, [moderator, self.user])
+        child = self.make_cs_content({
+            "id": "child",
+            "edit_history": [{"editor_username": moderator.username}],
+        })
+        comments = [
+            self.make_cs_content({"id": "endorsed", "children": [child]}, with_endorsement=True),
+            self.make_cs_content({"id": "not_endorsed"}),
+        ]
+        context = get_context(self.course, self.request, make_minimal_cs_thread())
+
+        with self.assertNumQueries(1):
+            add_referenced_users_to_context(context, comments)
+
+        with mock.patch.object(get_user_model().objects, "get", side_effect=AssertionError):
+            serialized = [CommentSerializer(comment, context=context).data for comment in comments]
+
+        assert serialized[0]["endorsed_by"] == self.endorser.username
+        assert serialized[0]["children"][0]["edit_by_label"] == "Moderator"
+        assert serialized[1]["endorsed_by"] is None
+
     def test_children(self):
         comment = self.make_cs_content({
             "id": "test_root",
@@ -6,6 +6,8 @@ import unittest
 from datetime import datetime, timedelta
 
 import ddt
+from django.test import TestCase
+from opaque_keys.edx.keys import CourseKey
 from pytz import UTC
 
 from common.djangoapps.student.roles import CourseInstructorRole, CourseStaffRole
@@ -18,12 +20,14 @@ from lms.djangoapps.discussion.rest_api.utils import (
     get_archived_topics,
     get_course_staff_users_list,
     get_course_ta_users_list,
+    get_materialized_course_user_stats,
     get_moderator_users_list,
     is_posting_allowed,
     remove_empty_sequentials,
     is_only_student
 )
 from openedx.core.djangoapps.discussions.models import DiscussionsConfiguration, PostingRestriction
+from openedx.core.djangoapps.django_comment_common.models import CourseDiscussionUserStats
 from xmodule.modulestore.tests.django_utils import ModuleStoreTestCase
 from xmodule.modulestore.tests.factories import CourseFactory
 
@@ -125,6 +129,44 @@ class DiscussionAPIUtilsTestCase(ModuleStoreTestCase):
         assert result == expected_result
 
 
+class TestMaterializedCourseUserStats(TestCase):
+    """
+    Tests for get_materialized_course_user_stats
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.course_key = CourseKey.from_string('course-v1:edX+DemoX+Demo_Course')
+        for username, threads, active_flags in (('a', 3, 0), ('bb', 1, 2), ('ccc', 2, 1)):
+            CourseDiscussionUserStats.objects.create(
+                course_id=self.course_key,
+                user=UserFactory(username=username),
+                threads=threads,
+                active_flags=active_flags,
+            )
+        CourseDiscussionUserStats.objects.create(
+            course_id=CourseKey.from_string('course-v1:edX+Other+Run'), user=UserFactory(), threads=10,
+        )
+
+    def _usernames(self, **params):
+        response = get_materialized_course_user_stats(self.course_key, params)
+        return [stats['username'] for stats in response['user_stats']], response
+
+    def test_sorting_and_pagination(self):
+        usernames, response = self._usernames(sort_key='activity', page=1, per_page=2)
+        assert usernames == ['a', 'ccc']
+        assert (response['page'], response['num_pages'], response['count']) == (1, 2, 3)
+        assert self._usernames(sort_key='activity', page=2, per_page=2)[0] == ['bb']
+        assert self._usernames(sort_key='flagged', page=1, per_page=3)[0] == ['bb', 'ccc', 'a']
+
+    def test_usernames(self):
+        with self.assertNumQueries(1):
+            usernames, response = self._usernames(sort_key='flagged', page=3, per_page=2, usernames='a,ccc')
+        assert usernames == ['ccc', 'a']
+        assert response['user_stats'][0]['active_flags'] == 1
+        assert (response['page'], response['count']) == (1, 2)
+
+
 class TestRemoveEmptySequentials(unittest.TestCase):
     """
     Test for the remove_empty_sequentials function
@@ -2,6 +2,7 @@
 Utils for discussion API.
 """
 import logging
+import math
 from datetime import datetime
 from typing import Dict, List
 
@@ -26,6 +27,7 @@ from openedx.core.djangoapps.django_comment_common.models import (
     FORUM_ROLE_GROUP_MODERATOR,
     FORUM_ROLE_MODERATOR,
     FORUM_ROLE_STUDENT,
+    CourseDiscussionUserStats,
     Role
 )
 from ..django_comment_client.utils import get_user_role_names
@@ -90,10 +92,10 @@ def get_usernames_from_search_string(course_id, search_string, page_number, page
     matched_users_in_course = User.objects.filter(
         courseenrollment__course_id=course_id,
         username__icontains=search_string).order_by(Length('username').asc()).values_list('username', flat=True)
-    if not matched_users_in_course:
-        return '', 0, 0
-    matched_users_count = len(matched_users_in_course)
     paginator = Paginator(matched_users_in_course, page_size)
+    matched_users_count = paginator.count
+    if not matched_users_count:
+        return '', 0, 0
     page_matched_users = paginator.page(page_number)
     matched_users_pages = int(matched_users_count / page_size)
     return ','.join(page_matched_users), matched_users_count, matched_users_pages
@@ -115,10 +117,10 @@ def get_usernames_for_course(course_id, page_number, page_size):
     """
     matched_users_in_course = User.objects.filter(courseenrollment__course_id=course_id, ) \
         .order_by(Length('username').asc()).values_list('username', flat=True)
-    if not matched_users_in_course:
-        return '', 0, 0
-    matched_users_count = len(matched_users_in_course)
     paginator = Paginator(matched_users_in_course, page_size)
+    matched_users_count = paginator.count
+    if not matched_users_count:
+        return '', 0, 0
     page_matched_users = paginator.page(page_number)
     matched_users_pages = int(matched_users_count / page_size)
     return ','.join(page_matched_users), matched_users_count, matched_users_pages
@@ -145,6 +147,49 @@ def add_stats_for_users_with_no_discussion_content(course_stats, users_in_course
     return updated_course_stats
 
 
+def get_materialized_course_user_stats(course_key, params):
+    """
+    Gets course user stats from the materialized stats table.
+
+    Sorting and slicing are done in the database, so the cost of a page does
+    not grow with the number of learners in the course.
+
+    Args:
+            course_key (CourseKey): Course to get stats for
+            params (dict): the parameters that would be sent to the forum user stats API
+
+    Returns:
+            A dict shaped like the forum user stats response.
+    """
+    stats = CourseDiscussionUserStats.for_course(course_key, params.get('sort_key'))
+    usernames = params.get('usernames')
+    if usernames:
+        # The usernames are already a single page of users, so they are not paginated again.
+        stats = stats.filter(user__username__in=usernames.split(','))
+        page, per_page = 1, None
+    else:
+        page, per_page = params['page'], params['per_page']
+        stats = stats[(page - 1) * per_page:page * per_page]
+    user_stats = [
+        {
+            'username': row.pop('user__username'),
+            **row,
+        }
+        for row in stats.values('user__username', *CourseDiscussionUserStats.COUNT_FIELDS)
+    ]
+    if per_page is None:
+        count, num_pages = len(user_stats), 1
+    else:
+        count = CourseDiscussionUserStats.objects.filter(course_id=course_key).count()
+        num_pages = max(math.ceil(count / per_page), 1)
+    return {
+        'user_stats': user_stats,
+        'page': page,
+        'num_pages': num_pages,
+        'count': count,
+    }
+
+
 def get_course_staff_users_list(course_id):
     """
     Gets user ids for Staff roles for course discussions.
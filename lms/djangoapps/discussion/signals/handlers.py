@@ -3,6 +3,7 @@ Signal handlers related to discussions.
 """
 
 import logging
+from collections import Counter, defaultdict
 
 from django.conf import settings
 from django.dispatch import receiver
@@ -17,7 +18,9 @@ from lms.djangoapps.discussion.rest_api.tasks import (
     send_response_notifications,
     send_thread_created_notification
 )
+from lms.djangoapps.discussion.toggles import ENABLE_MATERIALIZED_USER_STATS
 from openedx.core.djangoapps.django_comment_common import signals
+from openedx.core.djangoapps.django_comment_common.models import CourseDiscussionUserStats
 from openedx.core.djangoapps.site_configuration.models import SiteConfiguration
 from openedx.core.djangoapps.theming.helpers import get_current_site
 from xmodule.modulestore.django import SignalHandler, modulestore
@@ -197,3 +200,89 @@ def create_response_endorsed_on_thread_notification(*args, **kwargs):
     course_key_str = comment.attributes['course_id']
     endorsed_by = kwargs['user'].id
     send_response_endorsed_notifications.apply_async(args=[thread_id, kwargs['post'].id, course_key_str, endorsed_by])
+
+
+def _update_materialized_user_stats(post, user_id, touch=False, **deltas):
+    """
+    Apply `deltas` to the materialized discussion stats of `user_id` in the post's course.
+    """
+    course_key = CourseKey.from_string(str(post.attributes['course_id']))
+    if not ENABLE_MATERIALIZED_USER_STATS.is_enabled(course_key) or not user_id:
+        return
+    CourseDiscussionUserStats.update_counts(course_key, int(user_id), touch=touch, **deltas)
+
+
+def _content_count_field(post):
+    """
+    Returns the stats field counting posts of the same kind as `post`.
+    """
+    if post.type == 'thread':
+        return 'threads'
+    return 'responses' if post.attributes.get('parent_id') is None else 'replies'
+
+
+def _comment_data_count_field(comment):
+    """
+    Returns the stats field counting comments of the same kind as the forum data `comment`.
+    """
+    return 'responses' if comment.get('parent_id') is None else 'replies'
+
+
+@receiver(signals.thread_created)
+@receiver(signals.comment_created)
+def increment_user_stats_on_post_created(sender, user, post, **kwargs):  # pylint: disable=unused-argument
+    """
+    Counts a new thread, response or reply towards its author's course stats.
+    """
+    _update_materialized_user_stats(post, user.id, touch=True, **{_content_count_field(post): 1})
+
+
+@receiver(signals.thread_deleted)
+@receiver(signals.comment_deleted)
+def decrement_user_stats_on_post_deleted(
+    sender, user, post, descendants=(), **kwargs
+):  # pylint: disable=unused-argument
+    """
+    Removes a deleted thread, response or reply from its author's course stats, along
+    with the responses and replies deleted with it and the reports of all of them.
+
+    The deleting user may be a moderator, so the authors are taken from the posts.
+    """
+    deltas = defaultdict(Counter)
+    author_deltas = deltas[post.attributes.get('user_id')]
+    author_deltas[_content_count_field(post)] -= 1
+    if post.attributes.get('abuse_flaggers'):
+        author_deltas['active_flags'] -= 1
+    for comment in descendants:
+        comment_deltas = deltas[comment.get('user_id')]
+        comment_deltas[_comment_data_count_field(comment)] -= 1
+        if comment.get('abuse_flaggers'):
+            comment_deltas['active_flags'] -= 1
+    for user_id, user_deltas in deltas.items():
+        _update_materialized_user_stats(post, user_id, **user_deltas)
+
+
+@receiver(signals.comment_flagged)
+@receiver(signals.thread_flagged)
+def update_user_stats_on_post_flagged(sender, user, post, **kwargs):  # pylint: disable=unused-argument
+    """
+    Counts a newly reported post towards its author's active flags.
+
+    Posts that already had other reporters are counted once.
+    """
+    if len(post.attributes.get('abuse_flaggers') or []) != 1:
+        return
+    _update_materialized_user_stats(post, post.attributes.get('user_id'), active_flags=1)
+
+
+@receiver(signals.comment_unflagged)
+@receiver(signals.thread_unflagged)
+def update_user_stats_on_post_unflagged(
+    sender, user, post, was_flagged=False, **kwargs
+):  # pylint: disable=unused-argument
+    """
+    Removes a post from its author's active flags once its last report is cleared.
+    """
+    if not was_flagged or post.attributes.get('abuse_flaggers'):
+        return
+    _update_materialized_user_stats(post, post.attributes.get('user_id'), active_flags=-1)
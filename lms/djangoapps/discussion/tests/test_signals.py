@@ -5,14 +5,21 @@ from unittest import mock
 
 from django.test import TestCase
 from edx_django_utils.cache import RequestCache
+from edx_toggles.toggles.testutils import override_waffle_flag
+from opaque_keys.edx.keys import CourseKey
 from xmodule.modulestore.tests.django_utils import ModuleStoreTestCase
 from xmodule.modulestore.tests.factories import (
     CourseFactory,
     BlockFactory
 )
 
+from common.djangoapps.student.tests.factories import UserFactory
+from lms.djangoapps.discussion.signals import handlers
 from lms.djangoapps.discussion.signals.handlers import ENABLE_FORUM_NOTIFICATIONS_FOR_SITE_KEY
+from lms.djangoapps.discussion.toggles import ENABLE_MATERIALIZED_USER_STATS
 from openedx.core.djangoapps.django_comment_common import models, signals
+from openedx.core.djangoapps.django_comment_common.comment_client.comment import Comment
+from openedx.core.djangoapps.django_comment_common.comment_client.thread import Thread
 from openedx.core.djangoapps.site_configuration.tests.factories import SiteConfigurationFactory, SiteFactory
 
 
@@ -78,6 +85,117 @@ class SendMessageHandlerTestCase(TestCase):  # lint-amnesty, pylint: disable=mis
         assert not mock_send_message.called
 
 
+@override_waffle_flag(ENABLE_MATERIALIZED_USER_STATS, active=True)
+class MaterializedUserStatsHandlerTestCase(TestCase):
+    """
+    Tests for keeping the materialized discussion user stats up to date.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.course_key = CourseKey.from_string('course-v1:edX+DemoX+Demo_Course')
+        self.author = UserFactory()
+        self.moderator = UserFactory()
+
+    def _post(self, cls, **attributes):
+        return cls(id='post-id', course_id=str(self.course_key), user_id=str(self.author.id), **attributes)
+
+    def _stats(self):
+        return models.CourseDiscussionUserStats.objects.get(course_id=self.course_key, user=self.author)
+
+    def test_created_and_deleted_posts(self):
+        handlers.increment_user_stats_on_post_created(None, self.author, self._post(Thread))
+        handlers.increment_user_stats_on_post_created(None, self.author, self._post(Comment, parent_id=None))
+        handlers.increment_user_stats_on_post_created(None, self.author, self._post(Comment, parent_id='response'))
+        handlers.increment_user_stats_on_post_created(None, self.author, self._post(Comment, parent_id='response'))
+        stats = self._stats()
+        assert (stats.threads, stats.responses, stats.replies) == (1, 1, 2)
+        assert stats.last_activity_at is not None
+
+        # Deleting by a moderator is counted against the post author.
+        handlers.decrement_user_stats_on_post_deleted(None, self.moderator, self._post(Comment, parent_id='response'))
+        handlers.decrement_user_stats_on_post_deleted(None, self.moderator, self._post(Thread))
+        handlers.decrement_user_stats_on_post_deleted(None, self.moderator, self._post(Thread))
+        stats = self._stats()
+        assert (stats.threads, stats.responses, stats.replies) == (0, 1, 1)
+        assert not models.CourseDiscussionUserStats.objects.filter(user=self.moderator).exists()
+
+    def test_deleted_thread_descendants(self):
+        other_author = UserFactory()
+        handlers.increment_user_stats_on_post_created(None, self.author, self._post(Thread))
+        handlers.increment_user_stats_on_post_created(None, self.author, self._post(Comment, parent_id=None))
+        for __ in range(2):
+            handlers.increment_user_stats_on_post_created(
+                None, other_author, self._post(Comment, parent_id='response', user_id=str(other_author.id)),
+            )
+        descendants = [
+            {'id': 'response', 'user_id': str(self.author.id), 'parent_id': None},
+            {'id': 'reply-1', 'user_id': str(other_author.id), 'parent_id': 'response'},
+            {'id': 'reply-2', 'user_id': str(other_author.id), 'parent_id': 'response'},
+        ]
+        handlers.decrement_user_stats_on_post_deleted(
+            None, self.moderator, self._post(Thread), descendants=descendants,
+        )
+        stats = self._stats()
+        assert (stats.threads, stats.responses, stats.replies) == (0, 0, 0)
+        other_stats = models.CourseDiscussionUserStats.objects.get(course_id=self.course_key, user=other_author)
+        assert (other_stats.threads, other_stats.responses, other_stats.replies) == (0, 0, 0)
+
+    def test_deleted_flagged_posts(self):
+        other_author = UserFactory()
+        handlers.update_user_stats_on_post_flagged(None, self.moderator, self._post(Thread, abuse_flaggers=['1']))
+        handlers.update_user_stats_on_post_flagged(
+            None, self.moderator, self._post(Comment, abuse_flaggers=['1'], user_id=str(other_author.id)),
+        )
+        descendants = [
+            {'id': 'response', 'user_id': str(other_author.id), 'parent_id': None, 'abuse_flaggers': ['1']},
+        ]
+        handlers.decrement_user_stats_on_post_deleted(
+            None, self.moderator, self._post(Thread, abuse_flaggers=['1']), descendants=descendants,
+        )
+        assert self._stats().active_flags == 0
+        assert models.CourseDiscussionUserStats.objects.get(
+            course_id=self.course_key, user=other_author,
+        ).active_flags == 0
+
+    def test_unflagged_posts(self):
+        handlers.update_user_stats_on_post_flagged(None, self.moderator, self._post(Thread, abuse_flaggers=['1']))
+        handlers.update_user_stats_on_post_flagged(None, self.moderator, self._post(Comment, abuse_flaggers=['1']))
+        # A post which still has other reporters stays flagged.
+        handlers.update_user_stats_on_post_unflagged(
+            None, self.moderator, self._post(Thread, abuse_flaggers=['2']), was_flagged=True,
+        )
+        # A post which had no reporters was not counted.
+        handlers.update_user_stats_on_post_unflagged(
+            None, self.moderator, self._post(Thread, abuse_flaggers=[]), was_flagged=False,
+        )
+        assert self._stats().active_flags == 2
+        handlers.update_user_stats_on_post_unflagged(
+            None, self.moderator, self._post(Comment, abuse_flaggers=[]), was_flagged=True,
+        )
+        assert self._stats().active_flags == 1
+
+    def test_counts_never_drop_below_zero(self):
+        models.CourseDiscussionUserStats.update_counts(self.course_key, self.author.id, threads=1, replies=2)
+        models.CourseDiscussionUserStats.update_counts(
+            self.course_key, self.author.id, threads=-2, replies=-1, active_flags=-1,
+        )
+        stats = self._stats()
+        assert (stats.threads, stats.replies, stats.active_flags) == (0, 1, 0)
+
+    def test_flagged_posts(self):
+        handlers.update_user_stats_on_post_flagged(None, self.moderator, self._post(Thread, abuse_flaggers=['1']))
+        # Additional reporters of an already reported post are not counted again.
+        handlers.update_user_stats_on_post_flagged(None, self.moderator, self._post(Thread, abuse_flaggers=['1', '2']))
+        handlers.update_user_stats_on_post_flagged(None, self.moderator, self._post(Comment, abuse_flaggers=['1']))
+        assert self._stats().active_flags == 2
+
+    @override_waffle_flag(ENABLE_MATERIALIZED_USER_STATS, active=False)
+    def test_disabled(self):
+        handlers.increment_user_stats_on_post_created(None, self.author, self._post(Thread))
+        assert not models.CourseDiscussionUserStats.objects.exists()
+
+
 class CoursePublishHandlerTestCase(ModuleStoreTestCase):
     """
     Tests for discussion updates on course publish.
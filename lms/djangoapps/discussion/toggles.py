@@ -37,3 +37,17 @@ ONLY_VERIFIED_USERS_CAN_POST = CourseWaffleFlag(
 # .. toggle_creation_date: 2025-07-29
 # .. toggle_target_removal_date: 2026-07-29
 ENABLE_RATE_LIMIT_IN_DISCUSSION = CourseWaffleFlag(f'{WAFFLE_FLAG_NAMESPACE}.enable_rate_limit', __name__)
+
+
+# .. toggle_name: discussions.enable_materialized_user_stats
+# .. toggle_implementation: CourseWaffleFlag
+# .. toggle_default: False
+# .. toggle_description: Waffle flag to keep per-course discussion user stats in the LMS database, updated from
+#   discussion signals, and serve the course learners view from them instead of the forum. Run the
+#   backfill_discussion_user_stats management command for a course right after enabling this flag for it.
+# .. toggle_use_cases: temporary, open_edx
+# .. toggle_creation_date: 2026-10-19
+# .. toggle_target_removal_date: 2027-04-19
+ENABLE_MATERIALIZED_USER_STATS = CourseWaffleFlag(
+    f'{WAFFLE_FLAG_NAMESPACE}.enable_materialized_user_stats', __name__
+)
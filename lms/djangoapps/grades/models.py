@@ -623,6 +623,22 @@ class PersistentCourseGrade(TimeStampedModel):
             cls.objects.filter(user_id__in=[user.id for user in users], course_id=course_id)
         }
 
+    @classmethod
+    def prefetch_for_user(cls, user_id, course_ids):
+        """
+        Prefetches grades for the given user across the given courses.
+
+        This is the counterpart of `prefetch` for pages that show one user in
+        many courses (e.g. the learner dashboard).
+        """
+        grades_by_course = {
+            grade.course_id: grade
+            for grade in cls.objects.filter(user_id=user_id, course_id__in=course_ids)
+        }
+        cache = get_cache(cls._CACHE_NAMESPACE)
+        for course_id in course_ids:
+            cache[cls._user_cache_key(user_id, course_id)] = grades_by_course.get(course_id)
+
     @classmethod
     def clear_prefetched_data(cls, course_key):
         """
@@ -641,6 +657,13 @@ class PersistentCourseGrade(TimeStampedModel):
 
         Raises PersistentCourseGrade.DoesNotExist if applicable
         """
+        user_cache_key = cls._user_cache_key(user_id, course_id)
+        if user_cache_key in get_cache(cls._CACHE_NAMESPACE):
+            grade = get_cache(cls._CACHE_NAMESPACE)[user_cache_key]
+            if grade is None:
+                raise cls.DoesNotExist
+            return grade
+
         try:
             prefetched_grades = get_cache(cls._CACHE_NAMESPACE)[cls._cache_key(course_id)]
             try:
@@ -693,11 +716,18 @@ class PersistentCourseGrade(TimeStampedModel):
         course_cache = get_cache(cls._CACHE_NAMESPACE).get(cls._cache_key(course_id))
         if course_cache is not None:
             course_cache[user_id] = grade
+        user_cache_key = cls._user_cache_key(user_id, course_id)
+        if user_cache_key in get_cache(cls._CACHE_NAMESPACE):
+            get_cache(cls._CACHE_NAMESPACE)[user_cache_key] = grade
 
     @classmethod
     def _cache_key(cls, course_id):
         return f"grades_cache.{course_id}"
 
+    @classmethod
+    def _user_cache_key(cls, user_id, course_id):
+        return f"grades_cache.{course_id}.{user_id}"
+
     @staticmethod
     def _emit_grade_calculated_event(grade):
         events.course_grade_calculated(grade)
@@ -710,6 +740,7 @@ class PersistentCourseGrade(TimeStampedModel):
             course_id: The id of the course associated with the desired grade
             user_id: The user associated with the desired grade
         """
+        get_cache(cls._CACHE_NAMESPACE).pop(cls._user_cache_key(user_id, course_id), None)
         try:
             cls.objects.get(user_id=user_id, course_id=course_id).delete()
             get_cache(cls._CACHE_NAMESPACE)[cls._cache_key(course_id)].pop(user_id)
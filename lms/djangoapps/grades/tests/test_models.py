@@ -16,6 +16,7 @@ import pytz
 from django.db.utils import IntegrityError
 from django.test import TestCase
 from django.utils.timezone import now
+from edx_django_utils.cache import RequestCache
 from freezegun import freeze_time
 from opaque_keys import InvalidKeyError
 from opaque_keys.edx.locator import BlockUsageLocator, CourseLocator
@@ -488,6 +489,19 @@ class PersistentCourseGradesTest(GradesModelTestCase):
         with pytest.raises(PersistentCourseGrade.DoesNotExist):
             PersistentCourseGrade.read(self.params["user_id"], self.params["course_id"])
 
+    def test_prefetch_for_user(self):
+        self.addCleanup(RequestCache.clear_all_namespaces)
+        other_course_key = CourseLocator(org='some_org', course='some_other_course', run='some_run')
+        created_grade = PersistentCourseGrade.update_or_create(**self.params)
+
+        with self.assertNumQueries(1):
+            PersistentCourseGrade.prefetch_for_user(self.params["user_id"], [self.course_key, other_course_key])
+
+        with self.assertNumQueries(0):
+            assert PersistentCourseGrade.read(self.params["user_id"], self.course_key) == created_grade
+            with pytest.raises(PersistentCourseGrade.DoesNotExist):
+                PersistentCourseGrade.read(self.params["user_id"], other_course_key)
+
     def test_update_or_create_event(self):
         with patch('lms.djangoapps.grades.events.tracker') as tracker_mock:
             grade = PersistentCourseGrade.update_or_create(**self.params)
@@ -14,6 +14,7 @@ from edx_when import api
 from pytz import UTC
 
 from common.djangoapps.student.models import CourseEnrollment, get_user_by_username_or_email
+from openedx.core.djangoapps.course_date_signals.relative_dates import get_relative_dates_template
 from openedx.core.djangoapps.schedules.models import Schedule
 
 
@@ -125,11 +126,15 @@ def get_units_with_due_date(course):
 
     version = getattr(course, 'course_version', None)
 
-    # Pass in a schedule here so that we get back any relative dates in the course, but actual value
-    # doesn't matter, since we don't care about the dates themselves, just whether they exist.
-    # Thus we don't save or care about this temporary schedule object.
-    schedule = Schedule(start_date=course.start)
-    course_dates = api.get_dates_for_course(course.id, schedule=schedule, published_version=version)
+    # Resolve the dates for a schedule starting with the course so that we get back any relative dates in the
+    # course, but actual value doesn't matter, since we don't care about the dates themselves, just whether they exist.
+    relative_dates_template = get_relative_dates_template(course.id, version) if course.self_paced else None
+    if relative_dates_template:
+        course_dates = relative_dates_template.dates_for_learner(course.start)
+    else:
+        # We don't save or care about this temporary schedule object.
+        schedule = Schedule(start_date=course.start)
+        course_dates = api.get_dates_for_course(course.id, schedule=schedule, published_version=version)
 
     def visit(node):
         """
@@ -9,10 +9,13 @@ from urllib.parse import urlencode
 from uuid import uuid4
 
 import ddt
+from completion.models import BlockCompletion
 from django.conf import settings
 from django.urls import reverse
 from django.utils import timezone
+from django.db import connection
 from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from opaque_keys.edx.keys import CourseKey
 from rest_framework.test import APITestCase
 
@@ -41,6 +44,9 @@ from lms.djangoapps.learner_home.views import (
     get_entitlements,
     get_social_share_settings,
     get_course_share_urls,
+    get_resume_urls_for_course_enrollments,
+    get_user_grade_passing_statuses,
+    prefetch_course_grades,
 )
 from openedx.core.djangoapps.catalog.tests.factories import (
     CourseFactory as CatalogCourseFactory,
@@ -491,6 +497,57 @@ class TestGetCourseShareUrls(TestCase):
         }
 
 
+class TestBulkCourseData(SharedModuleStoreTestCase):
+    """Per-course dashboard data is loaded with a fixed number of queries, however many enrollments there are"""
+
+    def setUp(self):
+        super().setUp()
+        self.user = UserFactory()
+
+    def _get_enrollments(self, num_enrollments):
+        """Create enrollments and load them the same way the dashboard does"""
+        for _ in range(num_enrollments):
+            create_test_enrollment(self.user)
+        course_enrollments, _ = get_enrollments(self.user, None, None)
+        return course_enrollments
+
+    def test_resume_urls(self):
+        # Given enrollments where only one course has been started
+        started_enrollment, unstarted_enrollment = create_test_enrollment(self.user), create_test_enrollment(self.user)
+        first_block_key = started_enrollment.course_id.make_usage_key("html", "first")
+        last_block_key = started_enrollment.course_id.make_usage_key("html", "last")
+        BlockCompletion.objects.submit_completion(self.user, first_block_key, 1.0)
+        BlockCompletion.objects.submit_completion(self.user, last_block_key, 1.0)
+
+        # When I request resume urls, all courses are resolved in one query
+        with self.assertNumQueries(1):
+            resume_urls = get_resume_urls_for_course_enrollments(
+                self.user, [started_enrollment, unstarted_enrollment]
+            )
+
+        # Then I get a link to the last completed block of the started course only
+        assert resume_urls == {
+            started_enrollment.course_id: reverse(
+                "jump_to",
+                kwargs={"course_id": started_enrollment.course_id, "location": last_block_key},
+            ),
+            unstarted_enrollment.course_id: None,
+        }
+
+    def test_grade_passing_statuses_query_budget(self):
+        """Query count for grade statuses does not grow with the number of enrollments"""
+        query_counts = []
+        for num_enrollments in (1, 3):
+            course_enrollments = self._get_enrollments(num_enrollments)
+            with CaptureQueriesContext(connection) as queries:
+                prefetch_course_grades(self.user, course_enrollments)
+                grade_statuses = get_user_grade_passing_statuses(course_enrollments)
+            assert len(grade_statuses) == len(course_enrollments)
+            query_counts.append(len(queries))
+
+        assert query_counts[0] == query_counts[1]
+
+
 class BaseTestDashboardView(SharedModuleStoreTestCase, APITestCase):
     """Base class for test setup"""
 
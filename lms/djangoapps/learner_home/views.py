@@ -5,8 +5,7 @@ Views for Learner Home
 import logging
 from collections import OrderedDict
 
-from completion.exceptions import UnavailableCompletionData
-from completion.utilities import get_key_to_last_completed_block
+from completion.models import BlockCompletion
 from django.conf import settings
 from django.urls import reverse
 from edx_django_utils import monitoring as monitoring_utils
@@ -43,9 +42,11 @@ from common.djangoapps.util.milestones_helpers import (
 )
 from lms.djangoapps.bulk_email.models import Optout
 from lms.djangoapps.bulk_email.models_api import is_bulk_email_feature_enabled
+from lms.djangoapps.certificates.api import certificate_statuses_for_student
 from lms.djangoapps.commerce.utils import EcommerceService
 from lms.djangoapps.courseware.access import administrative_accesses_to_course_for_user
 from lms.djangoapps.courseware.access_utils import check_course_open_for_learner
+from lms.djangoapps.grades.models import PersistentCourseGrade
 from lms.djangoapps.learner_home.serializers import (
     LearnerDashboardSerializer,
 )
@@ -227,17 +228,36 @@ def get_ecommerce_payment_page(user):
     )
 
 
+@function_trace("prefetch_course_grades")
+def prefetch_course_grades(user, course_enrollments):
+    """
+    Load the user's persisted grades for all enrolled courses with one query,
+    so that per-course grade reads (passing statuses, certificate info) are
+    served from the request cache.
+    """
+    PersistentCourseGrade.prefetch_for_user(
+        user.id, [enrollment.course_id for enrollment in course_enrollments]
+    )
+
+
 @function_trace("get_cert_statuses")
 def get_cert_statuses(user, course_enrollments):
     """Get cert status by course for user enrollments"""
 
     cert_statuses = {}
 
+    # Look up the generated certificates for all courses at once
+    certificate_statuses = certificate_statuses_for_student(
+        user, [enrollment.course_id for enrollment in course_enrollments]
+    )
+
     for enrollment in course_enrollments:
         # APER-2171 - trying to get a cert for a deleted course can throw an exception
         # Wrap in exception handling to avoid this issue.
         try:
-            certificate_for_course = cert_info(user, enrollment)
+            certificate_for_course = cert_info(
+                user, enrollment, cert_status=certificate_statuses.get(enrollment.course_id)
+            )
 
             if certificate_for_course:
                 cert_statuses[enrollment.course_id] = certificate_for_course
@@ -261,20 +281,25 @@ def get_resume_urls_for_course_enrollments(user, course_enrollments):
     """
     Modeled off of get_resume_urls_for_enrollments but removes check for actual presence of block
     in course structure for better performance.
+
+    The last completed block of every course is fetched with a single query
+    instead of one query per enrollment.
     """
+    last_completed_blocks = BlockCompletion.latest_blocks_completed_all_courses(user)
+
     resume_course_urls = OrderedDict()
     for enrollment in course_enrollments:
+        # If the user hasn't started the course, the jump URL will be None
         url_to_block = None
-        try:
-            block_key = get_key_to_last_completed_block(user, enrollment.course_id)
-            if block_key:
-                url_to_block = reverse(
-                    "jump_to",
-                    kwargs={"course_id": enrollment.course_id, "location": block_key},
-                )
-        except UnavailableCompletionData:
-            # This is acceptable, the user hasn't started the course so jump URL will be None
-            pass
+        __, block_key = last_completed_blocks.get(enrollment.course_id, (None, None))
+        if block_key:
+            if block_key.run is None:
+                # Block keys of old mongo courses don't include the run.
+                block_key = block_key.replace(course_key=enrollment.course_id)
+            url_to_block = reverse(
+                "jump_to",
+                kwargs={"course_id": enrollment.course_id, "location": block_key},
+            )
         resume_course_urls[enrollment.course_id] = url_to_block
     return resume_course_urls
 
@@ -512,6 +537,10 @@ class InitializeView(APIView):  # pylint: disable=unused-argument
             user, course_enrollments
         )
 
+        # Load persisted grades for all courses up front, they are used for
+        # both grade passing statuses and cert statuses
+        prefetch_course_grades(user, course_enrollments)
+
         # Get grade passing status by course
         grade_statuses = get_user_grade_passing_statuses(course_enrollments)
 
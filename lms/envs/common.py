@@ -3912,6 +3912,25 @@ NOTIFY_CREDENTIALS_FREQUENCY = 14400
 COMMENTS_SERVICE_URL = ''
 COMMENTS_SERVICE_KEY = ''
 
+# .. setting_name: COMMENTS_SERVICE_POOL_SIZE
+# .. setting_default: 0
+# .. setting_description: Number of keep-alive connections to the comments service kept in a shared,
+#     per-process HTTP session. When 0, every comments service request opens a new connection.
+COMMENTS_SERVICE_POOL_SIZE = 0
+
+# .. setting_name: COMMENTS_SERVICE_MAX_RETRIES
+# .. setting_default: 0
+# .. setting_description: Number of times a failed connection to the comments service is retried when
+#     using the pooled session (see COMMENTS_SERVICE_POOL_SIZE). Only idempotent requests are retried.
+COMMENTS_SERVICE_MAX_RETRIES = 0
+
+# .. setting_name: COMMENTS_SERVICE_COALESCE_GETS
+# .. setting_default: False
+# .. setting_description: When True, identical GET requests to the comments service made while handling
+#     a single LMS request are only sent once, and the response is reused. Any write to the comments
+#     service discards the reused responses.
+COMMENTS_SERVICE_COALESCE_GETS = False
+
 # Reverification checkpoint name pattern
 CHECKPOINT_PATTERN = r'(?P<checkpoint_name>[^/]+)'
 
@@ -10,7 +10,7 @@ from typing import Dict, FrozenSet, List, Optional, Union
 
 from django.db import transaction
 from django.db.models.query import QuerySet
-from edx_django_utils.cache import TieredCache
+from edx_django_utils.cache import TieredCache, get_cache_key
 from edx_django_utils.monitoring import function_trace, set_custom_attribute
 from opaque_keys import OpaqueKey
 from opaque_keys.edx.keys import CourseKey
@@ -42,6 +42,7 @@ from ..models import (
     UserPartitionGroup
 )
 from .permissions import can_see_all_content
+from .processors.base import OutlineProcessor
 from .processors.cohort_partition_groups import CohortPartitionGroupsOutlineProcessor
 from .processors.content_gating import ContentGatingOutlineProcessor
 from .processors.enrollment import EnrollmentOutlineProcessor
@@ -53,6 +54,10 @@ from .processors.visibility import VisibilityOutlineProcessor
 
 log = logging.getLogger(__name__)
 
+# How long the results of cacheable outline processors are kept. They are keyed by the
+# published version of the outline, so this only bounds how long unused entries are kept.
+OUTLINE_PROCESSOR_RESULTS_CACHE_TIMEOUT = 5 * 60
+
 # Public API...
 __all__ = [
     'get_content_errors',
@@ -349,8 +354,9 @@ def _get_user_course_outline_and_processors(course_key: CourseKey,  # lint-amnes
         if not user_can_see_all_content:
             # function_trace lets us see how expensive each processor is being.
             with function_trace(f'learning_sequences.api.outline_processors.{name}'):
-                processor_usage_keys_removed = processor.usage_keys_to_remove(full_course_outline)
-                processor_inaccessible_sequences = processor.inaccessible_sequences(full_course_outline)
+                processor_usage_keys_removed, processor_inaccessible_sequences = _get_processor_results(
+                    name, processor, full_course_outline
+                )
                 usage_keys_to_remove |= processor_usage_keys_removed
                 inaccessible_sequences |= processor_inaccessible_sequences
 
@@ -382,6 +388,45 @@ def _get_user_course_outline_and_processors(course_key: CourseKey,  # lint-amnes
     return user_course_outline, processors
 
 
+def _get_processor_results(name: str,
+                           processor: OutlineProcessor,
+                           full_course_outline: CourseOutlineData):
+    """
+    Return (usage_keys_to_remove, inaccessible_sequences) for a processor.
+
+    Processors that declare their per-user inputs via `cache_key_inputs` have
+    their results memoized by course outline version and those inputs, so that
+    learners who share the same enrollment track, cohort, etc. reuse the same
+    pruning results instead of recomputing them on every request.
+    """
+    cache_key_inputs = processor.cache_key_inputs()
+    if cache_key_inputs is None:
+        return (
+            frozenset(processor.usage_keys_to_remove(full_course_outline)),
+            frozenset(processor.inaccessible_sequences(full_course_outline)),
+        )
+
+    cache_key = get_cache_key(
+        prefix="learning_sequences.api.outline_processors.v1",
+        processor=name,
+        course_key=full_course_outline.course_key,
+        published_version=full_course_outline.published_version,
+        inputs=cache_key_inputs,
+    )
+    cached_result = TieredCache.get_cached_response(cache_key)
+    if cached_result.is_found:
+        set_custom_attribute(f'learning_sequences.api.outline_processors.{name}.cache_hit', True)
+        return cached_result.value
+
+    set_custom_attribute(f'learning_sequences.api.outline_processors.{name}.cache_hit', False)
+    result = (
+        frozenset(processor.usage_keys_to_remove(full_course_outline)),
+        frozenset(processor.inaccessible_sequences(full_course_outline)),
+    )
+    TieredCache.set_all_tiers(cache_key, result, OUTLINE_PROCESSOR_RESULTS_CACHE_TIMEOUT)
+    return result
+
+
 @function_trace('learning_sequences.api.replace_course_outline')
 def replace_course_outline(course_outline: CourseOutlineData,
                            content_errors: Optional[List[ContentErrorData]] = None):
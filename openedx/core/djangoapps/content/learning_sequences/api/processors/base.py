@@ -17,15 +17,23 @@ class OutlineProcessor:
     """
     Base class for manipulating the Course Outline.
 
-    You can inherit from this class and extend any of its four main methods:
-    __init__, load_data, inaccessible_sequences, usage_keys_to_remove.
+    You can inherit from this class and extend any of its five main methods:
+    __init__, load_data, cache_key_inputs, inaccessible_sequences,
+    usage_keys_to_remove.
 
     An OutlineProcessor is invoked synchronously during a request for the
     CourseOutline. The steps are:
         * __init__
         * load_data
+        * cache_key_inputs
         * inaccessible_sequences, usage_keys_to_remove (no ordering guarantee)
 
+    If cache_key_inputs returns something other than None, the results of
+    inaccessible_sequences and usage_keys_to_remove are cached, keyed by the
+    course outline version and those inputs. Users who share the same inputs
+    (e.g. the same enrollment track or cohort) then reuse the same results, and
+    the last step is skipped entirely on a cache hit.
+
     Also note that you should not assume any ordering relative to any other
     OutlineProcessor. Once async support works its way fully into Django, we'll
     likely even want to run these in parallel.
@@ -61,6 +69,31 @@ class OutlineProcessor:
         """
         pass  # lint-amnesty, pylint: disable=unnecessary-pass
 
+    def cache_key_inputs(self):
+        """
+        Return a hashable summary of the per-user data this processor uses, or None.
+
+        This is called after load_data. The results of inaccessible_sequences and
+        usage_keys_to_remove are cached under the course outline version plus the
+        value returned here, and reused for every user for whom this returns an
+        equal value. So subclasses that override it must return a value that:
+
+        * includes every piece of user data those two methods read (e.g. the
+          user's enrollment track or cohort group), since any data left out will
+          leak between users sharing a cache entry;
+        * is only returned when those two methods don't depend on `at_time`, or on
+          anything else that changes without the outline being published again
+          (processors whose results do, like ScheduleOutlineProcessor, must
+          return None);
+        * is stable across processes and has a stable string form, since it is
+          part of the cache key: use None, ints, strs, bools and tuples of those,
+          never ids of Python objects, sets or dicts.
+
+        Returning None (the default) means that the results are not cacheable,
+        and they will be recomputed for every request.
+        """
+        return None
+
     def inaccessible_sequences(self, full_course_outline: CourseOutlineData):  # pylint: disable=unused-argument
         """
         Return a set/frozenset of Sequence UsageKeys that are not accessible.
@@ -43,6 +43,12 @@ class CohortPartitionGroupsOutlineProcessor(OutlineProcessor):
             if user_cohort:
                 self.user_cohort_group_id, _ = get_group_info_for_cohort(user_cohort)
 
+    def cache_key_inputs(self):
+        """
+        Users whose cohorts map to the same content group share the same results.
+        """
+        return (self.cohorted_partition_id, self.user_cohort_group_id)
+
     def _is_user_excluded_by_partition_group(self, user_partition_groups) -> bool:
         """
         Is the user part of the group to which the block is restricting content?
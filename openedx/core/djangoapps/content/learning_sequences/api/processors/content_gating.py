@@ -39,6 +39,12 @@ class ContentGatingOutlineProcessor(OutlineProcessor):
                 self.user, self.course_key
             )
 
+    def cache_key_inputs(self):
+        """
+        Users with the same outstanding required content share the same results.
+        """
+        return (tuple(sorted(self.required_content or ())), self.can_skip_entrance_exam)
+
     def inaccessible_sequences(self, full_course_outline):
         """
         Mark any section that is gated by required content as inaccessible
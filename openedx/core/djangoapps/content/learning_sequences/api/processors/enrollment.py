@@ -12,21 +12,38 @@ class EnrollmentOutlineProcessor(OutlineProcessor):
     """
     Simple OutlineProcessor that removes items based on Enrollment and course visibility setting.
     """
+    def __init__(self, course_key, user, at_time):
+        super().__init__(course_key, user, at_time)
+        self.is_unenrolled_access_enabled = False
+        self.is_enrolled = False
+
+    def load_data(self, full_course_outline):
+        """
+        Check the unenrolled access flag and whether the user is enrolled.
+        """
+        self.is_unenrolled_access_enabled = COURSE_ENABLE_UNENROLLED_ACCESS_FLAG.is_enabled(self.course_key)
+        self.is_enrolled = CourseEnrollment.is_enrolled(self.user, self.course_key)
+
+    def cache_key_inputs(self):
+        """
+        Users who are all enrolled, or all not enrolled, share the same results.
+        """
+        return (self.is_unenrolled_access_enabled, self.is_enrolled)
+
     def usage_keys_to_remove(self, full_course_outline):
         """
         Return sequences/sections to be removed
         """
         # Public outlines and courses don't need to hide anything from the outline.
-        is_unenrolled_access_enabled = COURSE_ENABLE_UNENROLLED_ACCESS_FLAG.is_enabled(self.course_key)
         is_course_outline_publicly_visible = (
             full_course_outline.course_visibility in [CourseVisibility.PUBLIC, CourseVisibility.PUBLIC_OUTLINE]
         )
 
-        if is_unenrolled_access_enabled and is_course_outline_publicly_visible:
+        if self.is_unenrolled_access_enabled and is_course_outline_publicly_visible:
             return frozenset()
 
         # Students who are enrolled can see the full outline.
-        if CourseEnrollment.is_enrolled(self.user, self.course_key):
+        if self.is_enrolled:
             return frozenset()
 
         # Otherwise remove everything:
@@ -40,7 +57,6 @@ class EnrollmentOutlineProcessor(OutlineProcessor):
         Return a set/frozenset of Sequence UsageKeys that are not accessible.
         """
         is_public_outline = full_course_outline.course_visibility == CourseVisibility.PUBLIC_OUTLINE
-        is_enrolled_in_course = CourseEnrollment.is_enrolled(self.user, self.course_key)
-        if is_public_outline and not is_enrolled_in_course:
+        if is_public_outline and not self.is_enrolled:
             return frozenset(full_course_outline.sequences)
         return frozenset()
@@ -47,6 +47,12 @@ class EnrollmentTrackPartitionGroupsOutlineProcessor(OutlineProcessor):
         # TODO: fix type annotation: https://github.com/openedx/tcril-engineering/issues/313
         self.user_group = self.enrollment_track_groups.get(ENROLLMENT_TRACK_PARTITION_ID)  # type: ignore
 
+    def cache_key_inputs(self):
+        """
+        Users in the same enrollment track share the same results.
+        """
+        return (self.user_group.id if self.user_group else None,)
+
     def _is_user_excluded_by_partition_group(self, user_partition_groups):
         """
         Is the user part of the group to which the block is restricting content?
@@ -48,6 +48,17 @@ class TeamPartitionGroupsOutlineProcessor(OutlineProcessor):
             partition_dict_key="id",
         )
 
+    def cache_key_inputs(self):
+        """
+        Users in the same teams share the same results.
+        """
+        return (
+            CONTENT_GROUPS_FOR_TEAMS.is_enabled(self.course_key),
+            tuple(sorted(
+                (partition_id, group.id) for partition_id, group in self.current_user_groups.items()
+            )),
+        )
+
     def _is_user_excluded_by_partition_group(self, user_partition_groups):
         """
         Is the user part of the group to which the block is restricting content?
@@ -56,6 +56,7 @@ from ..outlines import (
     replace_course_outline,
 )
 from ..processors.enrollment_track_partition_groups import EnrollmentTrackPartitionGroupsOutlineProcessor
+from ..processors.visibility import VisibilityOutlineProcessor
 from .test_data import generate_sections
 
 
@@ -1205,6 +1206,27 @@ class VisbilityTestCase(OutlineProcessorTestCase):
         assert len(student_details.outline.sequences) == 1
         assert self.normal_in_normal_key in student_details.outline.sequences
 
+    def test_processor_results_shared_between_users(self):
+        """
+        Users with the same processor inputs reuse the cached processor results.
+        """
+        other_student = UserFactory.create(
+            username='other_student', email='other_student@example.com', is_staff=False
+        )
+        other_student.courseenrollment_set.create(course_id=self.course_key, is_active=True, mode="audit")
+        at_time = datetime(2020, 5, 25, tzinfo=timezone.utc)
+
+        usage_keys_to_remove = VisibilityOutlineProcessor.usage_keys_to_remove
+        with patch.object(
+            VisibilityOutlineProcessor, 'usage_keys_to_remove', autospec=True, side_effect=usage_keys_to_remove
+        ) as mock_usage_keys_to_remove:
+            student_outline = get_user_course_outline(self.course_key, self.student, at_time)
+            other_student_outline = get_user_course_outline(self.course_key, other_student, at_time)
+
+        assert mock_usage_keys_to_remove.call_count == 1
+        assert student_outline.sequences.keys() == other_student_outline.sequences.keys()
+        assert list(student_outline.sequences) == [self.normal_in_normal_key]
+
 
 class SequentialVisibilityTestCase(CacheIsolationTestCase):
     """
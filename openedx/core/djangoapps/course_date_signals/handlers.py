@@ -15,6 +15,7 @@ from xmodule.modulestore.django import SignalHandler, modulestore  # lint-amnest
 from xmodule.util.misc import is_xblock_an_assignment  # lint-amnesty, pylint: disable=wrong-import-order
 
 from .models import SelfPacedRelativeDatesConfig
+from .relative_dates import delete_relative_dates_template, set_relative_dates_template
 from .utils import spaced_out_sections
 
 log = logging.getLogger(__name__)
@@ -181,3 +182,9 @@ def extract_dates(sender, course_key, **kwargs):  # pylint: disable=unused-argum
         set_dates_for_course(course_key, date_items)
     except Exception:  # pylint: disable=broad-except
         log.exception('Unable to set dates for %s on course publish', course_key)
+        return
+
+    if course.self_paced:
+        set_relative_dates_template(course_key, course.course_version, date_items)
+    else:
+        delete_relative_dates_template(course_key)
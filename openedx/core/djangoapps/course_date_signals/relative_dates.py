@@ -0,0 +1,112 @@
+"""
+Relative date templates of self-paced courses.
+
+The dates of a self-paced course are relative to the start of each learner's schedule.
+The template of a course holds the offsets of all its relative dates, in course order,
+so that the course dates of a learner can be resolved in a single pass instead of block
+by block. It is written when the course is published, from the same dates that are
+written into edx-when.
+
+The template leaves out the dates set on learners, like due date extensions, so it can't
+stand in for `edx_when.api.get_dates_for_course` where those apply, e.g. in the outlines
+of the learning_sequences app, the dates tab or the course API. The reminder emails of
+the schedules app space the sections out themselves rather than reading dates. The only
+consumer of the template is `get_units_with_due_date` of the instructor dashboard.
+
+The template records the course version it was extracted from, and must only be used
+for that version, since it is kept when the dates of a publish fail to be extracted.
+"""
+from datetime import datetime, timedelta
+
+from edx_django_utils.cache import TieredCache
+
+# The template is rewritten at each publish, so it can be kept for long.
+RELATIVE_DATES_TEMPLATE_TIMEOUT = 7 * 24 * 60 * 60
+
+
+class RelativeDatesTemplate:
+    """
+    The dates of a self-paced course, relative to the start of a learner's schedule or absolute.
+
+    Dates set on a learner, like due date extensions, are not part of the template.
+    """
+
+    def __init__(self, course_key, published_version, relative_dates, absolute_dates):
+        """
+        Arguments:
+            course_key (CourseKey): the course
+            published_version (str): the version of the course the dates were extracted from
+            relative_dates (list): (block key, field name, timedelta) of the relative dates, in course order
+            absolute_dates (list): (block key, field name, datetime) of the other dates, in course order
+        """
+        self.course_key = course_key
+        self.published_version = published_version
+        self.relative_dates = relative_dates
+        self.absolute_dates = absolute_dates
+
+    @classmethod
+    def from_date_items(cls, course_key, published_version, date_items):
+        """
+        Return the template of the `date_items` of a version of a course, as returned by
+        `extract_dates_from_course`.
+        """
+        relative_dates = []
+        absolute_dates = []
+        for block_key, fields in date_items:
+            for field_name, value in fields.items():
+                if isinstance(value, timedelta):
+                    relative_dates.append((block_key, field_name, value))
+                elif isinstance(value, datetime):
+                    absolute_dates.append((block_key, field_name, value))
+        return cls(course_key, published_version, relative_dates, absolute_dates)
+
+    def dates_for_learner(self, start_date):
+        """
+        Return the dates of a learner whose schedule starts at `start_date`.
+
+        Returns:
+            dict: (block key, field name) -> datetime, like `edx_when.api.get_dates_for_course`
+        """
+        dates = {(block_key, field_name): date for block_key, field_name, date in self.absolute_dates}
+        dates.update(
+            ((block_key, field_name), start_date + offset)
+            for block_key, field_name, offset in self.relative_dates
+        )
+        return dates
+
+
+def _template_cache_key(course_key):
+    return f'course_date_signals.relative_dates_template.{course_key}'
+
+
+def set_relative_dates_template(course_key, published_version, date_items):
+    """
+    Store the relative dates template of the course from the `date_items` of its `published_version`.
+    """
+    TieredCache.set_all_tiers(
+        _template_cache_key(course_key),
+        RelativeDatesTemplate.from_date_items(course_key, published_version, date_items),
+        RELATIVE_DATES_TEMPLATE_TIMEOUT,
+    )
+
+
+def delete_relative_dates_template(course_key):
+    """
+    Delete the relative dates template of the course, e.g. when it is not self-paced anymore.
+    """
+    TieredCache.delete_all_tiers(_template_cache_key(course_key))
+
+
+def get_relative_dates_template(course_key, published_version):
+    """
+    Return the relative dates template of the `published_version` of the course, or None
+    if there is none.
+
+    There is none for instructor-paced courses, for self-paced courses that were not
+    published since the template was introduced, and for versions whose dates failed to
+    be extracted.
+    """
+    cached_response = TieredCache.get_cached_response(_template_cache_key(course_key))
+    if cached_response.is_found and str(cached_response.value.published_version) == str(published_version):
+        return cached_response.value
+    return None
@@ -1,8 +1,11 @@
 # lint-amnesty, pylint: disable=missing-module-docstring
-from datetime import timedelta
+from datetime import datetime, timedelta, timezone
 from unittest.mock import patch  # lint-amnesty, pylint: disable=wrong-import-order
 
+from django.test import TestCase
 from edx_toggles.toggles.testutils import override_waffle_flag
+from opaque_keys.edx.keys import CourseKey
+from xmodule.modulestore import ModuleStoreEnum
 from xmodule.modulestore.tests.django_utils import TEST_DATA_SPLIT_MODULESTORE, ModuleStoreTestCase
 from xmodule.modulestore.tests.factories import CourseFactory, BlockFactory
 
@@ -14,6 +17,10 @@ from openedx.core.djangoapps.course_date_signals.handlers import (
     extract_dates_from_course
 )
 from openedx.core.djangoapps.course_date_signals.models import SelfPacedRelativeDatesConfig
+from openedx.core.djangoapps.course_date_signals.relative_dates import (
+    RelativeDatesTemplate,
+    get_relative_dates_template
+)
 
 from . import utils
 
@@ -370,3 +377,65 @@ class SelfPacedCustomDueDateTests(ModuleStoreTestCase):
             expected_dates = [(self.course.location, {})]
         course = self.store.get_item(self.course.location)
         self.assertCountEqual(extract_dates_from_course(course), expected_dates)
+
+
+class RelativeDatesTemplateTests(TestCase):
+    """
+    Tests for RelativeDatesTemplate.
+    """
+    def setUp(self):
+        super().setUp()
+        self.course_key = CourseKey.from_string('course-v1:edX+Test+Run')
+        self.course_start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        self.course_location = self.course_key.make_usage_key('course', 'course')
+        self.chapter_location = self.course_key.make_usage_key('chapter', 'chapter')
+        self.sequential_location = self.course_key.make_usage_key('sequential', 'sequential')
+        self.template = RelativeDatesTemplate.from_date_items(self.course_key, 'version', [
+            (self.course_location, {'start': self.course_start}),
+            (self.chapter_location, {'due': timedelta(weeks=2)}),
+            (self.sequential_location, {'due': timedelta(weeks=1)}),
+            (self.course_key.make_usage_key('sequential', 'ungraded'), {'due': None}),
+        ])
+
+    def test_dates_for_learner(self):
+        start_date = datetime(2024, 2, 1, tzinfo=timezone.utc)
+        assert self.template.dates_for_learner(start_date) == {
+            (self.course_location, 'start'): self.course_start,
+            (self.chapter_location, 'due'): start_date + timedelta(weeks=2),
+            (self.sequential_location, 'due'): start_date + timedelta(weeks=1),
+        }
+
+
+class RelativeDatesTemplatePublishTests(ModuleStoreTestCase):
+    """
+    Tests for the relative dates template written when a course is published.
+    """
+    MODULESTORE = TEST_DATA_SPLIT_MODULESTORE
+    ENABLED_SIGNALS = ['course_published']
+
+    def _published_course(self, course_key):
+        """
+        Return the published version of the course, which is the one its dates are extracted from.
+        """
+        with self.store.branch_setting(ModuleStoreEnum.Branch.published_only, course_key):
+            return self.store.get_course(course_key)
+
+    @patch('openedx.core.djangoapps.course_date_signals.handlers.set_dates_for_course')
+    def test_template_stored_on_publish(self, __):
+        course = self._published_course(CourseFactory.create(self_paced=True).id)
+        template = get_relative_dates_template(course.id, course.course_version)
+        assert template.course_key == course.id
+        assert (course.location, 'start') in template.dates_for_learner(course.start)
+
+    @patch('openedx.core.djangoapps.course_date_signals.handlers.set_dates_for_course')
+    def test_template_not_used_for_other_version(self, mock_set_dates_for_course):
+        course = CourseFactory.create(self_paced=True)
+        mock_set_dates_for_course.side_effect = Exception
+        BlockFactory.create(category='chapter', parent=course)
+        course = self._published_course(course.id)
+        assert get_relative_dates_template(course.id, course.course_version) is None
+
+    @patch('openedx.core.djangoapps.course_date_signals.handlers.set_dates_for_course')
+    def test_no_template_for_instructor_paced(self, __):
+        course = self._published_course(CourseFactory.create(self_paced=False).id)
+        assert get_relative_dates_template(course.id, course.course_version) is None
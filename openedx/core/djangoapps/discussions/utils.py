@@ -6,7 +6,7 @@ from typing import Dict, List, Optional, Tuple
 
 from opaque_keys.edx.keys import CourseKey
 
-from lms.djangoapps.courseware.access import has_access
+from lms.djangoapps.courseware.access import has_access_to_blocks
 from openedx.core.djangoapps.course_groups.cohorts import get_cohort_names, is_course_cohorted
 from openedx.core.djangoapps.django_comment_common.models import CourseDiscussionSettings
 from openedx.core.lib.cache_utils import request_cached
@@ -84,11 +84,12 @@ def get_accessible_discussion_xblocks_by_course_id(
     Checks for the given user's access if include_all is False.
     """
     all_xblocks = modulestore().get_items(course_id, qualifiers={'category': 'discussion'}, include_orphans=False)
+    xblocks = [xblock for xblock in all_xblocks if has_required_keys(xblock)]
+    if include_all:
+        return xblocks
 
-    return [
-        xblock for xblock in all_xblocks
-        if has_required_keys(xblock) and (include_all or has_access(user, 'load', xblock, course_id))
-    ]
+    access_responses = has_access_to_blocks(user, 'load', xblocks, course_id)
+    return [xblock for xblock in xblocks if access_responses[xblock.location]]
 
 
 def available_division_schemes(course_key: CourseKey) -> List[str]:
@@ -2,17 +2,28 @@
 """" Common utilities for comment client wrapper """
 
 
+import copy
 import logging
 from uuid import uuid4
 
 import requests
+from django.conf import settings
 from django.utils.translation import get_language
+from edx_django_utils.cache import RequestCache
 from opaque_keys.edx.keys import CourseKey
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ConnectTimeoutError, MaxRetryError, ReadTimeoutError
+from urllib3.util.retry import Retry
 
 from .settings import SERVICE_HOST as COMMENTS_SERVICE
 
 log = logging.getLogger(__name__)
 
+COALESCED_RESPONSES_NAMESPACE = 'comment_client.coalesced_responses'
+
+# Shared keep-alive sessions, keyed by (pool size, max retries)
+_pooled_sessions = {}
+
 
 def strip_none(dic):
     return {k: v for k, v in dic.items() if v is not None}  # lint-amnesty, pylint: disable=consider-using-dict-comprehension
@@ -31,8 +42,89 @@ def extract(dic, keys):
         return strip_none({k: dic.get(k) for k in keys})
 
 
+def get_pooled_session(pool_size, max_retries):
+    """
+    Return the process-wide requests.Session used to talk to the comments service.
+
+    Reusing the session keeps connections to the comments service alive across
+    requests, so we only pay the TCP/TLS handshake once per pooled connection.
+    """
+    session = _pooled_sessions.get((pool_size, max_retries))
+    if session is None:
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=pool_size,
+            max_retries=Retry(total=max_retries, backoff_factor=0.1, allowed_methods=Retry.DEFAULT_ALLOWED_METHODS),
+        )
+        session = requests.Session()
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        _pooled_sessions[(pool_size, max_retries)] = session
+    return session
+
+
+def _send_request(method, url, **kwargs):
+    """
+    Send a request to the comments service, through the pooled session if it is enabled.
+    """
+    pool_size = getattr(settings, 'COMMENTS_SERVICE_POOL_SIZE', 0)
+    if not pool_size:
+        return requests.request(method, url, **kwargs)
+
+    max_retries = getattr(settings, 'COMMENTS_SERVICE_MAX_RETRIES', 0)
+    try:
+        return get_pooled_session(pool_size, max_retries).request(method, url, **kwargs)
+    except requests.exceptions.Timeout:
+        raise
+    except requests.exceptions.ConnectionError as error:
+        # Once its retries are exhausted, urllib3 reports a timeout as a MaxRetryError, which
+        # requests turns into a ConnectionError. Raise the Timeout callers get without retries.
+        reason = error.args[0].reason if error.args and isinstance(error.args[0], MaxRetryError) else None
+        if isinstance(reason, ReadTimeoutError):
+            raise requests.exceptions.ReadTimeout(reason, request=error.request) from error
+        if isinstance(reason, ConnectTimeoutError):
+            raise requests.exceptions.ConnectTimeout(reason, request=error.request) from error
+        raise
+
+
+def _coalesced_request_key(url, params, raw):
+    """
+    Key identical GET requests by url, params and language, ignoring the per-call request_id.
+    """
+    params = {key: value for key, value in params.items() if key != 'request_id'}
+    return (url, str(sorted(params.items())), raw, get_language())
+
+
 def perform_request(method, url, data_or_params=None, raw=False,
                     metric_action=None, metric_tags=None, paged_results=False):
+    """
+    Perform a request to the comments service and return the (JSON decoded) response.
+
+    If COMMENTS_SERVICE_COALESCE_GETS is enabled, identical GET requests made
+    during the same LMS request share a single round trip.
+    """
+    coalesce_gets = getattr(settings, 'COMMENTS_SERVICE_COALESCE_GETS', False)
+    if not coalesce_gets:
+        return _perform_request(method, url, data_or_params, raw, metric_action, metric_tags)
+
+    coalesced_responses = RequestCache(COALESCED_RESPONSES_NAMESPACE)
+    if method.lower() != 'get':
+        # Any write may invalidate the responses we've seen so far.
+        coalesced_responses.clear()
+        return _perform_request(method, url, data_or_params, raw, metric_action, metric_tags)
+
+    cache_key = _coalesced_request_key(url, data_or_params or {}, raw)
+    cached_response = coalesced_responses.get_cached_response(cache_key)
+    if cached_response.is_found:
+        # Callers are free to modify the data they get back, so hand out copies.
+        return copy.deepcopy(cached_response.value)
+
+    response = _perform_request(method, url, data_or_params, raw, metric_action, metric_tags)
+    coalesced_responses.set(cache_key, copy.deepcopy(response))
+    return response
+
+
+def _perform_request(method, url, data_or_params=None, raw=False, metric_action=None, metric_tags=None):
     # To avoid dependency conflict
     from openedx.core.djangoapps.django_comment_common.models import ForumsConfig
     config = ForumsConfig.current()
@@ -63,7 +155,7 @@ def perform_request(method, url, data_or_params=None, raw=False,
         data = None
         params = data_or_params.copy()
         params.update(request_id_dict)
-    response = requests.request(
+    response = _send_request(
         method,
         url,
         data=data,
@@ -0,0 +1,38 @@
+# Generated by Django 4.2.23 on 2026-10-19 18:13
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import opaque_keys.edx.django.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('django_comment_common', '0009_coursediscussionsettings_reported_content_email_notifications'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CourseDiscussionUserStats',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('course_id', opaque_keys.edx.django.models.CourseKeyField(max_length=255)),
+                ('threads', models.PositiveIntegerField(default=0)),
+                ('responses', models.PositiveIntegerField(default=0)),
+                ('replies', models.PositiveIntegerField(default=0)),
+                ('active_flags', models.PositiveIntegerField(default=0)),
+                ('inactive_flags', models.PositiveIntegerField(default=0)),
+                ('last_activity_at', models.DateTimeField(blank=True, null=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['course_id', 'threads', 'responses', 'replies', 'user'], name='discussion_stats_activity'), models.Index(fields=['course_id', 'active_flags', 'inactive_flags', 'user'], name='discussion_stats_flagged'), models.Index(fields=['course_id', 'last_activity_at', 'user'], name='discussion_stats_recency')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='coursediscussionuserstats',
+            constraint=models.UniqueConstraint(fields=('course_id', 'user'), name='unique_discussion_user_stats'),
+        ),
+    ]
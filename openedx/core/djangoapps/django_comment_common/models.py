@@ -10,6 +10,7 @@ from django.contrib.auth.models import User  # lint-amnesty, pylint: disable=imp
 from django.db import models
 from django.db.models.signals import post_save
 from django.dispatch import receiver
+from django.utils import timezone
 
 from django.utils.translation import gettext_noop
 from jsonfield.fields import JSONField
@@ -336,3 +337,83 @@ class DiscussionsIdMapping(models.Model):
         if not created:
             mapping_entry.mapping = discussions_id_map
             mapping_entry.save()
+
+
+class CourseDiscussionUserStats(models.Model):
+    """
+    Materialized per-course discussion participation counts for a user.
+
+    This is a performance optimization for the course learners view, which
+    would otherwise ask the forum for stats and merge them with enrollments on
+    every request. Rows are kept current by the discussion signal handlers and
+    can be rebuilt from the forum with the ``backfill_discussion_user_stats``
+    management command.
+
+    .. no_pii:
+    """
+    # Orderings mirror the sort keys accepted by the forum user stats API.
+    SORT_ORDERINGS = {
+        'activity': ('-threads', '-responses', '-replies', '-user_id'),
+        'flagged': ('-active_flags', '-inactive_flags', '-user_id'),
+        'recency': (models.F('last_activity_at').desc(nulls_last=True), '-user_id'),
+    }
+    COUNT_FIELDS = ('threads', 'responses', 'replies', 'active_flags', 'inactive_flags')
+
+    id = models.BigAutoField(primary_key=True)
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='+')
+    course_id = CourseKeyField(max_length=255)
+    threads = models.PositiveIntegerField(default=0)
+    responses = models.PositiveIntegerField(default=0)
+    replies = models.PositiveIntegerField(default=0)
+    active_flags = models.PositiveIntegerField(default=0)
+    inactive_flags = models.PositiveIntegerField(default=0)
+    last_activity_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['course_id', 'user'], name='unique_discussion_user_stats'),
+        ]
+        indexes = [
+            models.Index(
+                fields=['course_id', 'threads', 'responses', 'replies', 'user'],
+                name='discussion_stats_activity',
+            ),
+            models.Index(
+                fields=['course_id', 'active_flags', 'inactive_flags', 'user'],
+                name='discussion_stats_flagged',
+            ),
+            models.Index(fields=['course_id', 'last_activity_at', 'user'], name='discussion_stats_recency'),
+        ]
+
+    def __str__(self):
+        return f"CourseDiscussionUserStats: {self.user_id} in {self.course_id}"
+
+    @classmethod
+    def for_course(cls, course_key, sort_key):
+        """
+        Return the stats rows for a course, ordered as the forum would order `sort_key`.
+        """
+        ordering = cls.SORT_ORDERINGS.get(sort_key, cls.SORT_ORDERINGS['activity'])
+        return cls.objects.filter(course_id=course_key).order_by(*ordering)
+
+    @classmethod
+    def update_counts(cls, course_key, user_id, touch=False, **deltas):
+        """
+        Atomically apply `deltas` to a user's counts, never dropping below zero.
+
+        If `touch` is True, the user's last activity time is also set to now.
+        """
+        stats, _ = cls.objects.get_or_create(course_id=course_key, user_id=user_id)
+        # The counts are clamped with CASE rather than GREATEST: MySQL computes the unsigned
+        # columns minus a delta as UNSIGNED, which fails with an out of range error below zero.
+        updates = {
+            field: models.Case(
+                models.When(**{f'{field}__gte': -delta}, then=models.F(field) + delta),
+                default=0,
+            )
+            for field, delta in deltas.items() if delta
+        }
+        if touch:
+            updates['last_activity_at'] = timezone.now()
+        if updates:
+            cls.objects.filter(pk=stats.pk).update(**updates)
@@ -12,9 +12,15 @@ thread_deleted = Signal()
 thread_followed = Signal()
 thread_unfollowed = Signal()
 thread_flagged = Signal()
+thread_unflagged = Signal()
 comment_created = Signal()
 comment_edited = Signal()
 comment_voted = Signal()
 comment_deleted = Signal()
 comment_endorsed = Signal()
 comment_flagged = Signal()
+comment_unflagged = Signal()
+
+# The deleted signals also provide 'descendants', the forum data of the responses and
+# replies deleted with the post, when the materialized discussion user stats need them.
+# The unflagged signals also provide 'was_flagged', whether the post had reporters before.
@@ -0,0 +1,18 @@
+"""
+Tasks for videos.
+"""
+
+
+from celery import shared_task
+from edx_django_utils.monitoring import set_code_owner_attribute
+
+
+@shared_task(name='openedx.core.djangoapps.video_config.tasks.warm_transcript_conversions')
+@set_code_owner_attribute
+def warm_transcript_conversions(edx_video_id, language_code):
+    """
+    Cache the conversions of a newly uploaded edx-val transcript into the formats learners download.
+    """
+    # Avoid circular imports, the video block handlers schedule this task.
+    from xmodule.video_block.transcripts_utils import warm_video_transcript_conversions
+    warm_video_transcript_conversions(edx_video_id, language_code)
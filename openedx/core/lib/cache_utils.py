@@ -6,10 +6,13 @@ Utilities related to caching.
 import collections
 import functools
 import itertools
+import time
 import zlib
 import pickle
 
 import wrapt
+from django.core.cache import cache
+from django.db import transaction
 from django.db.models.signals import post_save, post_delete
 from django.utils.encoding import force_str
 
@@ -205,6 +208,93 @@ class CacheInvalidationManager:
         return decorator
 
 
+class VersionedCache:
+    """
+    Values kept in the shared cache under the current version of the object they belong
+    to, e.g. the roles of a user, so that they can be invalidated in all processes by
+    bumping the version rather than by finding and deleting them.
+
+    The versions are kept without a timeout. A version that isn't in the cache, e.g. after
+    an eviction, is based on the time, so that it doesn't come back to one with a value
+    still cached.
+
+    `namespace` prefixes the cache keys, and `timeout` is that of the values, which is only
+    a safety net for changes that aren't followed by a call to `invalidate`.
+    """
+
+    def __init__(self, namespace, timeout):
+        self.namespace = namespace
+        self.timeout = timeout
+
+    def _version_key(self, obj_id):
+        return f'{self.namespace}.version.{obj_id}'
+
+    def _value_key(self, obj_id, version):
+        return f'{self.namespace}.{obj_id}.{version}'
+
+    @staticmethod
+    def _new_version():
+        return time.time_ns() // 1000
+
+    def invalidate(self, obj_id):
+        """
+        Make the value of the object be loaded again, in all processes.
+
+        The version is bumped again once the transaction commits, so that a value loaded in
+        the meantime from a database which doesn't show the change yet isn't used either.
+        """
+        def bump_version():
+            version_key = self._version_key(obj_id)
+            try:
+                cache.incr(version_key)
+            except ValueError:
+                cache.set(version_key, self._new_version(), None)
+
+        bump_version()
+        transaction.on_commit(bump_version)
+
+    def get_many(self, obj_ids, load):
+        """
+        Return a dict mapping each of `obj_ids` to its value.
+
+        The values are read with one multi-get of the versions of the objects and one of
+        their values. `load` is called with the set of the ids of the objects whose value
+        isn't cached, and returns a dict mapping each of them to its value, which is cached.
+        """
+        version_keys = {self._version_key(obj_id): obj_id for obj_id in obj_ids}
+        versions = {
+            version_keys[version_key]: version
+            for version_key, version in cache.get_many(version_keys).items()
+        }
+        new_versions = {}
+        for version_key, obj_id in version_keys.items():
+            if obj_id not in versions:
+                versions[obj_id] = new_versions[version_key] = self._new_version()
+        if new_versions:
+            cache.set_many(new_versions, None)
+
+        value_keys = {self._value_key(obj_id, version): obj_id for obj_id, version in versions.items()}
+        values = {value_keys[value_key]: value for value_key, value in cache.get_many(value_keys).items()}
+
+        missing_ids = set(versions) - values.keys()
+        if missing_ids:
+            loaded_values = load(missing_ids)
+            cache.set_many(
+                {self._value_key(obj_id, versions[obj_id]): value for obj_id, value in loaded_values.items()},
+                self.timeout,
+            )
+            values.update(loaded_values)
+
+        return values
+
+    def get(self, obj_id, load):
+        """
+        Return the value of the object, as returned by `load` with no arguments if it
+        isn't cached.
+        """
+        return self.get_many([obj_id], lambda obj_ids: {obj_id: load()})[obj_id]
+
+
 def zpickle(data):
     """Given any data structure, returns a zlib compressed pickled serialization."""
     return zlib.compress(pickle.dumps(data, 4))
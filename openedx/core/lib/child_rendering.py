@@ -0,0 +1,47 @@
+"""
+Rendering of the children of a block, e.g. the components of a unit, with the time
+taken by each of them reported to monitoring.
+
+The children are rendered one after the other, in the request thread. They share
+the runtime, the field data cache and the request cache of their parent, and may
+read or write the database within the transaction of the request, none of which
+can be used from other threads. Rendering them concurrently would first need their
+I/O, e.g. codejail or transcript fetches, to be split from that state, which isn't
+done: this module only reports where the time of rendering children goes.
+"""
+import time
+
+from edx_django_utils.monitoring import accumulate, set_custom_attribute
+
+from openedx.core.lib.cache_utils import get_cache
+
+CHILD_RENDER_TIMES_CACHE_NAMESPACE = 'child_rendering.render_times'
+# The most children of a request whose times are listed in the custom attribute; the
+# times of the others are only part of the total.
+CHILD_RENDER_TIMES_MAX_LISTED = 50
+
+
+def render_children(view, children, monitoring_prefix):
+    """
+    Render `view` of each of `children`, a list of (block, context) pairs, and return the
+    fragments in the same order.
+
+    The time taken by the children of all of the blocks rendered with the same
+    `monitoring_prefix` in the request is reported as the custom attribute
+    `<monitoring_prefix>.child_render_ms`, e.g. "problem:120,video:35", for the first
+    CHILD_RENDER_TIMES_MAX_LISTED of them, and their total as
+    `<monitoring_prefix>.children_render_ms`.
+    """
+    fragments = []
+    render_times = get_cache(CHILD_RENDER_TIMES_CACHE_NAMESPACE).setdefault(monitoring_prefix, [])
+    for block, context in children:
+        start = time.perf_counter()
+        fragments.append(block.render(view, context))
+        duration_ms = round((time.perf_counter() - start) * 1000)
+        if len(render_times) < CHILD_RENDER_TIMES_MAX_LISTED:
+            render_times.append(f'{block.scope_ids.block_type}:{duration_ms}')
+        accumulate(f'{monitoring_prefix}.children_render_ms', duration_ms)
+
+    if children:
+        set_custom_attribute(f'{monitoring_prefix}.child_render_ms', ','.join(render_times))
+    return fragments
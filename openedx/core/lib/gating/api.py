@@ -233,6 +233,23 @@ def is_prerequisite(course_key, prereq_content_key):
     ) is not None
 
 
+def get_prerequisite_content_keys(course_key):
+    """
+    Returns the content of the course which fulfills at least one CourseContentMilestone,
+    i.e. what is_prerequisite is True for, in a single query
+
+    Arguments:
+        course_key (str|CourseKey): The course key
+
+    Returns:
+        set: The usage key strings of the prerequisite content
+    """
+    return {
+        str(milestone['content_id'])
+        for milestone in find_gating_milestones(course_key, relationship='fulfills')
+    }
+
+
 def set_required_content(course_key, gated_content_key, prereq_content_key, min_score='', min_completion=''):
     """
     Adds a `requires` milestone relationship for the given gated_content_key if a prerequisite
@@ -288,6 +305,28 @@ def get_required_content(course_key, gated_content_key):
         return None, None, None
 
 
+def get_required_content_by_block(course_key):
+    """
+    Returns what get_required_content returns for each gated content of the course, in a single query.
+
+    Args:
+        course_key (str|CourseKey): The course key
+
+    Returns:
+        dict: The prerequisite content usage key, minimum score and minimum completion percentage,
+        by usage key string of the gated content. Content which is not gated is left out.
+    """
+    required_content = {}
+    for milestone in find_gating_milestones(course_key, relationship='requires'):
+        # As get_gating_milestone does, use the first milestone found for each content.
+        required_content.setdefault(str(milestone['content_id']), (
+            _get_gating_block_id(milestone),
+            milestone.get('requirements', {}).get('min_score', None),
+            milestone.get('requirements', {}).get('min_completion', None),
+        ))
+    return required_content
+
+
 @gating_enabled(default=[])
 def get_gated_content(course, user):
     """
@@ -172,6 +172,23 @@ class TestGatingApi(ModuleStoreTestCase, MilestonesTestCaseMixin):
         assert min_score is None
         assert min_completion is None
 
+    def test_course_gating_lookups(self):
+        """ Test get_prerequisite_content_keys and get_required_content_by_block """
+
+        assert gating_api.get_prerequisite_content_keys(self.course.id) == set()
+        assert gating_api.get_required_content_by_block(self.course.id) == {}
+
+        gating_api.add_prerequisite(self.course.id, self.seq1.location)
+        gating_api.set_required_content(self.course.id, self.seq2.location, self.seq1.location, 100, 50)
+
+        assert gating_api.get_prerequisite_content_keys(self.course.id) == {str(self.seq1.location)}
+        assert gating_api.get_required_content_by_block(self.course.id) == {
+            str(self.seq2.location): gating_api.get_required_content(self.course.id, self.seq2.location),
+        }
+        assert gating_api.get_required_content_by_block(self.course.id)[str(self.seq2.location)] == (
+            str(self.seq1.location), 100, 50,
+        )
+
     def test_get_gated_content(self):
         """
         Verify staff bypasses gated content and student gets list of unfulfilled prerequisites.
@@ -8,9 +8,10 @@ from unittest.mock import Mock
 import ddt
 from edx_django_utils.cache import RequestCache
 from django.core.cache import cache
+from django.test import TestCase as DjangoTestCase
 from django.test.utils import override_settings
 
-from openedx.core.lib.cache_utils import CacheService, request_cached
+from openedx.core.lib.cache_utils import CacheService, VersionedCache, request_cached
 
 
 @ddt.ddt
@@ -320,3 +321,43 @@ class CacheServiceTest(TestCase):
         assert cache_service.get(key) == value
         sleep(timeout)
         assert cache_service.get(key) is None
+
+
+@override_settings(CACHES={
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+})
+class VersionedCacheTest(DjangoTestCase):
+    """
+    Test VersionedCache.
+    """
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.versioned_cache = VersionedCache('test.versioned', 60)
+        self.load = Mock(side_effect=lambda obj_ids: {obj_id: obj_id * 10 for obj_id in obj_ids})
+
+    def test_get_many_loads_missing_values_once(self):
+        assert self.versioned_cache.get_many({1, 2}, self.load) == {1: 10, 2: 20}
+        assert self.versioned_cache.get_many({1, 2, 3}, self.load) == {1: 10, 2: 20, 3: 30}
+        assert [call.args[0] for call in self.load.call_args_list] == [{1, 2}, {3}]
+
+    def test_invalidate(self):
+        self.versioned_cache.get_many({1, 2}, self.load)
+        self.versioned_cache.invalidate(1)
+        assert self.versioned_cache.get_many({1, 2}, self.load) == {1: 10, 2: 20}
+        assert self.load.call_args.args[0] == {1}
+
+    def test_invalidate_evicted_version(self):
+        self.versioned_cache.get_many({1}, self.load)
+        cache.delete('test.versioned.version.1')
+        self.versioned_cache.invalidate(1)
+        self.versioned_cache.get_many({1}, self.load)
+        assert self.load.call_count == 2
+
+    def test_get(self):
+        load = Mock(return_value='value')
+        assert self.versioned_cache.get(1, load) == 'value'
+        assert self.versioned_cache.get(1, load) == 'value'
+        assert load.call_count == 1
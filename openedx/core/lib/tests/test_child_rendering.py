@@ -0,0 +1,70 @@
+"""
+Tests for openedx.core.lib.child_rendering.
+"""
+from unittest.mock import Mock, patch
+
+from django.test import TestCase
+from edx_django_utils.cache import RequestCache
+
+from openedx.core.lib.child_rendering import CHILD_RENDER_TIMES_MAX_LISTED, render_children
+
+
+@patch('openedx.core.lib.child_rendering.accumulate')
+@patch('openedx.core.lib.child_rendering.set_custom_attribute')
+class RenderChildrenTestCase(TestCase):
+    """
+    Tests for render_children.
+    """
+    def setUp(self):
+        super().setUp()
+        RequestCache.clear_all_namespaces()
+        self.addCleanup(RequestCache.clear_all_namespaces)
+
+    def _child(self, block_type):
+        """
+        Return a mock block rendering its view and the index in its context.
+        """
+        block = Mock()
+        block.scope_ids.block_type = block_type
+        block.render.side_effect = lambda view, context: Mock(content=f'{view}:{context["index"]}')
+        return block
+
+    def _children(self, block_types):
+        return [(self._child(block_type), {'index': index}) for index, block_type in enumerate(block_types)]
+
+    def test_render_children(self, mock_set_custom_attribute, mock_accumulate):
+        fragments = render_children(
+            'student_view', self._children(['html', 'problem', 'video']), monitoring_prefix='vertical',
+        )
+
+        assert [fragment.content for fragment in fragments] == [f'student_view:{i}' for i in range(3)]
+        name, timings = mock_set_custom_attribute.call_args.args
+        assert name == 'vertical.child_render_ms'
+        assert [timing.split(':')[0] for timing in timings.split(',')] == ['html', 'problem', 'video']
+        assert {call.args[0] for call in mock_accumulate.call_args_list} == {'vertical.children_render_ms'}
+        assert mock_accumulate.call_count == 3
+
+    def test_timings_of_all_blocks_reported(
+        self, mock_set_custom_attribute, mock_accumulate
+    ):  # pylint: disable=unused-argument
+        render_children('student_view', self._children(['html', 'problem']), monitoring_prefix='vertical')
+        render_children('student_view', self._children(['video']), monitoring_prefix='vertical')
+        render_children('student_view', [], monitoring_prefix='vertical')
+
+        name, timings = mock_set_custom_attribute.call_args.args
+        assert name == 'vertical.child_render_ms'
+        assert [timing.split(':')[0] for timing in timings.split(',')] == ['html', 'problem', 'video']
+
+    def test_timings_listed_capped(self, mock_set_custom_attribute, mock_accumulate):
+        children = self._children(['html'] * (CHILD_RENDER_TIMES_MAX_LISTED + 10))
+        render_children('student_view', children, monitoring_prefix='vertical')
+
+        _name, timings = mock_set_custom_attribute.call_args.args
+        assert len(timings.split(',')) == CHILD_RENDER_TIMES_MAX_LISTED
+        assert mock_accumulate.call_count == CHILD_RENDER_TIMES_MAX_LISTED + 10
+
+    def test_render_error_raised(self, mock_set_custom_attribute, mock_accumulate):  # pylint: disable=unused-argument
+        failing = self._child('problem')
+        failing.render.side_effect = ValueError
+        with self.assertRaises(ValueError):
+            render_children('student_view', [(failing, {'index': 0})], monitoring_prefix='vertical')
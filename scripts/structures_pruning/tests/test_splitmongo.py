@@ -104,6 +104,16 @@ class TestCourseChangePlan(unittest.TestCase):
         self.assertEqual(plan_2_intermediate.delete, [])
         self.assertEqual(plan_2_intermediate.update_parents, [])
 
+    def test_delta_bases_preserved(self):
+        """Structures stored as diffs keep the Structures they were diffed against."""
+        graph = create_test_graph(["1", "2", "3", "4", "5"])
+        graph.structures["5"] = graph.structures["5"]._replace(delta_base_id="4")
+        graph.structures["4"] = graph.structures["4"]._replace(delta_base_id="3")
+
+        plan = ChangePlan.create(graph, 0, False, False)
+        self.assertEqual(plan.delete, ["2"])
+        self.assertEqual(plan.update_parents, [("3", "1")])
+
     @ddt.data(
         create_test_graph(["1"]),  # Original (is also Active)
         create_test_graph(["1", "2"]),  # "1" = Original, "2" = Active
@@ -123,12 +123,15 @@ class ActiveVersionBranch(namedtuple('ActiveVersionBranch', 'id branch structure
         )
 
 
-class Structure(namedtuple('Structure', 'id original_id previous_id')):
+class Structure(namedtuple('Structure', 'id original_id previous_id delta_base_id', defaults=(None,))):
     """
     The parts of a SplitMongo Structure document that we care about, namely the
     ID (str'd version of the ObjectID), and the IDs of the Original and Previous
     structure documents. The previous_id may be None ()
 
+    If the Structure is stored as a diff, delta_base_id is the ID of the
+    Structure it was diffed against, which is needed to read it.
+
     We use a namedtuple for this specifically because it's more space efficient
     than a dict, and we can have millions of Structures.
     """
@@ -241,6 +244,14 @@ class ChangePlan(namedtuple('ChangePlan', 'delete update_parents')):
             for int_structure_id in int_structure_ids_to_save:
                 structure_ids_to_save.add(int_structure_id)
 
+        # Structures stored as diffs can't be read without the Structures they
+        # were diffed against, however old those are.
+        for structure_id in list(structure_ids_to_save):
+            delta_base_id = structures[structure_id].delta_base_id if structure_id in structures else None
+            while delta_base_id is not None and delta_base_id not in structure_ids_to_save:
+                structure_ids_to_save.add(delta_base_id)
+                delta_base_id = structures[delta_base_id].delta_base_id if delta_base_id in structures else None
+
         missing_structure_ids = structure_ids_to_save - structures.keys()
 
         if ignore_missing:
@@ -515,7 +526,7 @@ class SplitMongoBackend:
         `delay` is the delay in seconds between batch queries.
         """
         cursor = self._structures.find(
-            projection=['original_version', 'previous_version']
+            projection=['original_version', 'previous_version', 'delta_base']
         )
         cursor.batch_size(batch_size)
         for i, structure_doc in enumerate(cursor, start=1):
@@ -555,7 +566,7 @@ class SplitMongoBackend:
         """Get an individual Structure from the database."""
         structure_doc = self._structures.find_one(
             {'_id': ObjectId(structure_id)},
-            projection=['original_version', 'previous_version']
+            projection=['original_version', 'previous_version', 'delta_base']
         )
         return self.parse_structure_doc(structure_doc)
 
@@ -638,13 +649,19 @@ class SplitMongoBackend:
           original_version: The Original Structure that this Structure and all
                             its ancestors are ultimately dervied from. An
                             Original Structure points to itself with this field.
+
+        Structures stored as diffs also have a delta_base field, the Structure
+        ID they were diffed against.
         """
         _id = str(structure_doc['_id'])
         original_id = str(structure_doc['original_version'])
         previous_id = structure_doc['previous_version']
         if previous_id is not None:
             previous_id = str(previous_id)
-        return Structure(_id, original_id, previous_id)
+        delta_base_id = structure_doc.get('delta_base')
+        if delta_base_id is not None:
+            delta_base_id = str(delta_base_id)
+        return Structure(_id, original_id, previous_id, delta_base_id)
 
     @staticmethod
     def batch(iterable, batch_size):
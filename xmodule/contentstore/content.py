@@ -400,15 +400,32 @@ class ContentStore:
         `dimensions` is an optional param that represents (width, height) in
         pixels. It defaults to None.
         """
-        thumbnail_content = None
+        return self.generate_thumbnails(content, tempfile_path=tempfile_path, dimensions_list=[dimensions])[0]
+
+    def generate_thumbnails(self, content, tempfile_path=None, dimensions_list=(None,)):
+        """Create thumbnails of several sizes for a given image, decoding it only once.
+
+        Returns a list of (StaticContent, AssetKey) tuples, one for each entry of
+        `dimensions_list`, in the same order. The StaticContent is None for
+        thumbnails which couldn't be created.
+
+        `content` and `tempfile_path` are as for `generate_thumbnail`.
+
+        `dimensions_list` is a list of (width, height) tuples in pixels, or None
+        for the default size.
+        """
         is_svg = content.content_type == 'image/svg+xml'
-        # use a naming convention to associate originals with the thumbnail
-        thumbnail_name = StaticContent.generate_thumbnail_name(
-            content.location.block_id, dimensions=dimensions, extension='.svg' if is_svg else None
-        )
-        thumbnail_file_location = StaticContent.compute_location(
-            content.location.course_key, thumbnail_name, is_thumbnail=True
-        )
+        thumbnails = []
+        for dimensions in dimensions_list:
+            # use a naming convention to associate originals with the thumbnail
+            thumbnail_name = StaticContent.generate_thumbnail_name(
+                content.location.block_id, dimensions=dimensions, extension='.svg' if is_svg else None
+            )
+            thumbnail_file_location = StaticContent.compute_location(
+                content.location.course_key, thumbnail_name, is_thumbnail=True
+            )
+            thumbnails.append((thumbnail_name, thumbnail_file_location, dimensions or (128, 128)))
+        thumbnail_contents = [None] * len(thumbnails)
 
         # if we're uploading an image, then let's generate a thumbnail so that we can
         # serve it up when needed without having to rescale on the fly
@@ -417,18 +434,19 @@ class ContentStore:
                 # for svg simply store the provided svg file, since vector graphics should be good enough
                 # for downscaling client-side
                 if tempfile_path is None:
-                    thumbnail_file = BytesIO(content.data)
+                    svg_data = content.data
                 else:
                     with open(tempfile_path) as f:
-                        thumbnail_file = BytesIO(f.read())
-                thumbnail_content = StaticContent(thumbnail_file_location, thumbnail_name,
-                                                  'image/svg+xml', thumbnail_file)
-                self.save(thumbnail_content)
+                        svg_data = f.read()
+                for index, (thumbnail_name, thumbnail_file_location, __) in enumerate(thumbnails):
+                    thumbnail_content = StaticContent(thumbnail_file_location, thumbnail_name,
+                                                      'image/svg+xml', BytesIO(svg_data))
+                    self.save(thumbnail_content)
+                    thumbnail_contents[index] = thumbnail_content
             elif content.content_type is not None and content.content_type.split('/')[0] == 'image':
                 # use PIL to do the thumbnail generation (http://www.pythonware.com/products/pil/)
                 # My understanding is that PIL will maintain aspect ratios while restricting
                 # the max-height/width to be whatever you pass in as 'size'
-                # @todo: move the thumbnail size to a configuration setting?!?
                 if tempfile_path is None:
                     source = BytesIO(content.data)
                 else:
@@ -436,24 +454,30 @@ class ContentStore:
 
                 # We use the context manager here to avoid leaking the inner file descriptor
                 # of the Image object -- this way it gets closed after we're done with using it.
-                thumbnail_file = BytesIO()
                 with Image.open(source) as image:
+                    # Ask the decoder for a reduced image which is still at least as large as the
+                    # largest thumbnail. JPEGs can be decoded at 1/2, 1/4 or 1/8 scale, which is much
+                    # cheaper than decoding a large photo in full; other formats ignore this.
+                    image.draft('RGB', (
+                        max(size[0] for __, __, size in thumbnails),
+                        max(size[1] for __, __, size in thumbnails),
+                    ))
                     # I've seen some exceptions from the PIL library when trying to save palletted
                     # PNG files to JPEG. Per the google-universe, they suggest converting to RGB first.
-                    thumbnail_image = image.convert('RGB')
-
-                    if not dimensions:
-                        dimensions = (128, 128)
+                    rgb_image = image.convert('RGB')
 
+                for index, (thumbnail_name, thumbnail_file_location, dimensions) in enumerate(thumbnails):
+                    thumbnail_image = rgb_image.copy()
                     thumbnail_image.thumbnail(dimensions, Image.LANCZOS)
+                    thumbnail_file = BytesIO()
                     thumbnail_image.save(thumbnail_file, 'JPEG')
                     thumbnail_file.seek(0)
 
-                # store this thumbnail as any other piece of content
-                thumbnail_content = StaticContent(thumbnail_file_location, thumbnail_name,
-                                                  'image/jpeg', thumbnail_file)
-
-                self.save(thumbnail_content)
+                    # store this thumbnail as any other piece of content
+                    thumbnail_content = StaticContent(thumbnail_file_location, thumbnail_name,
+                                                      'image/jpeg', thumbnail_file)
+                    self.save(thumbnail_content)
+                    thumbnail_contents[index] = thumbnail_content
 
         except Exception as exc:  # pylint: disable=broad-except
             # log and continue as thumbnails are generally considered as optional
@@ -461,7 +485,10 @@ class ContentStore:
                 "Failed to generate thumbnail for {}. Exception: {}".format(content.location, str(exc))
             )
 
-        return thumbnail_content, thumbnail_file_location
+        return [
+            (thumbnail_content, thumbnail_file_location)
+            for thumbnail_content, (__, thumbnail_file_location, __) in zip(thumbnail_contents, thumbnails)
+        ]
 
     def ensure_indexes(self):
         """
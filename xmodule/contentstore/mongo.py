@@ -6,12 +6,13 @@ MongoDB/GridFS-level code for the contentstore.
 import hashlib
 import json
 import os
+from datetime import datetime, timezone
 
 import gridfs
 import pymongo
 from bson.son import SON
 from fs.osfs import OSFS
-from gridfs.errors import NoFile, FileExists
+from gridfs.errors import NoFile
 from opaque_keys.edx.keys import AssetKey
 
 from xmodule.contentstore.content import XASSET_LOCATION_TAG
@@ -158,19 +159,57 @@ class MongoContentStore(ContentStore):
         """
         if isinstance(location_or_id, AssetKey):
             location_or_id, _ = self.asset_db_key(location_or_id)
+        self._release_shared_content(location_or_id)
         # Deletes of non-existent files are considered successful
         self.fs.delete(location_or_id)
 
+    def _get_file(self, content_id):
+        """
+        Open the GridFS file of an asset.
+
+        If the asset shares its content with another asset (see `copy_all_course_assets`),
+        the returned file has the attributes of this asset but reads the other one's chunks.
+        """
+        fp = self.fs.get(content_id)
+        # Need to replace dict IDs with SON for chunk lookup to work under Python 3
+        # because field order can be different and mongo cares about the order
+        if isinstance(fp._id, dict):  # lint-amnesty, pylint: disable=protected-access
+            fp._file['_id'] = content_id  # lint-amnesty, pylint: disable=protected-access
+        content_ref = getattr(fp, 'content_ref', None)
+        if content_ref is None:
+            return fp
+
+        content_ref = self.make_id_son({'_id': content_ref})
+        shared_fp = self.fs.get(content_ref)
+        shared_fp._file = dict(  # lint-amnesty, pylint: disable=protected-access
+            fp._file,  # lint-amnesty, pylint: disable=protected-access
+            _id=content_ref,
+            length=shared_fp.length,
+            chunkSize=shared_fp.chunk_size,
+        )
+        return shared_fp
+
+    def _release_shared_content(self, content_id):
+        """
+        Before the asset `content_id` is deleted or overwritten, hand its content over
+        to the assets which share it, so that they don't lose it.
+
+        The chunks are moved to the first of those assets, and the others are pointed at it.
+        """
+        heir = self.fs_files.find_one({'content_ref': content_id}, {'_id': 1})
+        if heir is None:
+            return
+        heir_id = self.make_id_son(heir)
+        self.chunks.update_many({'files_id': content_id}, {'$set': {'files_id': heir_id}})
+        self.fs_files.update_one({'_id': heir_id}, {'$unset': {'content_ref': ''}})
+        self.fs_files.update_many({'content_ref': content_id}, {'$set': {'content_ref': heir_id}})
+
     def find(self, location, throw_on_not_found=True, as_stream=False):  # lint-amnesty, pylint: disable=arguments-differ
         content_id, __ = self.asset_db_key(location)
 
         try:
             if as_stream:
-                fp = self.fs.get(content_id)
-                # Need to replace dict IDs with SON for chunk lookup to work under Python 3
-                # because field order can be different and mongo cares about the order
-                if isinstance(fp._id, dict):  # lint-amnesty, pylint: disable=protected-access
-                    fp._file['_id'] = content_id  # lint-amnesty, pylint: disable=protected-access
+                fp = self._get_file(content_id)
                 thumbnail_location = getattr(fp, 'thumbnail_location', None)
                 if thumbnail_location:
                     thumbnail_location = location.course_key.make_asset_key(
@@ -186,11 +225,7 @@ class MongoContentStore(ContentStore):
                     content_digest=getattr(fp, 'custom_md5', None),
                 )
             else:
-                with self.fs.get(content_id) as fp:
-                    # Need to replace dict IDs with SON for chunk lookup to work under Python 3
-                    # because field order can be different and mongo cares about the order
-                    if isinstance(fp._id, dict):  # lint-amnesty, pylint: disable=protected-access
-                        fp._file['_id'] = content_id  # lint-amnesty, pylint: disable=protected-access
+                with self._get_file(content_id) as fp:
                     thumbnail_location = getattr(fp, 'thumbnail_location', None)
                     if thumbnail_location:
                         thumbnail_location = location.course_key.make_asset_key(
@@ -254,7 +289,9 @@ class MongoContentStore(ContentStore):
             # to look. -- pmitros
             self.export(asset['asset_key'], output_directory)
             for attr, value in asset.items():
-                if attr not in ['_id', 'md5', 'uploadDate', 'length', 'chunkSize', 'asset_key']:
+                if attr not in [
+                    '_id', 'md5', 'uploadDate', 'length', 'chunkSize', 'asset_key', 'content_ref', 'thumbnail_pending',
+                ]:
                     policy.setdefault(asset['asset_key'].block_id, {})[attr] = value
 
         with open(assets_policy_file, 'w') as f:
@@ -280,12 +317,10 @@ class MongoContentStore(ContentStore):
                 (f'{prefix}.category', 'asset'),
                 (f'{prefix}.name', {'$regex': ASSET_IGNORE_REGEX}),
             ])
-            items = self.fs_files.find(query)
-            for asset in items:
-                self.fs.delete(asset[prefix])
+            for asset in list(self.fs_files.find(query, {'_id': 1})):
+                # Deleted like any other asset, so that the assets sharing its content keep it.
+                self.delete(self.make_id_son(asset))
                 assets_to_delete += 1
-
-            self.fs_files.remove(query)
         return assets_to_delete
 
     def _get_all_content_for_course(self,
@@ -371,6 +406,31 @@ class MongoContentStore(ContentStore):
         """
         self.set_attrs(asset_key, {attr: value})
 
+    def unset_attr(self, asset_key, attr, uploaded_at=None):
+        """
+        Remove the given attr from the asset at the given location. Does not allow removing gridFS
+        built in attrs such as _id, md5, uploadDate, length.
+
+        If `uploaded_at` is given, the attr is only removed from the asset uploaded at that time,
+        and not from an asset which replaced it since.
+
+        Returns whether the asset was found.
+
+        Raises AttributeError is attr is one of the build in attrs.
+
+        :param asset_key: an AssetKey
+        :param attr: which attribute to remove
+        :param uploaded_at: the upload date of the asset to remove it from
+        """
+        if attr in ['_id', 'md5', 'uploadDate', 'length', 'content_ref']:
+            raise AttributeError(f"{attr} is a protected attribute.")
+        asset_db_key, __ = self.asset_db_key(asset_key)
+        query = {'_id': asset_db_key}
+        if uploaded_at is not None:
+            query['uploadDate'] = uploaded_at
+        result = self.fs_files.update_one(query, {"$unset": {attr: ''}}, upsert=False)
+        return result.matched_count > 0
+
     def get_attr(self, location, attr, default=None):
         """
         Get the value of attr set on location. If attr is unset, it returns default. Unlike set, this accessor
@@ -391,7 +451,7 @@ class MongoContentStore(ContentStore):
         :param location:  a c4x asset location
         """
         for attr in attr_dict.keys():
-            if attr in ['_id', 'md5', 'uploadDate', 'length']:
+            if attr in ['_id', 'md5', 'uploadDate', 'length', 'content_ref']:
                 raise AttributeError(f"{attr} is a protected attribute.")
         asset_db_key, __ = self.asset_db_key(location)
         # catch upsert error and raise NotFoundError if asset doesn't exist
@@ -419,21 +479,20 @@ class MongoContentStore(ContentStore):
         """
         See :meth:`.ContentStore.copy_all_course_assets`
 
-        This implementation fairly expensively copies all of the data
+        This implementation doesn't copy the content of the assets: each copied asset refers
+        to the GridFS chunks of the asset it was copied from. The content is only separated
+        again when one of the assets sharing it is overwritten or deleted.
         """
         source_query = query_for_course(source_course_key)
-        # it'd be great to figure out how to do all of this on the db server and not pull the bits over
         for asset in self.fs_files.find(source_query):
             asset_key = self.make_id_son(asset)
-            # don't convert from string until fs access
-            source_content = self.fs.get(asset_key)
+            # Always refer to the asset which owns the chunks, not to another copy of it.
+            content_ref = self.make_id_son({'_id': asset.get('content_ref', asset_key)})
             if isinstance(asset_key, str):
                 asset_key = AssetKey.from_string(asset_key)
                 __, asset_key = self.asset_db_key(asset_key)
-            # Need to replace dict IDs with SON for chunk lookup to work under Python 3
-            # because field order can be different and mongo cares about the order
-            if isinstance(source_content._id, dict):  # lint-amnesty, pylint: disable=protected-access
-                source_content._file['_id'] = asset_key.copy()  # lint-amnesty, pylint: disable=protected-access
+            else:
+                asset_key = SON(asset_key)
             asset_key['org'] = dest_course_key.org
             asset_key['course'] = dest_course_key.course
             if getattr(dest_course_key, 'deprecated', False):  # remove the run if exists
@@ -446,31 +505,38 @@ class MongoContentStore(ContentStore):
                     dest_course_key.make_asset_key(asset_key['category'], asset_key['name']).for_branch(None)
                 )
             try:
-                self.create_asset(source_content, asset_id, asset, asset_key)
-            except FileExists:
-                self.fs.delete(file_id=asset_id)
-                self.create_asset(source_content, asset_id, asset, asset_key)
+                self.create_asset_reference(content_ref, asset_id, asset, asset_key)
+            except pymongo.errors.DuplicateKeyError:
+                self.delete(asset_id)
+                self.create_asset_reference(content_ref, asset_id, asset, asset_key)
 
-    def create_asset(self, source_content, asset_id, asset, asset_key):
+    def create_asset_reference(self, content_ref, asset_id, asset, asset_key):
         """
-        Creates a new asset
-        :param source_content:
+        Creates a new asset whose content is that of the existing asset `content_ref`
+        :param content_ref: the _id of the asset owning the content
         :param asset_id:
-        :param asset:
+        :param asset: the fs.files entry of the asset being copied
         :param asset_key:
-        :return:
         """
-        self.fs.put(
-            source_content.read(),
-            _id=asset_id, filename=asset['filename'], content_type=asset['contentType'],
-            displayname=asset['displayname'], content_son=asset_key,
+        asset_entry = SON([
+            ('_id', asset_id),
+            ('filename', asset['filename']),
+            ('contentType', asset['contentType']),
+            ('length', asset['length']),
+            ('chunkSize', asset['chunkSize']),
+            ('uploadDate', datetime.now(timezone.utc)),
+            ('displayname', asset['displayname']),
+            ('content_son', asset_key),
             # thumbnail is not technically correct but will be functionally correct as the code
             # only looks at the name which is not course relative.
-            thumbnail_location=asset['thumbnail_location'],
-            import_path=asset['import_path'],
-            # getattr b/c caching may mean some pickled instances don't have attr
-            locked=asset.get('locked', False)
-        )
+            ('thumbnail_location', asset['thumbnail_location']),
+            ('import_path', asset['import_path']),
+            ('locked', asset.get('locked', False)),
+            ('content_ref', content_ref),
+        ])
+        if 'custom_md5' in asset:
+            asset_entry['custom_md5'] = asset['custom_md5']
+        self.fs_files.insert_one(asset_entry)
 
     def delete_all_course_assets(self, course_key):
         """
@@ -482,7 +548,7 @@ class MongoContentStore(ContentStore):
         matching_assets = self.fs_files.find(course_query)
         for asset in matching_assets:
             asset_key = self.make_id_son(asset)
-            self.fs.delete(asset_key)
+            self.delete(asset_key)
 
     # codifying the original order which pymongo used for the dicts coming out of location_to_dict
     # stability of order is more important than sanity of order as any changes to order make things
@@ -615,6 +681,50 @@ class MongoContentStore(ContentStore):
             sparse=True,
             background=True
         )
+        # The Studio Files page filters a course's assets by content type or locked state, sorted by upload date.
+        create_collection_index(
+            self.fs_files,
+            [
+                ('content_son.org', pymongo.ASCENDING),
+                ('content_son.course', pymongo.ASCENDING),
+                ('contentType', pymongo.ASCENDING),
+                ('uploadDate', pymongo.DESCENDING)
+            ],
+            sparse=True,
+            background=True
+        )
+        create_collection_index(
+            self.fs_files,
+            [
+                ('content_son.org', pymongo.ASCENDING),
+                ('content_son.course', pymongo.ASCENDING),
+                ('locked', pymongo.ASCENDING),
+                ('uploadDate', pymongo.DESCENDING)
+            ],
+            sparse=True,
+            background=True
+        )
+        # Sorting by display name is case insensitive (see `_get_all_content_for_course`), which can only
+        # use an index with the same collation. Other languages than English still sort in memory.
+        create_collection_index(
+            self.fs_files,
+            [
+                ('content_son.org', pymongo.ASCENDING),
+                ('content_son.course', pymongo.ASCENDING),
+                ('displayname', pymongo.ASCENDING)
+            ],
+            name='content_son_displayname_case_insensitive',
+            collation={'locale': 'en', 'strength': 2},
+            sparse=True,
+            background=True
+        )
+        # Needed to find the assets sharing the content of an asset being deleted.
+        create_collection_index(
+            self.fs_files,
+            [('content_ref', pymongo.ASCENDING)],
+            sparse=True,
+            background=True
+        )
 
 
 def query_for_course(course_key, category=None):
@@ -636,6 +636,27 @@ class MixedModuleStore(ModuleStoreDraftAndPublished, ModuleStoreWriteBase):
         store = self._get_modulestore_for_courselike(course_key)
         return store.get_orphans(course_key, **kwargs)
 
+    def get_structure_changes(self, course_key, from_version=None):
+        """
+        Find the blocks which differ between the head of the given course branch and an earlier
+        version of it. Returns None if the modulestore can't tell, in which case the caller
+        should treat the whole course as changed.
+        """
+        try:
+            store = self._verify_modulestore_support(course_key, 'get_structure_changes')
+            return store.get_structure_changes(course_key, from_version=from_version)
+        except NotImplementedError:
+            return None
+
+    def get_block_field_values(self, course_key, field_names, block_types=None):
+        """
+        Read the values of some fields of the blocks of a course without constructing the blocks.
+        Raises NotImplementedError if the modulestore of the course can't, in which case the
+        caller should read the fields from the blocks.
+        """
+        store = self._verify_modulestore_support(course_key, 'get_block_field_values')
+        return store.get_block_field_values(course_key, field_names, block_types=block_types)
+
     def get_errored_courses(self):
         """
         Return a dictionary of course_dir -> [(msg, exception_str)], for each
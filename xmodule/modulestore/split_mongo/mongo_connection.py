@@ -18,7 +18,7 @@ from django.db.transaction import TransactionManagementError
 import pymongo
 import pytz
 # Import this just to export it
-from pymongo.errors import DuplicateKeyError  # pylint: disable=unused-import
+from pymongo.errors import BulkWriteError, DuplicateKeyError  # pylint: disable=unused-import
 from edx_django_utils import monitoring
 from edx_django_utils.cache import RequestCache
 
@@ -140,6 +140,9 @@ class QueryTimer:
 
 TIMER = QueryTimer(__name__, 0.01)
 
+# The error code of a write which failed because of a duplicate key.
+DUPLICATE_KEY_ERROR_CODE = 11000
+
 
 def structure_from_mongo(structure, course_context=None):
     """
@@ -180,6 +183,8 @@ def structure_to_mongo(structure, course_context=None):
         tagger.measure('blocks', len(structure['blocks']))
 
         new_structure = dict(structure)
+        # Only meaningful for structures materialized from a delta; see MongoPersistenceBackend.
+        new_structure.pop('delta_depth', None)
         new_structure['blocks'] = []
 
         for block_key, block in structure['blocks'].items():
@@ -269,10 +274,15 @@ class MongoPersistenceBackend:
 
     def __init__(
         self, db, collection, host, port=27017, tz_aware=True, user=None, password=None,
-        asset_collection=None, with_mysql_subclass=False, **kwargs  # lint-amnesty, pylint: disable=unused-argument
+        asset_collection=None, with_mysql_subclass=False, structure_snapshot_interval=0,
+        **kwargs  # lint-amnesty, pylint: disable=unused-argument
     ):
         """
         Create & open the connection, authenticate, and provide pointers to the collections
+
+        If ``structure_snapshot_interval`` is greater than 1, a new structure is stored as the diff
+        against its previous version, with a full snapshot stored every ``structure_snapshot_interval``
+        versions. Otherwise (the default) every structure is stored in full.
         """
         # Set a write concern of 1, which makes writes complete successfully to the primary
         # only before returning. Also makes pymongo report write errors.
@@ -297,6 +307,7 @@ class MongoPersistenceBackend:
         # Is the MySQL subclass in use, passing through some reads/writes to us? If so this will be True.
         # If this MongoPersistenceBackend is being used directly (only MongoDB is involved), this is False.
         self.with_mysql_subclass = with_mysql_subclass
+        self.structure_snapshot_interval = structure_snapshot_interval
 
     def do_connection(self):
         self.database = connect_to_mongodb(**self.connection_params)
@@ -357,7 +368,10 @@ class MongoPersistenceBackend:
                         )
                         return None
                     tagger_find_one.measure("blocks", len(doc['blocks']))
-                    structure = structure_from_mongo(doc, course_context)
+                    tagger_find_one.tag(delta=str('delta_base' in doc).lower())
+                    structure = self._structure_from_doc(doc, course_context)
+                    if structure is None:
+                        return None
                     tagger_find_one.sample_rate = 1
 
                 cache.set(key, structure, course_context)
@@ -374,9 +388,10 @@ class MongoPersistenceBackend:
         with TIMER.timer("find_structures_by_id", course_context) as tagger:
             tagger.measure("requested_ids", len(ids))
             docs = [
-                structure_from_mongo(structure, course_context)
+                self._structure_from_doc(structure, course_context)
                 for structure in self.structures.find({'_id': {'$in': ids}})
             ]
+            docs = [doc for doc in docs if doc is not None]
             tagger.measure("structures", len(docs))
             return docs
 
@@ -390,13 +405,26 @@ class MongoPersistenceBackend:
         """
         with TIMER.timer("find_courselike_blocks_by_id", course_context) as tagger:
             tagger.measure("requested_ids", len(ids))
-            docs = [
-                structure_from_mongo(structure, course_context)
-                for structure in self.structures.find(
-                    {'_id': {'$in': ids}},
-                    {'blocks': {'$elemMatch': {'block_type': block_type}}, 'root': 1}
+            docs = []
+            for structure in self.structures.find(
+                {'_id': {'$in': ids}},
+                {'blocks': {'$elemMatch': {'block_type': block_type}}, 'root': 1, 'delta_base': 1}
+            ):
+                if 'delta_base' not in structure:
+                    docs.append(structure_from_mongo(structure, course_context))
+                    continue
+                # The block may not have changed in this version, so look in the materialized structure.
+                full_structure = self.get_structure(structure['_id'], course_context)
+                if full_structure is None:
+                    continue
+                first_match = next(
+                    (block_key for block_key in full_structure['blocks'] if block_key.type == block_type), None
                 )
-            ]
+                docs.append({
+                    '_id': structure['_id'],
+                    'root': full_structure['root'],
+                    'blocks': {first_match: full_structure['blocks'][first_match]} if first_match else {},
+                })
             tagger.measure("structures", len(docs))
             return docs
 
@@ -406,7 +434,68 @@ class MongoPersistenceBackend:
         """
         with TIMER.timer("insert_structure", course_context) as tagger:
             tagger.measure("blocks", len(structure["blocks"]))
-            self.structures.insert_one(structure_to_mongo(structure, course_context))
+            doc = self._structure_to_delta_doc(structure, course_context)
+            tagger.tag(delta=str(doc is not None).lower())
+            if doc is None:
+                doc = structure_to_mongo(structure, course_context)
+            self.structures.insert_one(doc)
+
+    def _structure_to_delta_doc(self, structure, course_context=None):
+        """
+        Return the document storing ``structure`` as a diff against its previous version, or None
+        if the structure has to be stored in full.
+
+        A delta document has the top level fields of a full structure document, but its ``blocks``
+        only holds the blocks which were added or changed. It also records its base structure
+        (``delta_base``), the blocks removed from the base (``deleted_blocks``), and the number of
+        deltas since the last full snapshot (``delta_depth``).
+        """
+        if self.structure_snapshot_interval <= 1 or structure.get('previous_version') is None:
+            return None
+
+        previous_structure = self.get_structure(structure['previous_version'], course_context)
+        if previous_structure is None:
+            # e.g. the previous version is written later in the same bulk operation
+            return None
+
+        delta_depth = previous_structure.get('delta_depth', 0) + 1
+        if delta_depth >= self.structure_snapshot_interval:
+            return None
+
+        previous_blocks = previous_structure['blocks']
+        changed_blocks = {
+            block_key: block
+            for block_key, block in structure['blocks'].items()
+            if block_key not in previous_blocks or previous_blocks[block_key].to_storable() != block.to_storable()
+        }
+        doc = structure_to_mongo(dict(structure, blocks=changed_blocks), course_context)
+        doc['delta_base'] = previous_structure['_id']
+        doc['delta_depth'] = delta_depth
+        doc['deleted_blocks'] = [list(block_key) for block_key in previous_blocks.keys() - structure['blocks'].keys()]
+        return doc
+
+    def _structure_from_doc(self, doc, course_context=None):
+        """
+        Convert a structure document from the database, materializing it first if it is a delta.
+
+        Returns None if the base of a delta is missing.
+        """
+        if 'delta_base' not in doc:
+            return structure_from_mongo(doc, course_context)
+
+        base_structure = self.get_structure(doc.pop('delta_base'), course_context)
+        if base_structure is None:
+            log.error("Base structure missing for delta structure %s", doc['_id'])
+            return None
+
+        deleted_blocks = doc.pop('deleted_blocks', [])
+        structure = structure_from_mongo(doc, course_context)
+        blocks = dict(base_structure['blocks'])
+        for block_key in deleted_blocks:
+            blocks.pop(BlockKey(*block_key), None)
+        blocks.update(structure['blocks'])
+        structure['blocks'] = blocks
+        return structure
 
     def get_course_index(self, key, ignore_case=False):
         """
@@ -565,6 +654,31 @@ class MongoPersistenceBackend:
             tagger.tag(block_type=definition['block_type'])
             self.definitions.insert_one(definition)
 
+    def insert_definitions(self, definitions, course_context=None):
+        """
+        Create several definitions in the db at once.
+
+        Definitions which are already in the db are skipped.
+        """
+        if len(definitions) == 1:
+            try:
+                self.insert_definition(definitions[0], course_context)
+            except DuplicateKeyError:
+                log.debug("Attempted to insert duplicate definition %s", definitions[0]['_id'])
+            return
+
+        with TIMER.timer("insert_definitions", course_context) as tagger:
+            tagger.measure('definitions', len(definitions))
+            try:
+                # Unordered, so that a duplicate doesn't stop the other definitions from being written.
+                self.definitions.insert_many(definitions, ordered=False)
+            except BulkWriteError as err:
+                if err.details.get('writeConcernErrors') or any(
+                    error['code'] != DUPLICATE_KEY_ERROR_CODE for error in err.details.get('writeErrors', [])
+                ):
+                    raise
+                log.debug("Attempted to insert %d duplicate definitions", len(err.details['writeErrors']))
+
     def ensure_indexes(self):
         """
         Ensure that all appropriate indexes are created that are needed by this modulestore, or raise
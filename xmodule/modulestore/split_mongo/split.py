@@ -100,6 +100,7 @@ from xmodule.modulestore.exceptions import (
 )
 from xmodule.modulestore.split_mongo import CourseEnvelope
 from xmodule.modulestore.split_mongo.mongo_connection import DuplicateKeyError, DjangoFlexPersistenceBackend
+from xmodule.modulestore.split_mongo.structure_index import StructureIndex
 from xmodule.modulestore.store_utilities import DETACHED_XBLOCK_TYPES
 from xmodule.partitions.partitions_service import PartitionService
 from xmodule.util.misc import get_library_or_course_attribute
@@ -143,6 +144,9 @@ class SplitBulkWriteRecord(BulkOpsRecord):  # lint-amnesty, pylint: disable=miss
         self.modules = defaultdict(dict)
         self.definitions = {}
         self.definitions_in_db = set()
+        # dict((block_type, user_id, fields), definition_id) of the definitions created during
+        # this bulk operation, so that identical ones are only created once (see create_definition_from_data)
+        self.created_definitions = {}
         self.course_key = None
 
     # TODO: This needs to track which branches have actually been modified/versioned,
@@ -266,16 +270,16 @@ class SplitBulkWriteMixin(BulkOperationsMixin):
                 # append only, so if it's already been written, we can just keep going.
                 log.debug("Attempted to insert duplicate structure %s", _id)
 
-        for _id in bulk_write_record.definitions.keys() - bulk_write_record.definitions_in_db:
+        new_definitions = [
+            definition
+            for _id, definition in bulk_write_record.definitions.items()
+            if _id not in bulk_write_record.definitions_in_db
+        ]
+        if new_definitions:
             dirty = True
-
-            try:
-                self.db_connection.insert_definition(bulk_write_record.definitions[_id], bulk_write_record.course_key)
-            except DuplicateKeyError:
-                # We may not have looked up this definition inside this bulk operation, and thus
-                # didn't realize that it was already in the database. That's OK, the store is
-                # append only, so if it's already been written, we can just keep going.
-                log.debug("Attempted to insert duplicate definition %s", _id)
+            # Definitions which turn out to be in the database already (because we didn't look them
+            # up inside this bulk operation) are skipped by insert_definitions; the store is append only.
+            self.db_connection.insert_definitions(new_definitions, bulk_write_record.course_key)
 
         if bulk_write_record.index is not None and bulk_write_record.index != bulk_write_record.initial_index:
             dirty = True
@@ -811,8 +815,14 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
                 del self.request_cache.data.setdefault('course_cache', {})[course_version_guid]
             except KeyError:
                 pass
+            self.request_cache.data.setdefault('structure_indexes', {}).pop(course_version_guid, None)
+            known_changes = self.request_cache.data.setdefault('known_changes', {})
+            for structure_ids in [ids for ids in known_changes if course_version_guid in ids]:
+                del known_changes[structure_ids]
         else:
             self.request_cache.data['course_cache'] = {}
+            self.request_cache.data['structure_indexes'] = {}
+            self.request_cache.data['known_changes'] = {}
 
     def _lookup_course(self, course_key, head_validation=True):
         """
@@ -1214,9 +1224,19 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
             return []
 
         course = self._lookup_course(course_locator)
+        structure_index = self._get_structure_index(course)
         items = []
         qualifiers = qualifiers.copy() if qualifiers else {}  # copy the qualifiers (destructively manipulated here)
 
+        def _candidate_blocks(block_keys):
+            """
+            Return (block_key, block_data) pairs for block_keys, or for all blocks if block_keys is None.
+            """
+            blocks = course.structure['blocks']
+            if block_keys is None:
+                return blocks.items()
+            return ((block_key, blocks[block_key]) for block_key in block_keys)
+
         def _block_matches_all(block_data):
             """
             Check that the block matches all the criteria
@@ -1238,7 +1258,10 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
             # odd case where we don't search just confirm
             block_name = qualifiers.pop('name')
             block_ids = []
-            for block_id, block in course.structure['blocks'].items():
+            candidate_keys = None
+            if isinstance(block_name, str) and structure_index is not None:
+                candidate_keys = structure_index.blocks_with_id(block_name)
+            for block_id, block in _candidate_blocks(candidate_keys):
                 # Don't do an in comparison blindly; first check to make sure
                 # that the name qualifier we're looking at isn't a plain string;
                 # if it is a string, then it should match exactly. If it's other
@@ -1267,9 +1290,13 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
 
         if not include_orphans:
             path_cache = {}
-            parents_cache = self.build_block_key_to_parents_mapping(course.structure)
+            if structure_index is not None:
+                parents_cache = structure_index.parents
+            else:
+                parents_cache = self.build_block_key_to_parents_mapping(course.structure)
 
-        for block_id, value in course.structure['blocks'].items():
+        candidate_keys = self._get_indexed_candidates(structure_index, qualifiers, settings)
+        for block_id, value in _candidate_blocks(candidate_keys):
             if _block_matches_all(value):
                 if not include_orphans:
                     if (
@@ -1285,6 +1312,45 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
         else:
             return []
 
+    def _get_structure_index(self, course_entry):
+        """
+        Return the :class:`.StructureIndex` for the structure of course_entry, kept in the request cache.
+
+        Returns None if there is no request cache, or if the structure was created in the active bulk
+        operation and so may still be edited.
+        """
+        if self.request_cache is None:
+            return None
+
+        structure_id = course_entry.structure['_id']
+        bulk_write_record = self._get_bulk_ops_record(course_entry.course_key)
+        if bulk_write_record.active and structure_id not in bulk_write_record.structures_in_db:
+            return None
+
+        structure_indexes = self.request_cache.data.setdefault('structure_indexes', {})
+        if structure_id not in structure_indexes:
+            structure_indexes[structure_id] = StructureIndex(course_entry.structure)
+        return structure_indexes[structure_id]
+
+    @staticmethod
+    def _get_indexed_candidates(structure_index, qualifiers, settings):
+        """
+        Use structure_index to narrow down the blocks which can match the get_items qualifiers and settings.
+
+        The candidates still have to be checked against all of the criteria. Returns None if every
+        block has to be checked.
+        """
+        if structure_index is None:
+            return None
+        if isinstance(qualifiers.get('block_type'), str):
+            return structure_index.blocks_of_type(qualifiers['block_type'])
+        for field_name, criteria in settings.items():
+            if isinstance(criteria, (str, int)):
+                candidate_keys = structure_index.blocks_with_field_value(field_name, criteria)
+                if candidate_keys is not None:
+                    return candidate_keys
+        return None
+
     def build_block_key_to_parents_mapping(self, structure):
         """
         Given a structure, builds block_key to parents mapping for all block keys in structure
@@ -1321,7 +1387,7 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
         if parents_cache is None:
             xblock_parents = self._get_parents_from_structure(block_key, course.structure)
         else:
-            xblock_parents = parents_cache[block_key]
+            xblock_parents = parents_cache.get(block_key, [])
 
         if len(xblock_parents) == 0 and block_key.type in ["course", "library"]:
             # Found, xblock has the path to the root
@@ -1353,14 +1419,21 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
             raise ItemNotFoundError(locator)
 
         course = self._lookup_course(locator.course_key)
-        all_parent_ids = self._get_parents_from_structure(BlockKey.from_usage_key(locator), course.structure)
+        block_key = BlockKey.from_usage_key(locator)
+        structure_index = self._get_structure_index(course)
+        if structure_index is not None:
+            parents_cache = structure_index.parents
+            all_parent_ids = parents_cache.get(block_key, [])
+        else:
+            parents_cache = None
+            all_parent_ids = self._get_parents_from_structure(block_key, course.structure)
 
         # Check and verify the found parent_ids are not orphans; Remove parent which has no valid path
         # to the course root
         parent_ids = [
             valid_parent
             for valid_parent in all_parent_ids
-            if self.has_path_to_root(valid_parent, course)
+            if self.has_path_to_root(valid_parent, course, parents_cache=parents_cache)
         ]
 
         if len(parent_ids) == 0:
@@ -1443,6 +1516,206 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
             'edited_on': course['edited_on']
         }
 
+    def get_structure_changes(self, course_key, from_version=None):
+        """
+        Find the blocks which differ between the head structure of a course branch and an
+        earlier version of that structure. Only the content of the blocks is compared, so a
+        block whose edit info alone changed is not reported. The usage keys returned carry
+        neither branch nor version.
+        :param course_key: a CourseLocator with a branch, or also with the version guid of the
+            structure to compare if that may no longer be the head of the branch
+        :param from_version: the version guid to compare against; defaults to the previous
+            version of the head structure
+        :return {'version': the version guid of the head structure,
+            'from_version': the version guid it was compared against,
+            'added': set of usage keys of the blocks only in the head structure,
+            'changed': set of usage keys of the blocks in both, whose content differs,
+            'changed_fields': dict mapping each changed usage key to the names of its
+                settings fields (including 'children') whose values differ,
+            'removed': set of usage keys of the blocks only in the earlier structure
+        } or None if the earlier structure is not available (e.g. it was pruned).
+        """
+        if not isinstance(course_key, CourseLocator) or course_key.deprecated:
+            # The supplied CourseKey is of the wrong type, so it can't possibly be stored in this modulestore.
+            raise ItemNotFoundError(course_key)
+
+        if course_key.version_guid is not None:
+            # Compare a specific version, whether or not it's still the head of the branch.
+            structure = self.get_structure(course_key, course_key.version_guid)
+            if structure is None:
+                raise ItemNotFoundError(course_key)
+        else:
+            structure = self._lookup_course(course_key).structure
+        if from_version is None:
+            from_version = structure['previous_version']
+        if from_version is None:
+            return None
+        previous_structure = self.get_structure(course_key, from_version)
+        if previous_structure is None:
+            return None
+
+        attrs = ('fields', 'block_type', 'definition', 'defaults', 'asides')
+        blocks = structure['blocks']
+        previous_blocks = previous_structure['blocks']
+        changed = {}
+        for block_key, block_data in blocks.items():
+            previous_block_data = previous_blocks.get(block_key)
+            if previous_block_data is None or block_data is previous_block_data:
+                continue
+            if any(getattr(block_data, attr, None) != getattr(previous_block_data, attr, None) for attr in attrs):
+                field_names = changed[block_key] = set()
+                for attr in ('fields', 'defaults'):
+                    values, previous_values = getattr(block_data, attr), getattr(previous_block_data, attr)
+                    field_names.update(
+                        name for name in values.keys() | previous_values.keys()
+                        if values.get(name) != previous_values.get(name)
+                    )
+
+        course_locator = course_key.replace(branch=None, version_guid=None)
+
+        def usage_keys(block_keys):
+            return {course_locator.make_usage_key(block_key.type, block_key.id) for block_key in block_keys}
+
+        return {
+            'version': structure['_id'],
+            'from_version': previous_structure['_id'],
+            'added': usage_keys(blocks.keys() - previous_blocks.keys()),
+            'changed': usage_keys(changed),
+            'changed_fields': {
+                course_locator.make_usage_key(block_key.type, block_key.id): field_names
+                for block_key, field_names in changed.items()
+            },
+            'removed': usage_keys(previous_blocks.keys() - blocks.keys()),
+        }
+
+    def get_block_field_values(self, course_key, field_names, block_types=None):
+        """
+        Read the values of some fields of the blocks of a course straight from its structure and
+        definitions, without constructing any xblock. This is much cheaper than get_items for callers
+        which need a few fields (e.g. display_name, start, format) of many blocks.
+
+        The values are the ones the blocks themselves would have before any field data wrapper
+        or user-specific override is applied: locally set values, then inherited ones, then
+        template defaults, then the field defaults. Definitions are only read when a content
+        field is asked for.
+        :param course_key: a CourseLocator with a branch
+        :param field_names: the names of the fields to read
+        :param block_types: if given, only return the blocks of these types
+        :return dict mapping the usage key of each block to a dict of its values for the
+            fields in field_names which its xblock class has. The usage keys, and any keys in
+            the values, carry neither branch nor version.
+        """
+        if not isinstance(course_key, CourseLocator) or course_key.deprecated:
+            # The supplied CourseKey is of the wrong type, so it can't possibly be stored in this modulestore.
+            raise ItemNotFoundError(course_key)
+
+        course = self._lookup_course(course_key)
+        blocks = course.structure['blocks']
+        structure_index = self._get_structure_index(course)
+        if structure_index is not None:
+            parents = structure_index.parents
+        else:
+            parents = self.build_block_key_to_parents_mapping(course.structure)
+        if inheritance.InheritanceMixin in self.xblock_mixins:
+            inheritable_names = set(inheritance.InheritanceMixin.fields.keys())  # lint-amnesty, pylint: disable=no-member
+        else:
+            inheritable_names = set()
+
+        xblock_classes = {}
+
+        def xblock_class_for(block_type):
+            if block_type not in xblock_classes:
+                xblock_classes[block_type] = self.mixologist.mix(XBlock.load_class(block_type, self.default_class))
+            return xblock_classes[block_type]
+
+        block_keys = [
+            block_key for block_key in blocks
+            if block_types is None or block_key.type in block_types
+        ]
+
+        # Read the definitions of the blocks which need them all at once.
+        definition_ids = set()
+        for block_key in block_keys:
+            fields = xblock_class_for(block_key.type).fields
+            if any(
+                name in fields and fields[name].scope == Scope.content and name not in blocks[block_key].fields
+                for name in field_names
+            ):
+                definition_ids.add(blocks[block_key].definition)
+        definition_ids.discard(None)
+        definition_fields = {
+            definition['_id']: definition.get('fields', {})
+            for definition in self.get_definitions(course_key, definition_ids)
+        } if definition_ids else {}
+
+        # the value set on each block or on its nearest ancestor, per inheritable field
+        inherited_values = defaultdict(dict)
+
+        def inherited_json_value(block_key, name):
+            """
+            Return (True, json value) for the value of name set on block_key or its nearest
+            ancestor which sets it, or (False, None) if none does.
+            """
+            values = inherited_values[name]
+            unresolved = []
+            while block_key is not None and block_key not in values:
+                block_data = blocks.get(block_key)
+                if block_data is not None and name in block_data.fields:
+                    values[block_key] = (True, block_data.fields[name])
+                    break
+                unresolved.append(block_key)
+                block_parents = parents.get(block_key)
+                block_key = block_parents[0] if block_parents else None
+            result = values[block_key] if block_key is not None else (False, None)
+            for unresolved_key in unresolved:
+                values[unresolved_key] = result
+            return result
+
+        def json_value(block_key, block_data, name, field):
+            """
+            Return (True, json value) for the value of the field name of the block, or
+            (False, None) if it only has the field's default.
+            """
+            if name in block_data.fields:
+                return True, block_data.fields[name]
+            if field.scope == Scope.content:
+                content = definition_fields.get(block_data.definition, {})
+                if name in content:
+                    return True, content[name]
+            if name in inheritable_names:
+                block_parents = parents.get(block_key)
+                parent_key = block_parents[0] if block_parents else None
+                # Like InheritingFieldData, children of library content use the template defaults.
+                if not (parent_key and parent_key.type == 'library_content' and name in block_data.defaults):
+                    found, value = inherited_json_value(parent_key, name)
+                    if found:
+                        return True, value
+            if name in block_data.defaults:
+                return True, block_data.defaults[name]
+            return False, None
+
+        course_locator = course_key.replace(branch=None, version_guid=None)
+        field_values = {}
+        for block_key in block_keys:
+            block_data = blocks[block_key]
+            xblock_class = xblock_class_for(block_key.type)
+            json_values = {}
+            block_fields = {}
+            for name in field_names:
+                field = xblock_class.fields.get(name)
+                if field is None:
+                    continue
+                block_fields[name] = field
+                found, value = json_value(block_key, block_data, name, field)
+                if found:
+                    json_values[name] = value
+            json_values = self.convert_references_to_keys(course_locator, xblock_class, json_values, blocks)
+            field_values[course_locator.make_usage_key(block_key.type, block_key.id)] = {
+                name: field.from_json(json_values[name]) if name in json_values else field.default
+                for name, field in block_fields.items()
+            }
+        return field_values
+
     def get_definition_history_info(self, definition_locator, course_context=None):
         """
         Because xblocks doesn't give a means to separate the definition's meta information from
@@ -1492,6 +1765,24 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
         :param user_id: request.user object
         """
         new_def_data = self._serialize_fields(category, new_def_data)
+
+        # Imports and other bulk operations create many identical definitions (e.g. the empty
+        # definitions of containers). Within a bulk operation, reuse a definition created earlier in
+        # it rather than writing another copy. This is only done for definitions holding immutable
+        # values, as xblocks may edit mutable field values in place.
+        content_key = None
+        bulk_write_record = self._get_bulk_ops_record(course_key)
+        if bulk_write_record.active and all(
+            value is None or isinstance(value, (str, int, float, bool)) for value in new_def_data.values()
+        ):
+            # The type is part of the key so that e.g. True and 1 aren't considered equal.
+            content_key = (category, user_id, tuple(
+                (name, type(value).__name__, value) for name, value in sorted(new_def_data.items())
+            ))
+            existing_id = bulk_write_record.created_definitions.get(content_key)
+            if existing_id is not None:
+                return DefinitionLocator(category, existing_id)
+
         new_id = ObjectId()
         document = {
             '_id': new_id,
@@ -1506,6 +1797,8 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
             'schema_version': self.SCHEMA_VERSION,
         }
         self.update_definition(course_key, document)
+        if content_key is not None:
+            bulk_write_record.created_definitions[content_key] = new_id
         definition_locator = DefinitionLocator(category, new_id)
         return definition_locator
 
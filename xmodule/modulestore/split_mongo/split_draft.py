@@ -290,6 +290,14 @@ class DraftVersioningModuleStore(SplitMongoModuleStore, ModuleStoreDraftAndPubli
         course_locator = self._map_revision_to_branch(course_locator, revision=revision)
         return super().get_items(course_locator, **kwargs)
 
+    def get_block_field_values(self, course_key, field_names, block_types=None, revision=None):  # lint-amnesty, pylint: disable=arguments-differ
+        """
+        Read the values of some fields of the blocks of the branch of a course given by revision
+        (or the branch setting), without constructing the blocks.
+        """
+        course_key = self._map_revision_to_branch(course_key, revision=revision)
+        return super().get_block_field_values(course_key, field_names, block_types=block_types)
+
     def get_parent_location(self, location, revision=None, **kwargs):  # lint-amnesty, pylint: disable=arguments-differ
         '''
         Returns the given location's parent location in this course.
@@ -344,8 +352,16 @@ class DraftVersioningModuleStore(SplitMongoModuleStore, ModuleStoreDraftAndPubli
 
         draft_course = get_course(ModuleStoreEnum.BranchName.draft)
         published_course = get_course(ModuleStoreEnum.BranchName.published)
+        # The answers for every block visited, so that checking each block of an outline in turn
+        # visits each block only once.
+        known_changes = self._get_known_changes(xblock.location.course_key, draft_course, published_course)
 
         def has_changes_subtree(block_key):
+            if block_key not in known_changes:
+                known_changes[block_key] = _has_changes_subtree(block_key)
+            return known_changes[block_key]
+
+        def _has_changes_subtree(block_key):
             draft_block = get_block(draft_course, block_key)
             if draft_block is None:  # temporary fix for bad pointers TNL-1141
                 return True
@@ -367,6 +383,24 @@ class DraftVersioningModuleStore(SplitMongoModuleStore, ModuleStoreDraftAndPubli
 
         return has_changes_subtree(BlockKey.from_usage_key(xblock.location))
 
+    def _get_known_changes(self, course_key, draft_structure, published_structure):
+        """
+        Return the dict of has_changes answers, by block key, for this pair of draft and published
+        structures, kept in the request cache.
+
+        The answers can only be kept while both structures are immutable; otherwise (or without a
+        request cache) a new, empty dict is returned.
+        """
+        if self.request_cache is None:
+            return {}
+
+        structure_ids = (draft_structure['_id'], published_structure['_id'])
+        bulk_write_record = self._get_bulk_ops_record(course_key)
+        if bulk_write_record.active and not bulk_write_record.structures_in_db.issuperset(structure_ids):
+            return {}
+
+        return self.request_cache.data.setdefault('known_changes', {}).setdefault(structure_ids, {})
+
     def publish(self, location, user_id, blacklist=None, **kwargs):  # lint-amnesty, pylint: disable=arguments-differ
         """
         Publishes the subtree under location from the draft branch to the published branch
@@ -0,0 +1,95 @@
+"""
+Secondary indexes over the blocks of a split modulestore structure.
+
+A persisted structure is immutable, so lookups which would otherwise scan
+every block in the structure (by block type, by block id, by settings field
+value, or child to parent) can be answered from indexes built once per
+structure version. Each index is built lazily, the first time it is needed.
+"""
+from collections import defaultdict
+
+
+class StructureIndex:
+    """
+    Lazily-built lookup tables for a single, immutable structure.
+
+    Only block keys are stored, so the index can be used with any copy of the
+    structure having the same version. It must not be used with a structure
+    that is still being edited.
+    """
+
+    def __init__(self, structure):
+        self._blocks = structure['blocks']
+        self._by_block_type = None
+        self._by_block_id = None
+        self._parents = None
+        self._by_field = {}
+
+    def blocks_of_type(self, block_type):
+        """
+        Return the keys of the blocks of the given type, in structure order.
+        """
+        if self._by_block_type is None:
+            self._by_block_type = defaultdict(list)
+            for block_key in self._blocks:
+                self._by_block_type[block_key.type].append(block_key)
+        return self._by_block_type.get(block_type, [])
+
+    def blocks_with_id(self, block_id):
+        """
+        Return the keys of the blocks whose block id is `block_id`, in structure order.
+        """
+        if self._by_block_id is None:
+            self._by_block_id = defaultdict(list)
+            for block_key in self._blocks:
+                self._by_block_id[block_key.id].append(block_key)
+        return self._by_block_id.get(block_id, [])
+
+    @property
+    def parents(self):
+        """
+        A dict mapping each block key to the list of keys of its parents.
+
+        Blocks without parents are absent, so use ``parents.get(block_key, [])``.
+        """
+        if self._parents is None:
+            parents = defaultdict(list)
+            for parent_key, block_data in self._blocks.items():
+                for child_key in block_data.fields.get('children', []):
+                    parents[child_key].append(parent_key)
+            self._parents = dict(parents)
+        return self._parents
+
+    def blocks_with_field_value(self, field_name, value):
+        """
+        Return the keys of the blocks whose settings field `field_name` equals
+        `value` (or contains it, for list fields), in structure order.
+
+        Returns None if the field holds values which can't be indexed, in which
+        case the caller has to scan the structure.
+        """
+        if field_name not in self._by_field:
+            self._by_field[field_name] = self._build_field_index(field_name)
+        field_index = self._by_field[field_name]
+        if field_index is None:
+            return None
+        return field_index.get(value, [])
+
+    def _build_field_index(self, field_name):
+        """
+        Map each value of the settings field `field_name` to the blocks which have it.
+        """
+        field_index = defaultdict(list)
+        try:
+            for block_key, block_data in self._blocks.items():
+                if field_name not in block_data.fields:
+                    continue
+                field_value = block_data.fields[field_name]
+                values = field_value if isinstance(field_value, list) else [field_value]
+                # A list matches if any of its elements match, so index every element once.
+                for value in dict.fromkeys(values):
+                    field_index[value].append(block_key)
+        except TypeError:
+            # Unhashable values (e.g. dicts) can't be looked up by equality here.
+            return None
+        return field_index
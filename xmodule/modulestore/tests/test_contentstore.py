@@ -3,10 +3,12 @@
 """
 
 
+import json
 import logging
 import mimetypes
 import shutil
 import unittest
+from datetime import datetime
 from tempfile import mkdtemp
 from uuid import uuid4
 
@@ -131,6 +133,9 @@ class TestContentstore(unittest.TestCase):
         Test export
         """
         self.set_up_assets(deprecated)
+        self.contentstore.set_attr(
+            self.course1_key.make_asset_key('asset', self.course1_files[0]), 'thumbnail_pending', True,
+        )
         root_dir = path.Path(mkdtemp())
         try:
             self.contentstore.export_all_for_course(
@@ -140,6 +145,9 @@ class TestContentstore(unittest.TestCase):
             for filename in self.course1_files:
                 filepath = path.Path(root_dir / filename)
                 assert filepath.isfile(), f'{filepath} is not a file'
+            with open(root_dir / "policy.json") as policy_file:
+                policy = json.load(policy_file)
+            assert 'thumbnail_pending' not in policy[self.course1_files[0]]
             for filename in self.course2_files:
                 if filename not in self.course1_files:
                     filepath = path.Path(root_dir / filename)
@@ -179,6 +187,20 @@ class TestContentstore(unittest.TestCase):
             self.contentstore.set_attr(asset_key, 'locked', not prelocked)
             assert self.contentstore.get_attr(asset_key, 'locked', False) == (not prelocked)
 
+    @ddt.data(True, False)
+    def test_unset_attr(self, deprecated):
+        """
+        Test removing attrs, from a given upload of an asset only
+        """
+        self.set_up_assets(deprecated)
+        asset_key = self.course1_key.make_asset_key('asset', self.course1_files[0])
+        self.contentstore.set_attr(asset_key, 'thumbnail_pending', True)
+        uploaded_at = self.contentstore.get_attr(asset_key, 'uploadDate')
+        assert not self.contentstore.unset_attr(asset_key, 'thumbnail_pending', uploaded_at=datetime(2000, 1, 1))
+        assert self.contentstore.get_attr(asset_key, 'thumbnail_pending')
+        assert self.contentstore.unset_attr(asset_key, 'thumbnail_pending', uploaded_at=uploaded_at)
+        assert 'thumbnail_pending' not in self.contentstore.get_attrs(asset_key)
+
     @ddt.data(True, False)
     def test_copy_assets(self, deprecated):
         """
@@ -210,6 +232,71 @@ class TestContentstore(unittest.TestCase):
         __, count = self.contentstore.get_all_content_for_course(dest_course)
         assert count == 5
 
+    @ddt.data(True, False)
+    def test_copy_assets_shares_content(self, deprecated):
+        """
+        Copied assets refer to the content of the source assets instead of duplicating it
+        """
+        self.set_up_assets(deprecated)
+        chunk_count = self.contentstore.chunks.count_documents({})
+        dest_course = CourseLocator('test', 'destination', 'copy')
+        self.contentstore.copy_all_course_assets(self.course1_key, dest_course)
+        assert self.contentstore.chunks.count_documents({}) == chunk_count
+
+        for filename in self.course1_files:
+            source = self.contentstore.find(self.course1_key.make_asset_key('asset', filename))
+            copied = self.contentstore.find(dest_course.make_asset_key('asset', filename))
+            assert copied.data == source.data
+            copied_stream = self.contentstore.find(dest_course.make_asset_key('asset', filename), as_stream=True)
+            assert b''.join(copied_stream.stream_data()) == source.data
+
+    @ddt.data(True, False)
+    def test_copied_assets_survive_source_changes(self, deprecated):
+        """
+        Deleting or overwriting a source asset doesn't change the assets copied from it
+        """
+        self.set_up_assets(deprecated)
+        dest_course = CourseLocator('test', 'destination', 'copy')
+        self.contentstore.copy_all_course_assets(self.course1_key, dest_course)
+        # A copy of a copy shares the same content too.
+        second_dest_course = CourseLocator('test', 'destination', 'copy2')
+        self.contentstore.copy_all_course_assets(dest_course, second_dest_course)
+
+        deleted_key = self.course1_key.make_asset_key('asset', self.course1_files[0])
+        deleted_data = self.contentstore.find(deleted_key).data
+        self.contentstore.delete_all_course_assets(self.course1_key)
+        for course_key in (dest_course, second_dest_course):
+            asset_key = course_key.make_asset_key('asset', self.course1_files[0])
+            assert self.contentstore.find(asset_key).data == deleted_data
+
+        overwritten_key = dest_course.make_asset_key('asset', self.course1_files[1])
+        original_data = self.contentstore.find(overwritten_key).data
+        self.save_asset(self.course1_files[2], overwritten_key, self.course1_files[1], False)
+        copied_key = second_dest_course.make_asset_key('asset', self.course1_files[1])
+        assert self.contentstore.find(copied_key).data == original_data
+        assert self.contentstore.find(overwritten_key).data != original_data
+
+    @ddt.data(True, False)
+    def test_remove_redundant_shared_assets(self, deprecated):
+        """
+        Removing redundant assets releases their shared content like deleting them does
+        """
+        self.set_up_assets(deprecated)
+        redundant_key = self.course1_key.make_asset_key('asset', '._picture1.jpg')
+        self.save_asset(self.course1_files[1], redundant_key, '._picture1.jpg', False)
+        dest_course = CourseLocator('test', 'destination', 'copy')
+        self.contentstore.copy_all_course_assets(self.course1_key, dest_course)
+
+        assert self.contentstore.remove_redundant_content_for_courses() == 2
+        for asset_key in (redundant_key, dest_course.make_asset_key('asset', '._picture1.jpg')):
+            with pytest.raises(NotFoundError):
+                self.contentstore.find(asset_key)
+        # No chunks are left behind, and the other copied assets still read their content.
+        file_ids = self.contentstore.fs_files.distinct('_id')
+        assert self.contentstore.chunks.count_documents({'files_id': {'$nin': file_ids}}) == 0
+        for filename in self.course1_files:
+            assert self.contentstore.find(dest_course.make_asset_key('asset', filename)).data
+
     @ddt.data(True, False)
     def test_delete_assets(self, deprecated):
         """
@@ -1279,6 +1279,31 @@ class TestItemCrud(SplitModuleTest):
         chapter = modulestore().get_item(chapter_locator)
         assert problem_locator in version_agnostic(chapter.children)
 
+    def test_identical_definitions_in_bulk_operation(self):
+        """
+        Identical definitions created in a bulk operation are only written once
+        """
+        user = random.getrandbits(32)
+        course_key = CourseLocator('test_org', 'test_definitions', 'test_run')
+        with modulestore().bulk_operations(course_key):
+            new_course = modulestore().create_course(
+                'test_org', 'test_definitions', 'test_run', user, BRANCH_NAME_DRAFT
+            )
+            first = modulestore().create_child(user, new_course.location, 'html', fields={'data': '<p>Same</p>'})
+            second = modulestore().create_child(user, new_course.location, 'html', fields={'data': '<p>Same</p>'})
+            other = modulestore().create_child(user, new_course.location, 'html', fields={'data': '<p>Other</p>'})
+        assert first.definition_locator.definition_id == second.definition_locator.definition_id
+        assert other.definition_locator.definition_id != first.definition_locator.definition_id
+
+        first = modulestore().get_item(first.location.version_agnostic())
+        assert first.data == '<p>Same</p>'
+        assert modulestore().get_item(other.location.version_agnostic()).data == '<p>Other</p>'
+
+        # The blocks can still be edited independently.
+        first.data = '<p>Changed</p>'
+        modulestore().update_item(first, user)
+        assert modulestore().get_item(second.location.version_agnostic()).data == '<p>Same</p>'
+
     def test_create_bulk_operations(self):
         """
         Test create_item using bulk_operations
@@ -1830,6 +1855,32 @@ class TestInheritance(SplitModuleTest):
         # overridden
         assert node.graceperiod == datetime.timedelta(hours=4)
 
+    def test_block_field_values(self):
+        """
+        The field values read without constructing the blocks are those of the blocks, inherited ones included.
+        """
+        course_key = CourseLocator(org='testx', course='GreekHero', run="run", branch=BRANCH_NAME_DRAFT)
+        field_names = ['display_name', 'graceperiod', 'visible_to_staff_only', 'data', 'children']
+        field_values = modulestore().get_block_field_values(course_key, field_names)
+
+        blocks = modulestore().get_items(course_key)
+        assert len(field_values) == len(blocks)
+        for block in blocks:
+            values = field_values[block.location.for_branch(None).version_agnostic()]
+            expected_names = [name for name in field_names if name in block.fields]
+            assert sorted(values) == sorted(expected_names)
+            for name in expected_names:
+                expected = getattr(block, name)
+                if name == 'children':
+                    expected = [child.for_branch(None).version_agnostic() for child in expected]
+                assert values[name] == expected, name
+        problem_key = BlockUsageLocator(course_key, 'problem', 'problem3_2').for_branch(None)
+        assert field_values[problem_key]['graceperiod'] == datetime.timedelta(hours=2)
+
+        chapter_values = modulestore().get_block_field_values(course_key, ['display_name'], block_types=['chapter'])
+        assert len(chapter_values) == 4
+        assert {usage_key.block_type for usage_key in chapter_values} == {'chapter'}
+
     def test_inheritance_not_saved(self):
         """
         Was saving inherited settings with updated blocks causing inheritance to be sticky
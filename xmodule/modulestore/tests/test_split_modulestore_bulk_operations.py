@@ -186,7 +186,7 @@ class TestBulkWriteMixinClosed(TestBulkWriteMixin):
         self.assertConnCalls()
         self.bulk._end_bulk_operation(self.course_key)
         self.assertConnCalls(
-            call.insert_definition(self.definition, self.course_key),
+            call.insert_definitions([self.definition], self.course_key),
             call.update_course_index(
                 {'versions': {self.course_key.branch: self.definition['_id']}},  # lint-amnesty, pylint: disable=no-member
                 from_index=original_index,
@@ -206,8 +206,7 @@ class TestBulkWriteMixinClosed(TestBulkWriteMixin):
         self.bulk._end_bulk_operation(self.course_key)
         self.assertCountEqual(
             [
-                call.insert_definition(self.definition, self.course_key),
-                call.insert_definition(other_definition, self.course_key),
+                call.insert_definitions([self.definition, other_definition], self.course_key),
                 call.update_course_index(
                     {'versions': {'a': self.definition['_id'], 'b': other_definition['_id']}},
                     from_index=original_index,
@@ -224,7 +223,7 @@ class TestBulkWriteMixinClosed(TestBulkWriteMixin):
         self.bulk.update_definition(self.course_key, self.definition)
         self.assertConnCalls()
         self.bulk._end_bulk_operation(self.course_key)
-        self.assertConnCalls(call.insert_definition(self.definition, self.course_key))
+        self.assertConnCalls(call.insert_definitions([self.definition], self.course_key))
 
     def test_write_multiple_definitions_on_close(self):
         self.conn.get_course_index.return_value = None
@@ -237,8 +236,7 @@ class TestBulkWriteMixinClosed(TestBulkWriteMixin):
         self.bulk._end_bulk_operation(self.course_key)
         self.assertCountEqual(
             [
-                call.insert_definition(self.definition, self.course_key),
-                call.insert_definition(other_definition, self.course_key)
+                call.insert_definitions([self.definition, other_definition], self.course_key),
             ],
             self.conn.mock_calls
         )
@@ -475,7 +473,7 @@ class TestBulkWriteMixinFindMethods(TestBulkWriteMixin):
         self.bulk._begin_bulk_operation(self.course_key)
         self.bulk.get_definitions(self.course_key, test_ids)
         self.bulk._end_bulk_operation(self.course_key)
-        assert not self.conn.insert_definition.called
+        assert not self.conn.insert_definitions.called
 
 
 @ddt.ddt
@@ -1,13 +1,18 @@
 """ Test the behavior of split_mongo/MongoPersistenceBackend """
 
 
+import copy
 import unittest
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 import pytest
+from bson.objectid import ObjectId
+from django.core.cache import InvalidCacheBackendError
 from pymongo.errors import ConnectionFailure
 
 from xmodule.exceptions import HeartbeatFailure
+from xmodule.modulestore import BlockData
+from xmodule.modulestore.split_mongo import BlockKey
 from xmodule.modulestore.split_mongo.mongo_connection import MongoPersistenceBackend
 
 
@@ -23,3 +28,95 @@ class TestHeartbeatFailureException(unittest.TestCase):
 
         with pytest.raises(HeartbeatFailure):
             useless_conn.heartbeat()
+
+
+class FakeStructuresCollection:
+    """ An in-memory stand-in for the structures collection """
+
+    def __init__(self):
+        self.docs = {}
+
+    def insert_one(self, doc):
+        self.docs[doc['_id']] = copy.deepcopy(doc)
+
+    def find_one(self, query):
+        return copy.deepcopy(self.docs.get(query['_id']))
+
+    def find(self, query, projection=None):  # pylint: disable=unused-argument
+        return [copy.deepcopy(self.docs[_id]) for _id in query['_id']['$in'] if _id in self.docs]
+
+
+@patch(
+    'xmodule.modulestore.split_mongo.mongo_connection.get_cache',
+    Mock(side_effect=InvalidCacheBackendError),
+)
+class TestStructureDeltas(unittest.TestCase):
+    """ Test storing structures as diffs against their previous version """
+
+    @patch('pymongo.mongo_client.MongoClient')
+    def setUp(self, MockClient):  # pylint: disable=arguments-differ, unused-argument
+        super().setUp()
+        self.connection = MongoPersistenceBackend('db', 'modulestore', 'host', structure_snapshot_interval=3)
+        self.connection.structures = FakeStructuresCollection()
+        self.course = BlockKey('course', 'course')
+        self.html = BlockKey('html', 'html')
+
+    def _structure(self, previous_structure=None, **block_fields):
+        """ Return a new structure with the given blocks and their fields """
+        return {
+            '_id': ObjectId(),
+            'root': self.course,
+            'previous_version': previous_structure['_id'] if previous_structure else None,
+            'original_version': None,
+            'blocks': {
+                BlockKey(block_id, block_id): BlockData(block_type=block_id, fields=fields)
+                for block_id, fields in block_fields.items()
+            },
+        }
+
+    def _insert(self, previous_structure=None, **block_fields):
+        """ Insert a new structure and return it along with the stored document """
+        structure = self._structure(previous_structure, **block_fields)
+        self.connection.insert_structure(structure)
+        return structure, self.connection.structures.docs[structure['_id']]
+
+    def _assert_materialized(self, structure):
+        """ Assert that the stored structure reads back the same as the one which was inserted """
+        stored_structure = self.connection.get_structure(structure['_id'])
+        assert {key: block.to_storable() for key, block in stored_structure['blocks'].items()} == {
+            key: block.to_storable() for key, block in structure['blocks'].items()
+        }
+
+    def test_deltas_and_snapshots(self):
+        problem = BlockKey('problem', 'problem')
+        first, first_doc = self._insert(
+            course={'children': [self.html]}, html={'display_name': 'Old'},
+        )
+        assert 'delta_base' not in first_doc
+
+        second, second_doc = self._insert(
+            first, course={'children': [problem]}, problem={'weight': 1},
+        )
+        assert second_doc['delta_base'] == first['_id']
+        assert second_doc['delta_depth'] == 1
+        assert {block['block_id'] for block in second_doc['blocks']} == {'course', 'problem'}
+        assert second_doc['deleted_blocks'] == [['html', 'html']]
+        self._assert_materialized(second)
+
+        third, third_doc = self._insert(second, course={'children': [problem]}, problem={'weight': 2})
+        assert third_doc['delta_base'] == second['_id']
+        assert [block['block_id'] for block in third_doc['blocks']] == ['problem']
+        self._assert_materialized(third)
+
+        # Every structure_snapshot_interval versions, the structure is stored in full again.
+        fourth, fourth_doc = self._insert(third, course={'children': [problem]}, problem={'weight': 3})
+        assert 'delta_base' not in fourth_doc
+        self._assert_materialized(fourth)
+        assert [doc['_id'] for doc in self.connection.find_structures_by_id([second['_id'], fourth['_id']])] == [
+            second['_id'], fourth['_id'],
+        ]
+
+    def test_missing_previous_version(self):
+        structure = self._structure(self._structure(), course={})
+        self.connection.insert_structure(structure)
+        assert 'delta_base' not in self.connection.structures.docs[structure['_id']]
@@ -0,0 +1,55 @@
+"""
+Tests for the secondary indexes over split modulestore structures.
+"""
+from unittest import TestCase
+
+from xmodule.modulestore import BlockData
+from xmodule.modulestore.split_mongo.structure_index import StructureIndex
+from xmodule.util.keys import BlockKey
+
+
+class TestStructureIndex(TestCase):
+    """
+    Tests for StructureIndex.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.course = BlockKey('course', 'course')
+        self.chapter = BlockKey('chapter', 'chapter')
+        self.problem = BlockKey('problem', 'shared')
+        self.html = BlockKey('html', 'shared')
+        self.orphan = BlockKey('problem', 'orphan')
+        blocks = {
+            self.course: {'children': [self.chapter]},
+            self.chapter: {'children': [self.problem, self.html], 'display_name': 'Week 1'},
+            self.problem: {'display_name': 'Question', 'tags': ['a', 'b', 'a']},
+            self.html: {'display_name': 'Week 1'},
+            self.orphan: {'display_name': 'Question', 'data': {'unhashable': []}},
+        }
+        self.index = StructureIndex({
+            'blocks': {
+                block_key: BlockData(block_type=block_key.type, fields=fields)
+                for block_key, fields in blocks.items()
+            },
+        })
+
+    def test_blocks_of_type(self):
+        assert self.index.blocks_of_type('problem') == [self.problem, self.orphan]
+        assert self.index.blocks_of_type('video') == []
+
+    def test_blocks_with_id(self):
+        assert self.index.blocks_with_id('shared') == [self.problem, self.html]
+
+    def test_parents(self):
+        assert self.index.parents[self.problem] == [self.chapter]
+        assert self.index.parents.get(self.course, []) == []
+        assert self.index.parents.get(self.orphan, []) == []
+
+    def test_blocks_with_field_value(self):
+        assert self.index.blocks_with_field_value('display_name', 'Week 1') == [self.chapter, self.html]
+        assert self.index.blocks_with_field_value('tags', 'a') == [self.problem]
+        assert self.index.blocks_with_field_value('display_name', 'Missing') == []
+
+    def test_unhashable_field_values(self):
+        assert self.index.blocks_with_field_value('data', 'anything') is None
@@ -8,6 +8,7 @@ XBlock implementation of a learning sequence
 import collections
 import json
 import logging
+from copy import copy
 from datetime import datetime
 from functools import reduce
 from django.conf import settings
@@ -761,6 +762,7 @@ class SequenceBlock(
         the given children.
         """
         # Avoid circular imports.
+        from openedx.core.lib.child_rendering import render_children
         from openedx.core.lib.xblock_utils import get_icon
 
         render_blocks = not context.get('exclude_units', False)
@@ -777,24 +779,32 @@ class SequenceBlock(
             self.get_parent().display_name_with_default,
             self.display_name_with_default
         ]
-        contents = []
+        block_contexts = []
         for block in children:
-            item_type = get_icon(block)
-            usage_id = block.scope_ids.usage_id
-
             show_bookmark_button = False
             is_bookmarked = False
 
             if is_user_authenticated and bookmarks_service:
                 show_bookmark_button = True
-                is_bookmarked = bookmarks_service.is_bookmarked(usage_key=usage_id)
+                is_bookmarked = bookmarks_service.is_bookmarked(usage_key=block.scope_ids.usage_id)
 
             context['show_bookmark_button'] = show_bookmark_button
             context['bookmarked'] = is_bookmarked
             context['format'] = getattr(self, 'format', '')
+            block_contexts.append(copy(context))
+
+        if render_blocks:
+            rendered_blocks = render_children(view, list(zip(children, block_contexts)), monitoring_prefix='seq')
+        else:
+            rendered_blocks = [None] * len(children)
+
+        contents = []
+        for block, block_context, rendered_block in zip(children, block_contexts, rendered_blocks):
+            item_type = get_icon(block)
+            usage_id = block.scope_ids.usage_id
+            is_bookmarked = block_context['bookmarked']
 
-            if render_blocks:
-                rendered_block = block.render(view, context)
+            if rendered_block is not None:
                 fragment.add_fragment_resources(rendered_block)
                 content = rendered_block.content
             else:
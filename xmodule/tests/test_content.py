@@ -139,6 +139,27 @@ class ContentTest(unittest.TestCase):  # lint-amnesty, pylint: disable=missing-c
         assert image_class_mock.open.called, 'Image.open not called'
         assert mock_image.close.called, 'mock_image.close not called'
 
+    @patch('xmodule.contentstore.content.Image')
+    def test_generate_thumbnails_decodes_once(self, image_class_mock):
+        mock_image = MockImage()
+        image_class_mock.open.return_value = mock_image
+
+        content_store = ContentStore()
+        content_store.save = Mock()
+        content = Content(AssetLocator(CourseLocator('mitX', '800', 'ignore_run'), 'asset', "monsters.jpg"),
+                          "image/jpeg")
+        content.data = b'mock data'
+        thumbnails = content_store.generate_thumbnails(content, dimensions_list=[(100, 50), None, (375, 200)])
+
+        image_class_mock.open.assert_called_once()
+        mock_image.draft.assert_called_once_with('RGB', (375, 200))
+        mock_image.convert.assert_called_once_with('RGB')
+        assert content_store.save.call_count == 3
+        assert [thumbnail_file_location.block_id for __, thumbnail_file_location in thumbnails] == [
+            'monsters-100x50.jpg', 'monsters.jpg', 'monsters-375x200.jpg',
+        ]
+        assert all(thumbnail_content is not None for thumbnail_content, __ in thumbnails)
+
     def test_store_svg_as_thumbnail(self):
         # We had a bug that caused generate_thumbnail to attempt to pass SVG to PIL to generate a thumbnail.
         # SVG files should be stored in original form for thumbnail purposes.
@@ -78,6 +78,8 @@ class VerticalBlock(
         """
         Renders the requested view type of the block in the LMS.
         """
+        from openedx.core.lib.child_rendering import render_children  # pylint: disable=import-outside-toplevel
+
         fragment = Fragment()
         contents = []
 
@@ -108,6 +110,8 @@ class VerticalBlock(
         child_context['child_of_vertical'] = True
         is_child_of_vertical = context.get('child_of_vertical', False)
 
+        # The children are prepared first, and then rendered with their times reported to monitoring.
+        children_to_render = []
         # pylint: disable=no-member
         for child in child_blocks:
             child_has_access_error = self.block_has_access_error(child)
@@ -128,7 +132,10 @@ class VerticalBlock(
                 log.info("Skipping %s from vertical block. Reason: %s", child, exc.message)
                 continue
 
-            rendered_child = child.render(view, child_block_context)
+            children_to_render.append((child, child_block_context))
+
+        rendered_children = render_children(view, children_to_render, monitoring_prefix='vertical')
+        for (child, __), rendered_child in zip(children_to_render, rendered_children):
             fragment.add_fragment_resources(rendered_child)
 
             contents.append({
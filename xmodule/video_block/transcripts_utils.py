@@ -5,6 +5,7 @@ Utility functions for transcripts.
 
 
 import copy
+import hashlib
 import html
 import logging
 import os
@@ -15,6 +16,7 @@ from functools import wraps
 import requests
 import simplejson as json
 from django.conf import settings
+from django.core.cache import cache
 from django.core.exceptions import ObjectDoesNotExist
 from django.utils.translation import get_language_info
 from lxml import etree
@@ -24,6 +26,7 @@ from pysrt.srtexc import Error
 from opaque_keys.edx.locator import LibraryLocatorV2
 
 from openedx.core.djangoapps.xblock.api import get_component_from_usage_key
+from openedx.core.lib.cache_utils import request_cached
 from xmodule.contentstore.content import StaticContent
 from xmodule.contentstore.django import contentstore
 from xmodule.exceptions import NotFoundError
@@ -40,6 +43,13 @@ log = logging.getLogger(__name__)
 
 NON_EXISTENT_TRANSCRIPT = 'non_existent_dummy_file_name'
 
+# Converted transcripts are cached under the hash of the transcript they were converted from, so they can't go stale.
+TRANSCRIPT_CONVERSION_CACHE_TIMEOUT = 60 * 60 * 24
+# Transcripts larger than this are converted every time, as they wouldn't fit in a cache entry.
+TRANSCRIPT_CONVERSION_CACHE_MAX_SIZE = 1024 * 1024
+
+TRANSCRIPT_LANGUAGES_NAMESPACE = 'video_block.transcript_languages'
+
 
 class TranscriptException(Exception):
     pass
@@ -77,6 +87,28 @@ def exception_decorator(func):
     return wrapper
 
 
+def cached_transcript_conversion(content, conversion, convert):
+    """
+    Return the conversion of the transcript `content`, from the cache if it was converted the same way before.
+
+    Arguments:
+        content (str or bytes): the transcript
+        conversion (str): the name of the conversion, e.g. "srt-sjson"
+        convert (callable): returns the conversion of `content`
+    """
+    content_bytes = content.encode('utf-8') if isinstance(content, str) else content
+    if len(content_bytes) > TRANSCRIPT_CONVERSION_CACHE_MAX_SIZE:
+        return convert()
+
+    cache_key = f'transcripts.conversion.{conversion}.{hashlib.sha256(content_bytes).hexdigest()}'
+    converted = cache.get(cache_key)
+    if converted is None:
+        converted = convert()
+        if len(converted) <= TRANSCRIPT_CONVERSION_CACHE_MAX_SIZE:
+            cache.set(cache_key, converted, TRANSCRIPT_CONVERSION_CACHE_TIMEOUT)
+    return converted
+
+
 def generate_subs(speed, source_speed, source_subs):
     """
     Generate transcripts from one speed to another speed.
@@ -649,6 +681,18 @@ def get_video_transcript_content(edx_video_id, language_code):
     return transcript
 
 
+def warm_video_transcript_conversions(edx_video_id, language_code):
+    """
+    Convert the edx-val transcript of a video into the formats learners download, so that the
+    conversions are cached before they are requested.
+    """
+    transcript = get_video_transcript_content(edx_video_id, language_code)
+    if not transcript:
+        return
+    for output_format in (Transcript.SRT, Transcript.TXT):
+        convert_video_transcript(transcript['file_name'], transcript['content'], output_format)
+
+
 def get_available_transcript_languages(edx_video_id):
     """
     Gets available transcript languages for a video.
@@ -667,6 +711,17 @@ def get_available_transcript_languages(edx_video_id):
     return available_languages
 
 
+@request_cached(namespace=TRANSCRIPT_LANGUAGES_NAMESPACE)
+def get_cached_available_transcript_languages(edx_video_id):
+    """
+    Gets available transcript languages for a video, once per request.
+
+    edx-val has no lookup of the transcript languages of several videos, so they are kept
+    for the request instead, for the views and handlers that need them more than once.
+    """
+    return get_available_transcript_languages(edx_video_id)
+
+
 def convert_video_transcript(file_name, content, output_format):
     """
     Convert video transcript into desired format
@@ -729,6 +784,17 @@ class Transcript:
         if input_format == output_format:
             return content
 
+        return cached_transcript_conversion(
+            content,
+            f'{input_format}-{output_format}',
+            lambda: Transcript._convert(content, input_format, output_format),
+        )
+
+    @staticmethod
+    def _convert(content, input_format, output_format):
+        """
+        Convert transcript `content` from `input_format` to another `output_format`, see `convert`.
+        """
         if input_format == 'srt':
             # Standardize content into bytes for later decoding.
             if isinstance(content, str):
@@ -926,7 +992,7 @@ class VideoTranscriptsMixin:
 
         # bumper transcripts are stored in content store so we don't need to include val transcripts
         if not is_bumper:
-            transcript_languages = get_available_transcript_languages(edx_video_id=self.edx_video_id)
+            transcript_languages = get_cached_available_transcript_languages(edx_video_id=self.edx_video_id)
             # HACK Warning! this is temporary and will be removed once edx-val take over the
             # transcript module and contentstore will only function as fallback until all the
             # data is migrated to edx-val.
@@ -1051,8 +1117,11 @@ def get_transcript_from_contentstore(video, language, output_format, transcripts
 
     if youtube_id:
         youtube_ids = youtube_speed_dict(video)
-        transcript_content = json.dumps(
-            generate_subs(youtube_ids.get(youtube_id, 1), 1, json.loads(transcript_content))
+        speed = youtube_ids.get(youtube_id, 1)
+        transcript_content = cached_transcript_conversion(
+            transcript_content,
+            f'sjson-speed-{speed}',
+            lambda: json.dumps(generate_subs(speed, 1, json.loads(transcript_content))),
         )
 
     return transcript_content, transcript_name, Transcript.mime_types[output_format]
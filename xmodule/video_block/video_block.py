@@ -317,7 +317,7 @@ class _BuiltInVideoBlock(
                     val_profiles.append('hls')
 
                 # strip edx_video_id to prevent ValVideoNotFoundError error if unwanted spaces are there. TNL-5769
-                val_video_urls = edxval_api.get_urls_for_profiles(self.edx_video_id.strip(), val_profiles)
+                val_video_urls, video_data = self._get_val_urls_and_info(self.edx_video_id.strip(), val_profiles)
 
                 # VAL will always give us the keys for the profiles we asked for, but
                 # if it doesn't have an encoded video entry for that Video + Profile, the
@@ -343,7 +343,6 @@ class _BuiltInVideoBlock(
                     youtube_streams = "1.00:{}".format(val_video_urls["youtube"])
 
                 # get video duration
-                video_data = edxval_api.get_video_info(self.edx_video_id.strip())
                 video_duration = video_data.get('duration')
                 video_status = video_data.get('status')
 
@@ -1184,6 +1183,34 @@ class _BuiltInVideoBlock(
         """
         return edxval_api.get_video_info_for_course_and_profiles(str(course_id), video_profile_names)
 
+    def _get_val_urls_and_info(self, edx_video_id, val_profiles):
+        """
+        Returns the urls of the `val_profiles` encodings of the video, and its VAL info.
+
+        The VAL data of all the videos of the course is fetched at once and kept for the
+        request, so that a unit or sequence with many videos doesn't query VAL for each of
+        them. Videos without encodings in the course data, such as videos shared across
+        courses or external videos, are looked up individually.
+        """
+        if self.request_cache is not None:
+            val_course_data = self.get_cached_val_data_for_course(
+                self.request_cache,
+                val_profiles,
+                self.location.course_key,
+            )
+            val_video_data = val_course_data.get(edx_video_id, {})
+            encoded_videos = val_video_data.get('profiles')
+            if encoded_videos:
+                val_video_urls = {
+                    profile: encoded_videos.get(profile, {}).get('url') for profile in val_profiles
+                }
+                return val_video_urls, val_video_data
+
+        return (
+            edxval_api.get_urls_for_profiles(edx_video_id, val_profiles),
+            edxval_api.get_video_info(edx_video_id),
+        )
+
     def student_view_data(self, context=None):
         """
         Returns a JSON representation of the student_view of this XModule.
@@ -11,6 +11,7 @@ import logging
 import math
 
 from django.core.files.base import ContentFile
+from django.db import transaction
 from django.utils.timezone import now
 from edxval.api import create_external_video, create_or_update_video_transcript, delete_video_transcript
 from opaque_keys.edx.locator import CourseLocator, LibraryLocatorV2
@@ -21,6 +22,7 @@ from xblock.exceptions import JsonHandlerError
 from xmodule.exceptions import NotFoundError
 from xmodule.fields import RelativeTime
 from openedx.core.djangoapps.content_libraries import api as lib_api
+from openedx.core.djangoapps.video_config.tasks import warm_transcript_conversions
 
 from .transcripts_utils import (
     Transcript,
@@ -583,6 +585,9 @@ class VideoStudioViewHandlers:
                         },
                         file_data=ContentFile(sjson_subs),
                     )
+                    transaction.on_commit(
+                        lambda: warm_transcript_conversions.delay(edx_video_id, new_language_code)
+                    )
 
                 # If a new transcript is added, then both new_language_code and
                 # language_code fields will have the same value.